@@ -0,0 +1,96 @@
+"""
+Compare serialization of stored entities through mappers and pydantic DTOs
+with the codec fast path.
+
+Run from the core directory:
+
+    python benchmarks/bench_serialization.py --records 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcriber_service.application.serialization import (
+    EntityMapperFactory,
+    FastSerializerAdapter,
+    SerializerAdapter,
+)
+from transcriber_service.domain import AudioRecord
+from transcriber_service.infrastructure.serializers.json_serializer import (
+    JsonSerializer,
+)
+from transcriber_service.infrastructure.serializers.msgpack_serializer import (
+    MsgpackSerializer,
+)
+from transcriber_service.infrastructure.serializers.record_format_serializer import (
+    RecordFormatSerializer,
+)
+
+
+def create_records(count: int, words: int) -> list[AudioRecord]:
+    records = []
+    for i in range(count):
+        record = AudioRecord(
+            f"record_{i}.mp3",
+            f"/audio/record_{i}.mp3",
+            "storage",
+            "word " * words,
+            "en",
+        )
+        record.add_tag("meeting")
+        record.add_tag(f"tag_{i % 10}")
+        records.append(record)
+
+    return records
+
+
+def measure(function, repeat: int) -> float:
+    """Return the best time of function calls in seconds."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def run(count: int, words: int, repeat: int) -> None:
+    records = create_records(count, words)
+    print(f"{count} audio records of {words} words, best of {repeat}")
+    print(f"{'format':<8} {'path':<8} {'write, ms':>10} {'load, ms':>10}")
+
+    for base in (JsonSerializer(), MsgpackSerializer(), RecordFormatSerializer()):
+        # record format restores text lazily, the mapper path decodes it to
+        # validate DTOs while the codec path leaves it for the first read
+        adapters = [
+            ("mapper", SerializerAdapter(base, EntityMapperFactory())),
+            ("codec", FastSerializerAdapter(base, EntityMapperFactory())),
+        ]
+
+        for name, adapter in adapters:
+            data = [adapter.serialize(record) for record in records]
+            write = measure(lambda: [adapter.serialize(r) for r in records], repeat)
+            load = measure(lambda: [adapter.deserialize(d) for d in data], repeat)
+            print(
+                f"{base.extension:<8} {name:<8} {write * 1000:>10.1f} {load * 1000:>10.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.records, args.words, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from transcriber_service.application.serialization import (
     AudioRecordMapper,
     AudioRecordDTO,
 )
+from transcriber_service.domain import AudioRecordSummary
 from transcriber_service.domain.factories import IAudioRecordFactory
 from transcriber_service.domain.interfaces import IAudioRecord
 
@@ -23,6 +24,7 @@ class TestAudioRecordMapper(unittest.TestCase):
         self.mock_audio.text = "test text"
         self.mock_audio.language = "en"
         self.mock_audio.tags = ["music", "podcast"]
+        self.mock_audio.status = "done"
         self.mock_audio.last_updated = datetime(
             2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc
         )
@@ -51,6 +53,18 @@ class TestAudioRecordMapper(unittest.TestCase):
         self.assertEqual(result.tags, self.mock_audio.tags)
         self.assertEqual(result.last_updated, "2023-01-01T12:00:00+00:00")
 
+    def test_to_summary_dto(self):
+        summary = AudioRecordSummary.from_record(self.mock_audio)
+
+        result = self.mapper.to_summary_dto(summary)
+
+        self.assertEqual(result.id, "audio123")
+        self.assertEqual(result.record_name, "test_recording")
+        self.assertEqual(result.tags, ["music", "podcast"])
+        self.assertEqual(result.status, "done")
+        self.assertEqual(result.last_updated, "2023-01-01T12:00:00+00:00")
+        self.assertFalse(hasattr(result, "text"))
+
     def test_from_dto_creates_audio_record(self):
         self.mock_factory.create_audio.return_value = self.mock_audio
 
@@ -0,0 +1,112 @@
+import unittest
+
+from pydantic import ValidationError
+
+from transcriber_service.application.serialization import (
+    EntityMapperFactory,
+    FastSerializerAdapter,
+    SerializerAdapter,
+)
+from transcriber_service.domain import Admin, AudioRecord, AuthUser, Storage
+from transcriber_service.infrastructure.serializers import (
+    JsonSerializer,
+    RecordFormatSerializer,
+)
+
+
+class TestFastSerializerAdapter(unittest.TestCase):
+    def setUp(self):
+        self.serializer = FastSerializerAdapter(JsonSerializer(), EntityMapperFactory())
+        self.reference = SerializerAdapter(JsonSerializer(), EntityMapperFactory())
+
+        self.audio = AudioRecord("name", "/path/name.mp3", "storage_1", "text", "en")
+        self.audio.add_tag("First")
+        self.audio.add_tag("second")
+        self.user = AuthUser("user@example.com", "hash")
+        self.user.temp_password_hash = "temp"
+        self.admin = Admin("admin@example.com", "hash")
+        self.storage = Storage(self.user.id)
+        self.storage.add_audio_record(self.audio.id)
+        for entity in (self.audio, self.user, self.admin, self.storage):
+            entity.mark_clean()
+
+    def test_output_equals_mapper_output(self):
+        for entity in (self.audio, self.user, self.admin, self.storage):
+            self.assertEqual(
+                self.reference.deserialize(self.serializer.serialize(entity)).__dict__,
+                entity.__dict__,
+            )
+            self.assertEqual(
+                self.serializer._to_dto(entity), self.reference._to_dto(entity)
+            )
+
+    def test_round_trip(self):
+        audio = self.serializer.deserialize(self.serializer.serialize(self.audio))
+        admin = self.serializer.deserialize(self.serializer.serialize(self.admin))
+
+        self.assertIsInstance(audio, AudioRecord)
+        self.assertEqual(audio.__dict__, self.audio.__dict__)
+        self.assertIs(type(admin), Admin)
+        self.assertEqual(admin.__dict__, self.admin.__dict__)
+
+    def test_reads_data_of_mapper_path(self):
+        data = self.reference.serialize([self.user, self.storage])
+
+        user, storage = self.serializer.deserialize(data)
+
+        self.assertEqual(user.__dict__, self.user.__dict__)
+        self.assertEqual(storage.audio_record_ids, [self.audio.id])
+
+    def test_nested_containers(self):
+        data = self.serializer.serialize({"records": [self.audio], "count": 1})
+
+        result = self.serializer.deserialize(data)
+
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["records"][0].id, self.audio.id)
+
+    def test_record_format_loads_text_on_access(self):
+        serializer = FastSerializerAdapter(
+            RecordFormatSerializer(), EntityMapperFactory()
+        )
+
+        audio = serializer.deserialize(serializer.serialize(self.audio))
+
+        self.assertTrue(callable(audio._text))
+        self.assertEqual(audio.tags, ["first", "second"])
+        self.assertEqual(audio.text, "text")
+        self.assertEqual(audio.__dict__, self.audio.__dict__)
+
+    def test_record_format_round_trip_with_validation(self):
+        for serializer in (
+            SerializerAdapter(RecordFormatSerializer(), EntityMapperFactory()),
+            FastSerializerAdapter(
+                RecordFormatSerializer(), EntityMapperFactory(), validate=True
+            ),
+        ):
+            audio = serializer.deserialize(serializer.serialize(self.audio))
+
+            self.assertIsInstance(audio, AudioRecord)
+            self.assertEqual(audio.text, "text")
+            self.assertEqual(audio.__dict__, self.audio.__dict__)
+
+    def test_validate_rejects_invalid_data(self):
+        serializer = FastSerializerAdapter(
+            JsonSerializer(), EntityMapperFactory(), validate=True
+        )
+        data = serializer._to_dto(self.audio)
+        data["status"] = "unknown"
+
+        with self.assertRaises(ValidationError):
+            serializer._from_dto(data)
+
+    def test_without_validation_missing_field_raises_error(self):
+        data = self.serializer._to_dto(self.user)
+        del data["email"]
+
+        with self.assertRaises(KeyError):
+            self.serializer._from_dto(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
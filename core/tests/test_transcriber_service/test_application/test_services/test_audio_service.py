@@ -1,22 +1,32 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 from transcriber_service.domain.interfaces import (
     IAudioRepository,
     IAudioRecord,
+    IFullTextIndex,
     ITranscriber,
+    ITranscriptionQueue,
     ITextExporter,
     IStopwordsRemover,
 )
+from transcriber_service.domain import (
+    AudioRecordSummary,
+    TranscriptionJob,
+    TranscriptionStatus,
+)
 from transcriber_service.domain.factories import AudioRecordFactory
 from transcriber_service.application.serialization.audio_mapper import (
     AudioRecordDTO,
     AudioRecordMapper,
+    AudioRecordSummaryDTO,
 )
-from transcriber_service.domain.services.audio_search_service import AudioSearchService
 from transcriber_service.application.services.audio_service import (
     AudioRecordService,
     AudioTagService,
     AudioTextService,
+    TextIndexService,
 )
 
 
@@ -25,12 +35,10 @@ class TestAudioRecordService(unittest.TestCase):
         self.repo = MagicMock(spec=IAudioRepository)
         self.transcriber = MagicMock(spec=ITranscriber)
         self.audio_factory = MagicMock(spec=AudioRecordFactory)
-        self.search_service = MagicMock(spec=AudioSearchService)
         self.mapper = MagicMock(spec=AudioRecordMapper)
 
         self.service = AudioRecordService(self.repo, self.transcriber)
         self.service._audio_factory = self.audio_factory
-        self.service._search_service = self.search_service
         self.service.mapper = self.mapper
 
     def test_create_audio_valid(self):
@@ -68,13 +76,96 @@ class TestAudioRecordService(unittest.TestCase):
         self.assertEqual(str(cm.exception), "Audio file too large.")
         self.transcriber.transcribe.assert_not_called()
 
+    def test_create_audio_with_queue_enqueues_job(self):
+        queue = MagicMock(spec=ITranscriptionQueue)
+        self.service._transcription_queue = queue
+        audio_record = MagicMock(spec=IAudioRecord)
+        audio_record.id = "record_1"
+        self.audio_factory.create_audio.return_value = audio_record
+
+        result = self.service.create_audio(
+            file_name="test.mp3",
+            content=b"audio_data",
+            file_path="/path/test.mp3",
+            storage_id="storage_1",
+            language="en",
+            max_speakers=2,
+            main_theme="meeting",
+        )
+
+        self.transcriber.transcribe.assert_not_called()
+        self.audio_factory.create_audio.assert_called_once_with(
+            "test.mp3", "/path/test.mp3", "storage_1", "", "en"
+        )
+        self.assertEqual(audio_record.status, TranscriptionStatus.PENDING)
+        self.repo.add.assert_called_once_with(audio_record)
+        job = queue.enqueue.call_args[0][0]
+        self.assertIsInstance(job, TranscriptionJob)
+        self.assertEqual(job.record_id, "record_1")
+        self.assertEqual(job.file_path, "/path/test.mp3")
+        self.assertEqual(job.max_speakers, 2)
+        self.assertEqual(job.main_theme, "meeting")
+        self.mapper.to_dto.assert_called_once_with(audio_record)
+        self.assertEqual(result, self.mapper.to_dto.return_value)
+
+    def test_create_audio_from_file_valid(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.mp3")
+            with open(file_path, "wb") as f:
+                f.write(b"audio_data")
+            self.transcriber.transcribe_file.return_value = ("transcribed_text", "en")
+            audio_record = MagicMock(spec=IAudioRecord)
+            self.audio_factory.create_audio.return_value = audio_record
+
+            self.service.create_audio_from_file(
+                "test.mp3", file_path, "storage_1", "en", 2, "meeting"
+            )
+
+        self.transcriber.transcribe_file.assert_called_once_with(
+            file_path, "en", 2, "meeting"
+        )
+        self.transcriber.transcribe.assert_not_called()
+        self.audio_factory.create_audio.assert_called_once_with(
+            "test.mp3", file_path, "storage_1", "transcribed_text", "en"
+        )
+        self.repo.add.assert_called_once_with(audio_record)
+
+    def test_create_audio_from_file_too_large(self):
+        service = AudioRecordService(self.repo, self.transcriber, max_size=4)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.mp3")
+            with open(file_path, "wb") as f:
+                f.write(b"audio_data")
+
+            with self.assertRaises(Exception) as cm:
+                service.create_audio_from_file("test.mp3", file_path, "storage_1")
+
+        self.assertEqual(str(cm.exception), "Audio file too large.")
+        self.transcriber.transcribe_file.assert_not_called()
+        self.repo.add.assert_not_called()
+
+    def test_get_status(self):
+        record = MagicMock(spec=IAudioRecord)
+        record.status = TranscriptionStatus.RUNNING
+        self.repo.get_by_id.return_value = record
+
+        self.assertEqual(
+            self.service.get_status("record_1"), TranscriptionStatus.RUNNING
+        )
+
+    def test_get_status_not_found(self):
+        self.repo.get_by_id.return_value = None
+
+        with self.assertRaises(ValueError):
+            self.service.get_status("record_1")
+
     def test_get_records_found(self):
         records = [MagicMock(spec=IAudioRecord), MagicMock(spec=IAudioRecord)]
         self.repo.get_by_storage.return_value = records
 
         result = self.service.get_records("storage_1")
 
-        self.repo.get_by_storage.assert_called_once_with("storage_1")
+        self.repo.get_by_storage.assert_called_once_with("storage_1", 0, None)
         self.assertEqual(result, records)
 
     def test_get_records_not_found(self):
@@ -82,7 +173,7 @@ class TestAudioRecordService(unittest.TestCase):
 
         result = self.service.get_records("storage_1")
 
-        self.repo.get_by_storage.assert_called_once_with("storage_1")
+        self.repo.get_by_storage.assert_called_once_with("storage_1", 0, None)
         self.assertIsNone(result)
 
     def test_get_by_id_found(self):
@@ -102,40 +193,121 @@ class TestAudioRecordService(unittest.TestCase):
         self.repo.get_by_id.assert_called_once_with("record_1")
         self.assertIsNone(result)
 
+    def test_get_records_page(self):
+        records = tuple(
+            AudioRecordFactory().create_audio(f"{i}.mp3", "/path", "storage_1", "", "")
+            for i in range(3)
+        )
+        self.repo.get_page_by_storage.return_value = records
+        self.mapper.to_dto.side_effect = lambda record: record.id
+
+        result, cursor = self.service.get_records_page("storage_1", 2)
+        self.service.get_records_page("storage_1", 2, cursor)
+
+        self.assertEqual(result, (records[0].id, records[1].id))
+        self.repo.get_page_by_storage.assert_called_with(
+            "storage_1", 3, (records[1].last_updated, records[1].id)
+        )
+
+    def test_get_summaries_page(self):
+        summaries = (MagicMock(spec=AudioRecordSummary),)
+        self.repo.get_summaries_by_storage.return_value = summaries
+        self.mapper.to_summary_dto.return_value = "summary"
+
+        result, cursor = self.service.get_summaries_page("storage_1", 2)
+
+        self.repo.get_summaries_by_storage.assert_called_once_with("storage_1", 3, None)
+        self.repo.get_page_by_storage.assert_not_called()
+        self.mapper.to_summary_dto.assert_called_once_with(summaries[0])
+        self.assertEqual(result, ("summary",))
+        self.assertIsNone(cursor)
+
+    def test_get_records_page_last_page(self):
+        self.repo.get_page_by_storage.return_value = (MagicMock(spec=IAudioRecord),)
+
+        _, cursor = self.service.get_records_page("storage_1", 2)
+
+        self.assertIsNone(cursor)
+
+    def test_get_records_page_invalid_cursor_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.service.get_records_page("storage_1", 2, "invalid")
+        with self.assertRaises(ValueError):
+            self.service.get_records_page("storage_1", 0)
+
     def test_search_by_tags(self):
-        records = [MagicMock(spec=IAudioRecord), MagicMock(spec=IAudioRecord)]
-        matching_records = [records[0]]
-        self.repo.get_by_storage.return_value = records
-        self.search_service.search_by_tags.return_value = matching_records
-        dto = MagicMock(spec=AudioRecordDTO)
-        self.mapper.to_dto.return_value = dto
+        records = (MagicMock(spec=IAudioRecord),)
+        self.repo.search_by_tags.return_value = records
+        dto = MagicMock(spec=AudioRecordSummaryDTO)
+        self.mapper.to_summary_dto.return_value = dto
 
         result = self.service.search_by_tags(
             "storage_1", ["tag1", "tag2"], match_all=True
         )
 
-        self.repo.get_by_storage.assert_called_once_with("storage_1")
-        self.search_service.search_by_tags.assert_called_once_with(
-            records, ["tag1", "tag2"], True
+        self.repo.search_by_tags.assert_called_once_with(
+            "storage_1", ["tag1", "tag2"], True, 0, None
         )
-        self.mapper.to_dto.assert_called_once_with(matching_records[0])
+        self.repo.get_by_storage.assert_not_called()
+        self.mapper.to_dto.assert_not_called()
+        summary = self.mapper.to_summary_dto.call_args.args[0]
+        self.assertEqual(summary.id, records[0].id)
         self.assertEqual(result, [dto])
 
     def test_search_by_name(self):
-        records = [MagicMock(spec=IAudioRecord), MagicMock(spec=IAudioRecord)]
-        matching_records = [records[1]]
-        self.repo.get_by_storage.return_value = records
-        self.search_service.search_by_name.return_value = matching_records
-        dto = MagicMock(spec=AudioRecordDTO)
-        self.mapper.to_dto.return_value = dto
+        records = (MagicMock(spec=IAudioRecord),)
+        self.repo.search_by_name.return_value = records
+        dto = MagicMock(spec=AudioRecordSummaryDTO)
+        self.mapper.to_summary_dto.return_value = dto
 
-        result = self.service.search_by_name("storage_1", "test.mp3")
+        result = self.service.search_by_name("storage_1", "test", prefix=True, limit=10)
 
-        self.repo.get_by_storage.assert_called_once_with("storage_1")
-        self.search_service.search_by_name.assert_called_once_with(records, "test.mp3")
-        self.mapper.to_dto.assert_called_once_with(matching_records[0])
+        self.repo.search_by_name.assert_called_once_with(
+            "storage_1", "test", True, 0, 10
+        )
+        self.repo.get_by_storage.assert_not_called()
+        self.mapper.to_dto.assert_not_called()
         self.assertEqual(result, [dto])
 
+    def test_search_by_text(self):
+        text_index = MagicMock(spec=IFullTextIndex)
+        text_index.search.return_value = ["record_3", "record_2", "missing"]
+        self.service._text_index = text_index
+        summaries = (MagicMock(id="record_2"),)
+        self.repo.get_summaries.return_value = summaries
+        self.mapper.to_summary_dto.side_effect = lambda summary: summary.id
+
+        with self.assertLogs(
+            "transcriber_service.application.services.audio_service", "WARNING"
+        ):
+            result = self.service.search_by_text(
+                "storage_1", '"hello world"', offset=1, limit=2
+            )
+
+        text_index.search.assert_called_once_with("storage_1", '"hello world"', 3)
+        self.repo.get_summaries.assert_called_once_with(["record_2", "missing"])
+        self.repo.get_by_id.assert_not_called()
+        self.assertEqual(result, ["record_2"])
+
+    def test_search_by_text_negative_offset_raises_error(self):
+        self.service._text_index = MagicMock(spec=IFullTextIndex)
+
+        with self.assertRaises(ValueError):
+            self.service.search_by_text("storage_1", "hello", offset=-1)
+
+    def test_search_by_text_without_index_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.service.search_by_text("storage_1", "hello")
+
+    def test_delete_removes_from_text_index(self):
+        text_index = MagicMock(spec=IFullTextIndex)
+        self.service._text_index = text_index
+
+        self.service.delete("record_1")
+
+        self.repo.delete.assert_called_once_with("record_1")
+        text_index.remove.assert_called_once_with("record_1")
+
 
 class TestAudioTagService(unittest.TestCase):
     def setUp(self):
@@ -282,6 +454,25 @@ class TestAudioTextService(unittest.TestCase):
         self.assertEqual(record.text, "cleaned text")
         self.repo.update.assert_called_once_with(record)
 
+    def test_remove_words_reindexes_text(self):
+        text_index = MagicMock(spec=IFullTextIndex)
+        service = AudioTextService(
+            self.repo, self.export_service, self.stopwords_remover, text_index
+        )
+        record = MagicMock(spec=IAudioRecord)
+        record.id = "record_1"
+        record.storage_id = "storage_1"
+        record.language = "ru"
+        record.text = "original text"
+        self.repo.get_by_id.return_value = record
+        self.stopwords_remover.remove_words.return_value = "cleaned text"
+
+        service.remove_words("record_1", ["original"])
+
+        text_index.index.assert_called_once_with(
+            "record_1", "storage_1", "cleaned text"
+        )
+
     def test_remove_words_unsupported_language(self):
         record = MagicMock(spec=IAudioRecord)
         record.language = "en"
@@ -325,5 +516,39 @@ class TestAudioTextService(unittest.TestCase):
         self.repo.update.assert_not_called()
 
 
+class TestTextIndexService(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock(spec=IAudioRepository)
+        self.text_index = MagicMock(spec=IFullTextIndex)
+        self.documents = []
+        self.text_index.rebuild.side_effect = self.documents.extend
+        self.service = TextIndexService(self.repo, self.text_index)
+
+    def test_rebuild_indexes_records_of_storages(self):
+        records = [
+            MagicMock(spec=IAudioRecord, id=f"record_{i}", storage_id="storage_1")
+            for i in range(3)
+        ]
+        for i, record in enumerate(records):
+            record.text = "" if i == 1 else f"text {i}"
+        pages = {0: records[:2], 2: records[2:]}
+        self.repo.get_by_storage.side_effect = lambda storage_id, offset, limit: (
+            tuple(pages.get(offset, ())) if storage_id == "storage_1" else ()
+        )
+
+        self.service.rebuild(["storage_1", "storage_2"], page_size=2)
+
+        self.assertEqual(
+            self.documents,
+            [("record_0", "storage_1", "text 0"), ("record_2", "storage_1", "text 2")],
+        )
+        self.repo.get_by_storage.assert_any_call("storage_1", 2, 2)
+        self.repo.get_by_storage.assert_any_call("storage_2", 0, 2)
+
+    def test_rebuild_invalid_page_size_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.service.rebuild(["storage_1"], page_size=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.application.services.transcription_service import (
+    TranscriptionJobService,
+)
+from transcriber_service.domain import (
+    AudioRecord,
+    TranscriptionJob,
+    TranscriptionStatus,
+)
+from transcriber_service.domain.interfaces import (
+    IAudioRepository,
+    IFullTextIndex,
+    ITranscriber,
+)
+
+
+class TestTranscriptionJobService(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock(spec=IAudioRepository)
+        self.transcriber = MagicMock(spec=ITranscriber)
+        self.text_index = MagicMock(spec=IFullTextIndex)
+        self.service = TranscriptionJobService(
+            self.repo, self.transcriber, self.text_index
+        )
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "test.mp3")
+        with open(self.file_path, "wb") as f:
+            f.write(b"audio_data")
+
+        self.record = AudioRecord("test.mp3", self.file_path, "storage_1", "", "")
+        self.record.status = TranscriptionStatus.PENDING
+        self.repo.get_by_id.return_value = self.record
+        self.job = TranscriptionJob(self.record.id, self.file_path, "en", 2, "meeting")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_process_saves_transcription(self):
+        self.transcriber.transcribe_file.return_value = ("transcribed_text", "en")
+
+        self.service.process(self.job)
+
+        self.transcriber.transcribe_file.assert_called_once_with(
+            self.file_path, "en", 2, "meeting"
+        )
+        self.assertEqual(self.record.text, "transcribed_text")
+        self.assertEqual(self.record.language, "en")
+        self.assertEqual(self.record.status, TranscriptionStatus.DONE)
+        self.assertEqual(self.repo.update.call_count, 2)
+        self.text_index.index.assert_called_once_with(
+            self.record.id, "storage_1", "transcribed_text"
+        )
+
+    def test_process_marks_record_failed(self):
+        self.transcriber.transcribe_file.side_effect = RuntimeError("model error")
+
+        with self.assertRaises(RuntimeError):
+            self.service.process(self.job)
+
+        self.assertEqual(self.record.status, TranscriptionStatus.FAILED)
+        self.repo.update.assert_called_with(self.record)
+        self.text_index.index.assert_not_called()
+
+    def test_process_record_not_found(self):
+        self.repo.get_by_id.return_value = None
+
+        with self.assertRaises(ValueError) as cm:
+            self.service.process(self.job)
+
+        self.assertEqual(str(cm.exception), "Audio record not found")
+        self.transcriber.transcribe_file.assert_not_called()
+
+    def test_fail_marks_record_failed(self):
+        self.service.fail(self.job)
+
+        self.assertEqual(self.record.status, TranscriptionStatus.FAILED)
+        self.repo.update.assert_called_once_with(self.record)
+
+    def test_fail_record_not_found(self):
+        self.repo.get_by_id.return_value = None
+
+        with self.assertLogs(
+            "transcriber_service.application.services.transcription_service",
+            "WARNING",
+        ) as cm:
+            self.service.fail(self.job)
+
+        self.assertIn(self.job.id, cm.output[0])
+        self.repo.update.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.application.services.unit_of_work import UnitOfWork
+from transcriber_service.domain.interfaces import IBatchingRepository
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.first = MagicMock(spec=IBatchingRepository)
+        self.second = MagicMock(spec=IBatchingRepository)
+        self.unit_of_work = UnitOfWork(self.first, self.second)
+
+    def test_batches_repositories(self):
+        with self.unit_of_work:
+            self.first.begin_batch.assert_called_once()
+            self.second.begin_batch.assert_called_once()
+            self.first.end_batch.assert_not_called()
+
+        self.first.end_batch.assert_called_once()
+        self.second.end_batch.assert_called_once()
+
+    def test_ends_batches_on_error(self):
+        with self.assertRaises(KeyError):
+            with self.unit_of_work:
+                raise KeyError
+
+        self.first.end_batch.assert_called_once()
+        self.second.end_batch.assert_called_once()
+
+    def test_flush_error_does_not_skip_other_repositories(self):
+        self.first.end_batch.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            with self.unit_of_work:
+                pass
+
+        self.second.end_batch.assert_called_once()
+
+    def test_begin_error_ends_started_batches(self):
+        self.second.begin_batch.side_effect = RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work:
+                pass
+
+        self.first.end_batch.assert_called_once()
+        self.second.end_batch.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
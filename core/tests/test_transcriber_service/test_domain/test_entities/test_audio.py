@@ -1,6 +1,6 @@
 import unittest
 
-from transcriber_service.domain import AudioRecord
+from transcriber_service.domain import AudioRecord, TranscriptionStatus
 
 
 class TestAudioRecord(unittest.TestCase):
@@ -79,6 +79,40 @@ class TestAudioRecord(unittest.TestCase):
     def test_storage_id_return_correct(self):
         self.assertEqual(self.record.storage_id, self.storage_id)
 
+    def test_status_defaults_done(self):
+        self.assertEqual(self.record.status, TranscriptionStatus.DONE)
+
+    def test_status_sets_from_string(self):
+        self.record.status = "pending"
+        self.assertEqual(self.record.status, TranscriptionStatus.PENDING)
+
+    def test_status_set_invalid_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.record.status = "unknown"
+
+    def test_language_sets_correctly(self):
+        self.record.language = "en"
+        self.assertEqual(self.record.language, "en")
+
+    def test_new_record_has_all_fields_changed(self):
+        self.assertEqual(self.record.dirty_fields, set(AudioRecord.tracked_fields))
+
+    def test_changed_fields_are_tracked_until_marked_clean(self):
+        self.record.mark_clean()
+        self.record.add_tag("jazz", False)
+        self.record.status = TranscriptionStatus.FAILED
+
+        self.assertEqual(self.record.dirty_fields, {"tags", "status", "last_updated"})
+        self.record.mark_clean()
+        self.assertEqual(self.record.dirty_fields, set())
+
+    def test_restored_text_is_not_a_change(self):
+        self.record.mark_clean()
+        self.record.restore_text(lambda: "Loaded text.")
+
+        self.assertEqual(self.record.text, "Loaded text.")
+        self.assertEqual(self.record.dirty_fields, set())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,6 +30,12 @@ class TestUser(unittest.TestCase):
     def test_last_updated_returns_datetime(self):
         self.assertEqual(type(self.user.last_updated), datetime)
 
+    def test_changed_fields_are_tracked(self):
+        self.user.mark_clean()
+        self.user.is_blocked = True
+
+        self.assertEqual(self.user.dirty_fields, {"is_blocked", "last_updated"})
+
 
 if __name__ == "__main__":
     unittest.main()
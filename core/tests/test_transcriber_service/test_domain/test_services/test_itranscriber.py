@@ -0,0 +1,49 @@
+import mmap
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from transcriber_service.domain.interfaces import ITranscriber
+
+
+class RecordingTranscriber(ITranscriber):
+    def __init__(self):
+        self.contents = []
+
+    def transcribe(self, content, language, max_speakers, main_theme):
+        self.contents.append(content)
+        return BytesIO(content).getvalue().decode(), language
+
+
+class TestITranscriber(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "test.wav")
+        self.transcriber = RecordingTranscriber()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_transcribe_file_passes_mapping(self):
+        with open(self.file_path, "wb") as f:
+            f.write(b"audio")
+
+        result = self.transcriber.transcribe_file(self.file_path, "en", None, None)
+
+        self.assertEqual(result, ("audio", "en"))
+        content = self.transcriber.contents[0]
+        self.assertIsInstance(content, mmap.mmap)
+        self.assertTrue(content.closed)
+
+    def test_transcribe_file_empty_passes_bytes(self):
+        open(self.file_path, "wb").close()
+
+        result = self.transcriber.transcribe_file(self.file_path, None, None, None)
+
+        self.assertEqual(result, ("", None))
+        self.assertEqual(self.transcriber.contents, [b""])
+
+
+if __name__ == "__main__":
+    unittest.main()
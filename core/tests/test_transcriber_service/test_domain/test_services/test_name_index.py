@@ -0,0 +1,62 @@
+import unittest
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.services.name_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex()
+        self.rock = self.__record("storage_1", "Rock Concert.mp3")
+        self.jazz = self.__record("storage_1", "Jazz Night.mp3")
+        self.rock_live = self.__record("storage_1", "rock live.mp3")
+        self.other = self.__record("storage_2", "Rock.mp3")
+        for record in (self.rock, self.jazz, self.rock_live, self.other):
+            self.index.add(record)
+
+    @staticmethod
+    def __record(storage_id: str, name: str) -> AudioRecord:
+        return AudioRecord(name, "/path/" + name, storage_id, "", "")
+
+    def test_ids_in_indexing_order(self):
+        self.assertEqual(
+            self.index.ids("storage_1"),
+            [self.rock.id, self.jazz.id, self.rock_live.id],
+        )
+        self.assertEqual(self.index.ids("missing"), [])
+
+    def test_search_prefix(self):
+        result = self.index.search("storage_1", "ROCK", prefix=True)
+
+        self.assertEqual(result, [self.rock.id, self.rock_live.id])
+
+    def test_search_substring(self):
+        self.assertEqual(self.index.search("storage_1", "night"), [self.jazz.id])
+        self.assertEqual(self.index.search("storage_1", "night", prefix=True), [])
+
+    def test_search_scoped_by_storage(self):
+        self.assertEqual(self.index.search("storage_2", "rock"), [self.other.id])
+        self.assertEqual(self.index.search("missing", "rock"), [])
+
+    def test_add_reindexes_renamed_record(self):
+        self.rock.record_name = "Blues.mp3"
+
+        self.index.add(self.rock)
+
+        self.assertEqual(
+            self.index.search("storage_1", "rock", prefix=True), [self.rock_live.id]
+        )
+        self.assertEqual(self.index.search("storage_1", "blues"), [self.rock.id])
+        self.assertEqual(self.index.ids("storage_1")[0], self.rock.id)
+        self.assertEqual(len(self.index), 4)
+
+    def test_remove(self):
+        self.index.remove(self.rock.id)
+        self.index.remove("missing")
+
+        self.assertNotIn(self.rock.id, self.index)
+        self.assertEqual(self.index.search("storage_1", "rock"), [self.rock_live.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.services.recency_index import RecencyIndex
+
+
+class TestRecencyIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = RecencyIndex()
+        self.records = [self.__record("storage_1", minute) for minute in range(5)]
+        self.other = self.__record("storage_2", 10)
+        for record in self.records + [self.other]:
+            self.index.add(record)
+
+    @staticmethod
+    def __record(storage_id: str, minute: int) -> AudioRecord:
+        record = AudioRecord("test.mp3", "/path/test.mp3", storage_id, "", "")
+        record.last_updated = datetime(2024, 1, 1, 12, minute)
+        return record
+
+    @staticmethod
+    def __key(record: AudioRecord) -> tuple[datetime, str]:
+        return record.last_updated, record.id
+
+    def test_page_most_recent_first(self):
+        result = self.index.page("storage_1", 2)
+
+        self.assertEqual(result, [self.records[4].id, self.records[3].id])
+
+    def test_page_after_key(self):
+        result = self.index.page("storage_1", 10, self.__key(self.records[3]))
+
+        self.assertEqual(result, [r.id for r in reversed(self.records[:3])])
+        self.assertEqual(self.index.page("storage_1", 2, (datetime.min, "")), [])
+
+    def test_page_scoped_by_storage(self):
+        self.assertEqual(self.index.page("storage_2", 10), [self.other.id])
+        self.assertEqual(self.index.page("missing", 10), [])
+
+    def test_add_reindexes_updated_record(self):
+        self.records[0].last_updated = datetime(2024, 1, 1, 13)
+
+        self.index.add(self.records[0])
+
+        self.assertEqual(self.index.page("storage_1", 1), [self.records[0].id])
+        self.assertEqual(len(self.index), 6)
+
+    def test_remove(self):
+        self.index.remove(self.records[4].id)
+        self.index.remove("missing")
+
+        self.assertNotIn(self.records[4].id, self.index)
+        self.assertEqual(self.index.page("storage_1", 1), [self.records[3].id])
+
+
+if __name__ == "__main__":
+    unittest.main()
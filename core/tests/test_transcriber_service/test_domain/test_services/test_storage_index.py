@@ -0,0 +1,55 @@
+import unittest
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.services.storage_index import StorageIndex
+
+
+class TestStorageIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = StorageIndex()
+        self.first = self.__record("storage_1", "first.mp3")
+        self.second = self.__record("storage_1", "second.mp3")
+        self.third = self.__record("storage_1", "third.mp3")
+        self.other = self.__record("storage_2", "other.mp3")
+        for record in (self.first, self.second, self.third, self.other):
+            self.index.add(record)
+
+    @staticmethod
+    def __record(storage_id: str, name: str) -> AudioRecord:
+        return AudioRecord(name, "/path/" + name, storage_id, "", "")
+
+    def test_ids_in_adding_order(self):
+        self.assertEqual(
+            self.index.ids("storage_1"),
+            [self.first.id, self.second.id, self.third.id],
+        )
+        self.assertEqual(self.index.ids("storage_2"), [self.other.id])
+        self.assertEqual(self.index.ids("missing"), [])
+        self.assertEqual(self.index.count("storage_1"), 3)
+
+    def test_ids_page(self):
+        self.assertEqual(self.index.ids("storage_1", 1, 1), [self.second.id])
+        self.assertEqual(self.index.ids("storage_1", 2), [self.third.id])
+        self.assertEqual(self.index.ids("storage_1", 5, 1), [])
+
+        with self.assertRaises(ValueError):
+            self.index.ids("storage_1", -1)
+
+    def test_readding_keeps_order(self):
+        self.index.add(self.first)
+
+        self.assertEqual(self.index.ids("storage_1")[0], self.first.id)
+
+    def test_remove(self):
+        self.index.remove(self.second.id)
+        self.index.remove(self.other.id)
+        self.index.remove("missing")
+
+        self.assertEqual(self.index.ids("storage_1"), [self.first.id, self.third.id])
+        self.assertEqual(self.index.count("storage_2"), 0)
+        self.assertNotIn(self.other.id, self.index)
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
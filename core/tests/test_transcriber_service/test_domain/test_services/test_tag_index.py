@@ -0,0 +1,70 @@
+import unittest
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.services.tag_index import TagIndex
+
+
+class TestTagIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TagIndex()
+        self.jazz = self.__record("storage_1", "jazz", "live")
+        self.rock = self.__record("storage_1", "rock", "live")
+        self.podcast = self.__record("storage_1", "podcast")
+        self.other = self.__record("storage_2", "jazz")
+        for record in (self.jazz, self.rock, self.podcast, self.other):
+            self.index.add(record)
+
+    @staticmethod
+    def __record(storage_id: str, *tags: str) -> AudioRecord:
+        record = AudioRecord("test.mp3", "/path/test.mp3", storage_id, "", "")
+        for tag in tags:
+            record.add_tag(tag)
+        return record
+
+    def test_search_any_match(self):
+        result = self.index.search("storage_1", ["jazz", "rock"])
+
+        self.assertEqual(result, [self.jazz.id, self.rock.id])
+
+    def test_search_all_match(self):
+        result = self.index.search("storage_1", ["live", "ROCK"], match_all=True)
+
+        self.assertEqual(result, [self.rock.id])
+
+    def test_search_scoped_by_storage(self):
+        self.assertEqual(self.index.search("storage_2", ["jazz"]), [self.other.id])
+        self.assertEqual(self.index.search("missing", ["jazz"]), [])
+
+    def test_search_empty_tags(self):
+        self.assertEqual(self.index.search("storage_1", [], match_all=True), [])
+
+    def test_add_reindexes_changed_tags(self):
+        self.jazz.remove_tag("live")
+        self.jazz.add_tag("blues")
+
+        self.index.add(self.jazz)
+
+        self.assertEqual(self.index.search("storage_1", ["live"]), [self.rock.id])
+        self.assertEqual(self.index.search("storage_1", ["blues"]), [self.jazz.id])
+        self.assertEqual(len(self.index), 4)
+
+    def test_reindex_keeps_original_order(self):
+        self.jazz.add_tag("podcast")
+
+        self.index.add(self.jazz)
+
+        self.assertEqual(
+            self.index.search("storage_1", ["podcast"]),
+            [self.jazz.id, self.podcast.id],
+        )
+
+    def test_remove(self):
+        self.index.remove(self.jazz.id)
+        self.index.remove("missing")
+
+        self.assertNotIn(self.jazz.id, self.index)
+        self.assertEqual(self.index.search("storage_1", ["live"]), [self.rock.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
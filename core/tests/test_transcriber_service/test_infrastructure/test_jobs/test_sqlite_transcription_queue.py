@@ -0,0 +1,148 @@
+import os
+import tempfile
+import unittest
+
+from transcriber_service.domain import TranscriptionJob, TranscriptionStatus
+from transcriber_service.infrastructure.jobs import SqliteTranscriptionQueue
+
+
+class TestSqliteTranscriptionQueue(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "jobs.sqlite3")
+        self.queue = SqliteTranscriptionQueue(self.db_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_empty_db_path_raises_error(self):
+        with self.assertRaises(ValueError):
+            SqliteTranscriptionQueue("")
+
+    def test_claim_empty_queue_returns_none(self):
+        self.assertIsNone(self.queue.claim())
+
+    def test_enqueue_and_get(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3", "en", 2, "meeting")
+        self.queue.enqueue(job)
+
+        result = self.queue.get(job.id)
+
+        self.assertEqual(result.record_id, "record_1")
+        self.assertEqual(result.file_path, "/path/test.mp3")
+        self.assertEqual(result.language, "en")
+        self.assertEqual(result.max_speakers, 2)
+        self.assertEqual(result.main_theme, "meeting")
+        self.assertEqual(result.status, TranscriptionStatus.PENDING)
+
+    def test_get_not_found_returns_none(self):
+        self.assertIsNone(self.queue.get("missing"))
+
+    def test_claim_marks_job_running(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.enqueue(job)
+
+        claimed = self.queue.claim()
+
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.status, TranscriptionStatus.RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertEqual(self.queue.get(job.id).status, TranscriptionStatus.RUNNING)
+        self.assertIsNone(self.queue.claim())
+
+    def test_claim_returns_oldest_job_first(self):
+        first = TranscriptionJob("record_1", "/path/1.mp3")
+        second = TranscriptionJob("record_2", "/path/2.mp3")
+        self.queue.enqueue(first)
+        self.queue.enqueue(second)
+
+        self.assertEqual(self.queue.claim().id, first.id)
+        self.assertEqual(self.queue.claim().id, second.id)
+
+    def test_claim_shared_between_queue_instances(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.enqueue(job)
+        other_queue = SqliteTranscriptionQueue(self.db_path)
+
+        self.assertEqual(other_queue.claim().id, job.id)
+        self.assertIsNone(self.queue.claim())
+
+    def test_claim_expired_lease_again(self):
+        queue = SqliteTranscriptionQueue(self.db_path, lease_timeout=-1)
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        queue.enqueue(job)
+        queue.claim()
+
+        claimed = queue.claim()
+
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.attempts, 2)
+
+    def test_claim_expired_lease_stops_after_max_attempts(self):
+        queue = SqliteTranscriptionQueue(self.db_path, lease_timeout=-1, max_attempts=1)
+        queue.enqueue(TranscriptionJob("record_1", "/path/test.mp3"))
+        queue.claim()
+
+        self.assertIsNone(queue.claim())
+
+    def test_expire_fails_job_lost_on_last_attempt(self):
+        queue = SqliteTranscriptionQueue(self.db_path, lease_timeout=-1, max_attempts=2)
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        queue.enqueue(job)
+        queue.claim()
+        self.assertEqual(queue.expire(), [])
+        queue.claim()  # worker crashes on the last attempt
+
+        expired = queue.expire()
+
+        self.assertEqual([j.id for j in expired], [job.id])
+        self.assertEqual(expired[0].status, TranscriptionStatus.FAILED)
+        self.assertEqual(queue.get(job.id).status, TranscriptionStatus.FAILED)
+        self.assertIsNotNone(queue.get(job.id).error)
+        self.assertIsNone(queue.claim())
+        self.assertEqual(queue.expire(), [])
+
+    def test_expire_keeps_running_job_with_lease(self):
+        queue = SqliteTranscriptionQueue(self.db_path, max_attempts=1)
+        queue.enqueue(TranscriptionJob("record_1", "/path/test.mp3"))
+        job = queue.claim()
+
+        self.assertEqual(queue.expire(), [])
+        self.assertEqual(queue.get(job.id).status, TranscriptionStatus.RUNNING)
+
+    def test_complete(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.enqueue(job)
+        self.queue.claim()
+
+        self.queue.complete(job.id)
+
+        self.assertEqual(self.queue.get(job.id).status, TranscriptionStatus.DONE)
+
+    def test_fail_saves_error(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.enqueue(job)
+        self.queue.claim()
+
+        self.queue.fail(job.id, "model error")
+
+        result = self.queue.get(job.id)
+        self.assertEqual(result.status, TranscriptionStatus.FAILED)
+        self.assertEqual(result.error, "model error")
+
+    def test_complete_not_found_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.queue.complete("missing")
+
+    def test_get_by_record_returns_latest_job(self):
+        first = TranscriptionJob("record_1", "/path/test.mp3")
+        second = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.enqueue(first)
+        self.queue.enqueue(second)
+
+        self.assertEqual(self.queue.get_by_record("record_1").id, second.id)
+        self.assertIsNone(self.queue.get_by_record("record_2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.domain import TranscriptionJob
+from transcriber_service.domain.interfaces import ITranscriptionQueue
+from transcriber_service.infrastructure.jobs import TranscriptionWorkerPool
+
+
+class TestTranscriptionWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.queue = MagicMock(spec=ITranscriptionQueue)
+        self.handler = MagicMock()
+        self.pool = TranscriptionWorkerPool(
+            self.queue, self.handler, workers=2, poll_interval=0.01
+        )
+
+    def test_invalid_workers_raises_error(self):
+        with self.assertRaises(ValueError):
+            TranscriptionWorkerPool(self.queue, self.handler, workers=0)
+
+    def test_run_once_empty_queue(self):
+        self.queue.claim.return_value = None
+
+        self.assertFalse(self.pool.run_once())
+        self.handler.assert_not_called()
+
+    def test_run_once_completes_job(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.claim.return_value = job
+
+        self.assertTrue(self.pool.run_once())
+
+        self.handler.assert_called_once_with(job)
+        self.queue.complete.assert_called_once_with(job.id)
+        self.queue.fail.assert_not_called()
+
+    def test_run_once_fails_job_on_handler_error(self):
+        job = TranscriptionJob("record_1", "/path/test.mp3")
+        self.queue.claim.return_value = job
+        self.handler.side_effect = RuntimeError("model error")
+
+        self.assertTrue(self.pool.run_once())
+
+        self.queue.fail.assert_called_once_with(job.id, "model error")
+        self.queue.complete.assert_not_called()
+
+    def test_run_once_reports_expired_jobs(self):
+        expired = TranscriptionJob("record_1", "/path/test.mp3")
+        on_expired = MagicMock()
+        pool = TranscriptionWorkerPool(self.queue, self.handler, on_expired=on_expired)
+        self.queue.expire.return_value = [expired]
+        self.queue.claim.return_value = None
+
+        self.assertFalse(pool.run_once())
+
+        on_expired.assert_called_once_with(expired)
+        self.handler.assert_not_called()
+
+    def test_start_and_stop(self):
+        self.queue.claim.return_value = None
+
+        self.pool.start()
+        self.assertTrue(self.pool.running)
+
+        self.pool.stop(timeout=1)
+        self.assertFalse(self.pool.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock
 
 from transcriber_service.domain.interfaces import (
@@ -7,8 +10,20 @@ from transcriber_service.domain.interfaces import (
     IStorage,
     IFileManager,
     ISerializer,
+    ITranscriptStore,
 )
-from transcriber_service.infrastructure.repositories import LocalAudioRepository
+from transcriber_service.domain import AudioRecord, AudioRecordSummary
+from transcriber_service.application.serialization import (
+    EntityMapperFactory,
+    FastSerializerAdapter,
+)
+from transcriber_service.infrastructure.repositories import (
+    FileTranscriptStore,
+    LocalAudioRepository,
+    LocalFileManager,
+    RecordStore,
+)
+from transcriber_service.infrastructure.serializers import RecordFormatSerializer
 
 
 class TestLocalAudioRepository(unittest.TestCase):
@@ -16,7 +31,7 @@ class TestLocalAudioRepository(unittest.TestCase):
         self.mock_saver = MagicMock(spec=IFileManager)
         self.mock_serializer = MagicMock(spec=ISerializer)
         self.mock_saver.save = MagicMock()
-        self.mock_saver.load = {}
+        self.mock_saver.load.side_effect = FileNotFoundError
 
         self.mock_storage_repo = MagicMock(spec=IStorageRepository)
         self.mock_storage_repo.get_by_id.return_value = MagicMock(spec=IStorage)
@@ -26,6 +41,17 @@ class TestLocalAudioRepository(unittest.TestCase):
             self.mock_storage_repo, self.data_dir, self.mock_saver, self.mock_serializer
         )
 
+    def test_corrupted_snapshot_raises_error(self):
+        self.mock_saver.load.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            LocalAudioRepository(
+                self.mock_storage_repo,
+                self.data_dir,
+                self.mock_saver,
+                self.mock_serializer,
+            )
+
     def test_add(self):
         mock_audio = MagicMock(spec=IAudioRecord)
         mock_audio.id.return_value = "1"
@@ -54,10 +80,276 @@ class TestLocalAudioRepository(unittest.TestCase):
         self.local_audio_repository.delete(mock_audio.id)
         self.assertEqual(self.local_audio_repository.get_by_id(mock_audio.id), None)
 
+    def test_indexes_summaries_of_given_store(self):
+        record = AudioRecord("first.mp3", "/path/first.mp3", "storage_1", "", "")
+        store = MagicMock(spec=RecordStore)
+        store.summaries.return_value = [AudioRecordSummary.from_record(record)]
+        store.get.return_value = record
+        self.mock_saver.load.reset_mock()
+
+        repository = LocalAudioRepository(
+            self.mock_storage_repo,
+            self.data_dir,
+            self.mock_saver,
+            self.mock_serializer,
+            store=store,
+        )
+
+        self.assertEqual(repository.search_by_name("storage_1", "first"), (record,))
+        store.get.assert_called_once_with(record.id)
+        self.mock_saver.load.assert_not_called()
+
+    def test_add_and_delete_change_storage_membership(self):
+        record = AudioRecord("first.mp3", "/path/first.mp3", "storage_1", "", "")
+
+        self.local_audio_repository.add(record)
+        self.local_audio_repository.delete(record.id)
+
+        self.mock_storage_repo.add_audio_record.assert_called_once_with(
+            "storage_1", record.id
+        )
+        self.mock_storage_repo.remove_audio_record.assert_called_once_with(
+            "storage_1", record.id
+        )
+        self.mock_storage_repo.update.assert_not_called()
+
+    def test_add_to_missing_storage_raises_error(self):
+        record = AudioRecord("first.mp3", "/path/first.mp3", "missing", "", "")
+        self.mock_storage_repo.add_audio_record.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            self.local_audio_repository.add(record)
+        self.assertIsNone(self.local_audio_repository.get_by_id(record.id))
+
     def test_delete_not_found_raises_error(self):
         with self.assertRaises(ValueError):
             self.local_audio_repository.delete("None")
 
+    def test_search_by_tags_follows_updates(self):
+        first = AudioRecord("first.mp3", "/path/first.mp3", "storage_1", "", "")
+        second = AudioRecord("second.mp3", "/path/second.mp3", "storage_1", "", "")
+        other = AudioRecord("other.mp3", "/path/other.mp3", "storage_2", "", "")
+        for record in (first, second, other):
+            record.add_tag("jazz")
+            self.local_audio_repository.add(record)
+        second.add_tag("live")
+        self.local_audio_repository.update(second)
+
+        any_match = self.local_audio_repository.search_by_tags(
+            "storage_1", ["JAZZ", "live"]
+        )
+        all_match = self.local_audio_repository.search_by_tags(
+            "storage_1", ["jazz", "live"], match_all=True
+        )
+        second.remove_tag("live")
+        self.local_audio_repository.update(second)
+        self.local_audio_repository.delete(first.id)
+
+        self.assertEqual(any_match, (first, second))
+        self.assertEqual(all_match, (second,))
+        self.assertEqual(
+            self.local_audio_repository.search_by_tags("storage_1", ["live"]), ()
+        )
+        self.assertEqual(
+            self.local_audio_repository.search_by_tags("storage_1", ["jazz"]),
+            (second,),
+        )
+
+    def test_search_by_name_follows_updates(self):
+        first = AudioRecord("Jazz night.mp3", "/path/1.mp3", "storage_1", "", "")
+        second = AudioRecord("rock.mp3", "/path/2.mp3", "storage_1", "", "")
+        other = AudioRecord("jazz.mp3", "/path/3.mp3", "storage_2", "", "")
+        for record in (first, second, other):
+            self.local_audio_repository.add(record)
+        second.record_name = "jazz live.mp3"
+        self.local_audio_repository.update(second)
+
+        self.assertEqual(
+            self.local_audio_repository.search_by_name("storage_1", "JAZZ", True),
+            (first, second),
+        )
+        self.assertEqual(
+            self.local_audio_repository.search_by_name("storage_1", "live"), (second,)
+        )
+        self.assertEqual(
+            self.local_audio_repository.search_by_name("storage_1", "live", True), ()
+        )
+
+    def test_pagination(self):
+        records = [
+            AudioRecord(f"{i}.mp3", f"/path/{i}.mp3", "storage_1", "", "")
+            for i in range(5)
+        ]
+        for record in records:
+            record.add_tag("jazz")
+            self.local_audio_repository.add(record)
+
+        self.assertEqual(
+            self.local_audio_repository.get_by_storage("storage_1", 1, 2),
+            tuple(records[1:3]),
+        )
+        self.assertEqual(
+            self.local_audio_repository.search_by_tags("storage_1", ["jazz"], False, 3),
+            tuple(records[3:]),
+        )
+        self.assertEqual(
+            self.local_audio_repository.search_by_name("storage_1", "mp3", limit=0), ()
+        )
+        with self.assertRaises(ValueError):
+            self.local_audio_repository.get_by_storage("storage_1", -1)
+
+    def test_get_page_by_storage_follows_updates(self):
+        records = [
+            AudioRecord(f"{i}.mp3", f"/path/{i}.mp3", "storage_1", "", "")
+            for i in range(3)
+        ]
+        for minute, record in enumerate(records):
+            record.last_updated = datetime(2024, 1, 1, 12, minute)
+            self.local_audio_repository.add(record)
+        records[0].last_updated = datetime(2024, 1, 1, 13)
+        self.local_audio_repository.update(records[0])
+
+        first_page = self.local_audio_repository.get_page_by_storage("storage_1", 2)
+        last = first_page[-1]
+        second_page = self.local_audio_repository.get_page_by_storage(
+            "storage_1", 2, (last.last_updated, last.id)
+        )
+
+        summaries = self.local_audio_repository.get_summaries_by_storage(
+            "storage_1", 2, (last.last_updated, last.id)
+        )
+
+        self.assertEqual(first_page, (records[0], records[2]))
+        self.assertEqual(second_page, (records[1],))
+        self.assertEqual([s.id for s in summaries], [records[1].id])
+        self.assertEqual(summaries[0].record_name, "1.mp3")
+
+    def test_get_summaries_keeps_order(self):
+        records = [
+            AudioRecord(f"{i}.mp3", f"/path/{i}.mp3", "storage_1", "", "")
+            for i in range(3)
+        ]
+        for record in records:
+            self.local_audio_repository.add(record)
+
+        summaries = self.local_audio_repository.get_summaries(
+            [records[2].id, "missing", records[0].id]
+        )
+
+        self.assertEqual([s.id for s in summaries], [records[2].id, records[0].id])
+        self.assertEqual(summaries[0].record_name, "2.mp3")
+
+    def test_text_is_stored_apart(self):
+        transcripts = MagicMock(spec=ITranscriptStore)
+        transcripts.get.return_value = "hello world"
+        repository = LocalAudioRepository(
+            self.mock_storage_repo,
+            self.data_dir,
+            self.mock_saver,
+            self.mock_serializer,
+            transcripts=transcripts,
+        )
+        record = AudioRecord("first.mp3", "/path/first.mp3", "storage_1", "", "en")
+        record.text = "hello world"
+
+        repository.add(record)
+        stored = repository.get_by_id(record.id)
+
+        transcripts.put.assert_called_once_with(record.id, "hello world", "en")
+        self.assertEqual(record.text, "hello world")
+        transcripts.get.assert_not_called()
+        self.assertEqual(stored.text, "hello world")
+        transcripts.get.assert_called_once_with(record.id)
+
+    def test_unloaded_text_is_not_rewritten(self):
+        transcripts = MagicMock(spec=ITranscriptStore)
+        repository = LocalAudioRepository(
+            self.mock_storage_repo,
+            self.data_dir,
+            self.mock_saver,
+            self.mock_serializer,
+            transcripts=transcripts,
+        )
+        record = AudioRecord("first.mp3", "/path/first.mp3", "storage_1", "text", "")
+        repository.add(record)
+        transcripts.reset_mock()
+
+        stored = repository.get_by_id(record.id)
+        stored.add_tag("jazz")
+        repository.update(stored)
+        repository.delete(record.id)
+
+        transcripts.put.assert_not_called()
+        transcripts.get.assert_not_called()
+        transcripts.delete.assert_called_once_with(record.id)
+
+    def test_update_logs_changed_fields_only(self):
+        serializer = FastSerializerAdapter(
+            RecordFormatSerializer(), EntityMapperFactory()
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "audio")
+            repository = LocalAudioRepository(
+                self.mock_storage_repo, path, LocalFileManager(), serializer
+            )
+            record = AudioRecord(
+                "first.mp3", "/path/first.mp3", "storage_1", "text " * 1000, "en"
+            )
+            repository.add(record)
+            added = os.path.getsize(path + ".log")
+
+            stored = repository.get_by_id(record.id)
+            stored.add_tag("jazz")
+            repository.update(stored)
+            repository.update(stored)
+            updated = os.path.getsize(path + ".log") - added
+
+            reopened = LocalAudioRepository(
+                self.mock_storage_repo, path, LocalFileManager(), serializer
+            ).get_by_id(record.id)
+
+        self.assertLess(updated, 200)
+        self.assertEqual(reopened.tags, ["jazz"])
+        self.assertEqual(reopened.last_updated, stored.last_updated)
+        self.assertEqual(reopened.text, "text " * 1000)
+        self.assertEqual(reopened.dirty_fields, set())
+
+    def test_text_edit_of_inline_record_survives_reopen(self):
+        serializer = FastSerializerAdapter(
+            RecordFormatSerializer(), EntityMapperFactory()
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "audio")
+            transcripts = FileTranscriptStore(os.path.join(temp_dir, "transcripts"))
+            record = AudioRecord(
+                "first.mp3", "/path/first.mp3", "storage_1", "old", "en"
+            )
+            LocalAudioRepository(
+                self.mock_storage_repo, path, LocalFileManager(), serializer
+            ).add(record)
+
+            repository = LocalAudioRepository(
+                self.mock_storage_repo,
+                path,
+                LocalFileManager(),
+                serializer,
+                transcripts=transcripts,
+            )
+            stored = repository.get_by_id(record.id)
+            stored.text = "new"
+            repository.update(stored)
+
+            reopened = LocalAudioRepository(
+                self.mock_storage_repo,
+                path,
+                LocalFileManager(),
+                serializer,
+                transcripts=transcripts,
+            ).get_by_id(record.id)
+
+            self.assertEqual(reopened.text, "new")
+            self.assertEqual(transcripts.get(record.id), "new")
+
     def test_update_not_found_raises_error(self):
         mock_audio = MagicMock(spec=IAudioRecord)
         mock_audio.id.return_value = "5"
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from transcriber_service.infrastructure.repositories import FileTranscriptStore
+from transcriber_service.infrastructure.serializers import TextCompressor
+
+
+class TestFileTranscriptStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = FileTranscriptStore(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_and_get(self):
+        self.store.put("record_1", "hello world", "en")
+
+        self.assertEqual(self.store.get("record_1"), "hello world")
+        self.assertIsNone(self.store.get("record_2"))
+
+    def test_put_replaces_text(self):
+        self.store.put("record_1", "old text")
+        self.store.put("record_1", "new text")
+
+        self.assertEqual(self.store.get("record_1"), "new text")
+        self.assertEqual(
+            os.listdir(os.path.join(self.temp_dir.name, "re")), ["record_1"]
+        )
+
+    def test_empty_text_deletes(self):
+        self.store.put("record_1", "hello world")
+        self.store.put("record_1", "")
+
+        self.assertIsNone(self.store.get("record_1"))
+
+    def test_delete(self):
+        self.store.put("record_1", "hello world")
+        self.store.delete("record_1")
+        self.store.delete("record_1")
+
+        self.assertIsNone(self.store.get("record_1"))
+
+    def test_compressed_text(self):
+        compressor = TextCompressor(threshold=100, algorithm="zlib")
+        store = FileTranscriptStore(self.temp_dir.name, compressor)
+        text = "hello world " * 100
+
+        store.put("record_1", text, "en")
+
+        self.assertEqual(store.get("record_1"), text)
+        self.assertLess(
+            os.path.getsize(os.path.join(self.temp_dir.name, "re", "record_1")),
+            len(text),
+        )
+        with self.assertRaises(ValueError):
+            FileTranscriptStore(self.temp_dir.name).get("record_1")
+
+    def test_invalid_record_id_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.store.put(os.path.join("..", "record_1"), "hello world")
+
+
+if __name__ == "__main__":
+    unittest.main()
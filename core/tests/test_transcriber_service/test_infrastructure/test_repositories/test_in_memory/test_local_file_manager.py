@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from transcriber_service.infrastructure.repositories import (
+    FsyncPolicy,
+    LocalFileManager,
+)
+from transcriber_service.infrastructure.serializers import JsonSerializer
+from transcriber_service.infrastructure.serializers.msgpack_serializer import (
+    MsgpackSerializer,
+)
+
+
+class TestLocalFileManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "data")
+        self.serializer = JsonSerializer()
+        self.manager = LocalFileManager()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        self.manager.save({"1": "value"}, self.path, self.serializer)
+
+        self.assertEqual(self.manager.load(self.path, self.serializer), {"1": "value"})
+
+    def test_save_replaces_snapshot_atomically(self):
+        self.manager.save({"1": "first"}, self.path, self.serializer)
+        self.manager.save({"1": "second"}, self.path, self.serializer)
+
+        self.assertEqual(os.listdir(self.temp_dir.name), ["data.json"])
+        self.assertEqual(self.manager.generation(self.path, self.serializer), 2)
+        self.assertEqual(self.manager.load(self.path, self.serializer), {"1": "second"})
+
+    def test_load_missing_snapshot_raises_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.manager.load(self.path, self.serializer)
+
+    def test_load_corrupted_snapshot_raises_error(self):
+        self.manager.save({"1": "value"}, self.path, self.serializer)
+        with open(self.path + ".json", "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"XYZ")
+
+        with self.assertRaises(ValueError):
+            self.manager.load(self.path, self.serializer)
+
+    def test_load_snapshot_without_header(self):
+        manager = LocalFileManager(FsyncPolicy.NEVER, checksum=False)
+        manager.save({"1": "value"}, self.path, self.serializer)
+
+        self.assertEqual(manager.generation(self.path, self.serializer), 0)
+        self.assertEqual(self.manager.load(self.path, self.serializer), {"1": "value"})
+
+    def test_batched_fsync_policy(self):
+        manager = LocalFileManager("batched", fsync_interval=2)
+        for i in range(3):
+            manager.append([(str(i), i)], self.path, self.serializer)
+
+        self.assertEqual(len(manager.load_log(self.path, self.serializer)), 3)
+
+    def test_invalid_fsync_policy_raises_error(self):
+        with self.assertRaises(ValueError):
+            LocalFileManager("sometimes")
+        with self.assertRaises(ValueError):
+            LocalFileManager(fsync_interval=0)
+
+    def test_load_log_replays_entries_in_order(self):
+        self.manager.append([("1", {"a": 1})], self.path, self.serializer)
+        self.manager.append([("2", [2]), ("1", None)], self.path, self.serializer)
+
+        entries = self.manager.load_log(self.path, self.serializer)
+
+        self.assertEqual(entries, [("1", {"a": 1}), ("2", [2]), ("1", None)])
+
+    def test_load_log_binary_serializer(self):
+        serializer = MsgpackSerializer()
+        self.manager.append([("ключ", {"a": 1})], self.path, serializer)
+
+        self.assertEqual(
+            self.manager.load_log(self.path, serializer), [("ключ", {"a": 1})]
+        )
+
+    def test_load_log_missing_file(self):
+        self.assertEqual(self.manager.load_log(self.path, self.serializer), [])
+
+    def test_load_log_drops_torn_tail(self):
+        self.manager.append([("1", "first")], self.path, self.serializer)
+        self.manager.append([("2", "second")], self.path, self.serializer)
+        log_path = self.path + ".log"
+        with open(log_path, "r+b") as f:
+            f.truncate(os.path.getsize(log_path) - 3)
+
+        entries = self.manager.load_log(self.path, self.serializer)
+        self.manager.append([("3", "third")], self.path, self.serializer)
+
+        self.assertEqual(entries, [("1", "first")])
+        self.assertEqual(
+            self.manager.load_log(self.path, self.serializer),
+            [("1", "first"), ("3", "third")],
+        )
+
+    def test_load_log_stops_at_corrupted_entry(self):
+        self.manager.append([("1", "first")], self.path, self.serializer)
+        with open(self.path + ".log", "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b"x")
+
+        self.assertEqual(self.manager.load_log(self.path, self.serializer), [])
+
+    def test_clear_log(self):
+        self.manager.append([("1", "first")], self.path, self.serializer)
+
+        self.manager.clear_log(self.path)
+        self.manager.clear_log(self.path)
+
+        self.assertEqual(self.manager.load_log(self.path, self.serializer), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+import os
+import pickle
+import tempfile
+import unittest
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.interfaces import ISerializer
+from transcriber_service.infrastructure.repositories import (
+    FsyncPolicy,
+    MappedRecordStore,
+)
+
+
+class CountingSerializer(ISerializer):
+    def __init__(self):
+        self.decoded = 0
+
+    def serialize(self, data) -> bytes:
+        return pickle.dumps(data)
+
+    def deserialize(self, data: bytes):
+        self.decoded += 1
+        return pickle.loads(data)
+
+    @property
+    def extension(self) -> str:
+        return "pickle"
+
+    @property
+    def binary(self) -> bool:
+        return True
+
+
+class TestMappedRecordStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "audio")
+        self.serializer = CountingSerializer()
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self.temp_dir.cleanup()
+
+    def open_store(self, **kwargs) -> MappedRecordStore:
+        store = MappedRecordStore(
+            self.path, self.serializer, fsync=FsyncPolicy.NEVER, **kwargs
+        )
+        self.stores.append(store)
+        return store
+
+    @staticmethod
+    def create_record(name: str, storage_id: str = "storage") -> SimpleNamespace:
+        return SimpleNamespace(
+            id=uuid.uuid4().hex,
+            record_name=name,
+            storage_id=storage_id,
+            text="text " * 100,
+            language="en",
+            tags=["tag"],
+            status="done",
+            last_updated=datetime.now(),
+        )
+
+    def test_put_and_get(self):
+        store = self.open_store()
+        record = self.create_record("first")
+        store.put(record)
+
+        self.assertIn(record.id, store)
+        self.assertIs(store.get(record.id), record)
+        self.assertIsNone(store.get("missing"))
+
+    def test_reopen_does_not_decode_records(self):
+        store = self.open_store()
+        records = [self.create_record(str(i)) for i in range(5)]
+        for record in records:
+            store.put(record)
+        store.close()
+
+        reopened = self.open_store()
+        summaries = {summary.id: summary for summary in reopened.summaries()}
+
+        self.assertEqual(self.serializer.decoded, 0)
+        self.assertEqual(len(reopened), 5)
+        self.assertEqual(summaries[records[0].id].tags, ["tag"])
+        self.assertEqual(summaries[records[0].id].last_updated, records[0].last_updated)
+
+        record = reopened.get(records[2].id)
+        self.assertEqual(record.record_name, "2")
+        self.assertEqual(self.serializer.decoded, 1)
+
+    def test_reopen_scans_frames_written_after_index(self):
+        store = self.open_store()
+        first = self.create_record("first")
+        store.put(first)
+        store.save_index()
+        second = self.create_record("second")
+        store.put(second)
+        store.delete(first.id)
+
+        reopened = self.open_store()
+
+        self.assertNotIn(first.id, reopened)
+        self.assertEqual(reopened.get(second.id).record_name, "second")
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        store = self.open_store(cache_size=2)
+        records = [self.create_record(str(i)) for i in range(3)]
+        for record in records:
+            store.put(record)
+
+        store.get(records[1].id)
+        store.get(records[0].id)
+
+        self.assertEqual(self.serializer.decoded, 1)
+        self.assertEqual(store.get(records[0].id).record_name, "0")
+        self.assertEqual(self.serializer.decoded, 1)
+
+    def test_compact_drops_overwritten_records(self):
+        store = self.open_store(compact_threshold=1)
+        record = self.create_record("first")
+        store.put(record)
+        size = os.path.getsize(self.path + ".records")
+        store.put(record)
+        store.put(record)
+
+        self.assertEqual(os.path.getsize(self.path + ".records"), size)
+        reopened = self.open_store()
+        self.assertEqual(reopened.get(record.id).record_name, "first")
+
+    def test_patch_appends_changed_fields_only(self):
+        store = self.open_store()
+        record = AudioRecord(
+            "first", "/path/first.mp3", "storage", "text " * 1000, "en"
+        )
+        store.put(record)
+        size = os.path.getsize(self.path + ".records")
+
+        record.add_tag("meeting")
+        store.patch(record, frozenset(("tags", "last_updated")))
+
+        self.assertLess(os.path.getsize(self.path + ".records") - size, 300)
+        summaries = {summary.id: summary for summary in store.summaries()}
+        self.assertEqual(summaries[record.id].tags, ["meeting"])
+        store.save_index()
+        record.remove_tag("meeting")
+        store.patch(record, frozenset(("tags", "last_updated")))
+        record.add_tag("weekly")
+        store.patch(record, frozenset(("tags", "last_updated")))
+
+        reopened = self.open_store()
+        restored = reopened.get(record.id)
+        self.assertEqual(restored.tags, ["weekly"])
+        self.assertEqual(restored.text, "text " * 1000)
+        self.assertEqual(restored.last_updated, record.last_updated)
+
+        reopened.close()
+        os.remove(self.path + ".records.idx")
+        rescanned = self.open_store()
+        self.assertEqual(rescanned.get(record.id).tags, ["weekly"])
+
+    def test_compact_writes_patched_records_whole(self):
+        store = self.open_store(compact_threshold=1)
+        record = AudioRecord("first", "/path/first.mp3", "storage", "text", "en")
+        store.put(record)
+        record.add_tag("meeting")
+        store.patch(record, frozenset(("tags", "last_updated")))
+
+        store.compact()
+
+        reopened = self.open_store()
+        self.assertEqual(reopened.get(record.id).tags, ["meeting"])
+
+    def test_torn_tail_is_dropped(self):
+        store = self.open_store()
+        record = self.create_record("first")
+        store.put(record)
+        store.close()
+        with open(self.path + ".records", "ab") as f:
+            f.write(b"\x00\x00\x10")
+
+        reopened = self.open_store()
+
+        self.assertEqual(reopened.get(record.id).record_name, "first")
+
+    def test_stale_index_is_rebuilt(self):
+        store = self.open_store()
+        record = self.create_record("first")
+        store.put(record)
+        store.close()
+        os.remove(self.path + ".records")
+
+        reopened = self.open_store()
+
+        self.assertNotIn(record.id, reopened)
+
+    def test_batch_defers_fsync(self):
+        store = MappedRecordStore(self.path, self.serializer)
+        self.stores.append(store)
+
+        with patch("os.fsync") as fsync:
+            store.begin_batch()
+            store.put(self.create_record("first"))
+            store.put(self.create_record("second"))
+            fsync.assert_not_called()
+            store.end_batch()
+
+        fsync.assert_called_once()
+
+    def test_not_a_record_store_raises_error(self):
+        with open(self.path + ".records", "wb") as f:
+            f.write(b"x" * 64)
+
+        with self.assertRaises(ValueError):
+            MappedRecordStore(self.path, self.serializer)
+
+
+if __name__ == "__main__":
+    unittest.main()
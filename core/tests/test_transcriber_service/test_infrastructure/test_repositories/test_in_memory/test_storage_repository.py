@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 
+from transcriber_service.domain import Storage
 from transcriber_service.domain.interfaces import IStorage, IFileManager, ISerializer
 from transcriber_service.infrastructure.repositories.in_memory.storage_repository import (
     LocalStorageRepository,
@@ -12,7 +13,7 @@ class TestLocalStorageRepository(unittest.TestCase):
         self.mock_saver = MagicMock(spec=IFileManager)
         self.mock_serializer = MagicMock(spec=ISerializer)
         self.mock_saver.save = MagicMock()
-        self.mock_saver.load = {}, {}
+        self.mock_saver.load.side_effect = FileNotFoundError
 
         self.data_dir = " "
         self.local_storage_repository = LocalStorageRepository(
@@ -43,6 +44,27 @@ class TestLocalStorageRepository(unittest.TestCase):
             self.local_storage_repository.get_by_id(mock_storage.id), mock_storage
         )
 
+    def test_add_and_remove_audio_record(self):
+        storage = Storage("user_1")
+        self.local_storage_repository.add(storage)
+
+        self.local_storage_repository.add_audio_record(storage.id, "record_1")
+        self.local_storage_repository.add_audio_record(storage.id, "record_2")
+        self.local_storage_repository.remove_audio_record(storage.id, "record_1")
+        self.local_storage_repository.remove_audio_record(storage.id, "missing")
+
+        self.assertEqual(
+            self.local_storage_repository.get_by_id(storage.id).audio_record_ids,
+            ["record_2"],
+        )
+        self.mock_saver.append.assert_called()
+
+    def test_audio_record_of_missing_storage_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.local_storage_repository.add_audio_record("missing", "record_1")
+        with self.assertRaises(ValueError):
+            self.local_storage_repository.remove_audio_record("missing", "record_1")
+
     def test_get_by_id_not_found_returns_none(self):
         self.assertEqual(self.local_storage_repository.get_by_id("4"), None)
 
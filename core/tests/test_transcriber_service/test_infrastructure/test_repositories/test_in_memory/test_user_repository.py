@@ -12,7 +12,7 @@ class TestLocalUserRepository(unittest.TestCase):
         self.mock_saver = MagicMock(spec=IFileManager)
         self.mock_serializer = MagicMock(spec=ISerializer)
         self.mock_saver.save = MagicMock()
-        self.mock_saver.load = {}
+        self.mock_saver.load.side_effect = FileNotFoundError
 
         self.data_dir = " "
         self.local_user_repository = LocalUserRepository(
@@ -51,6 +51,69 @@ class TestLocalUserRepository(unittest.TestCase):
             self.local_user_repository.get_by_email(mock_user.email), mock_user
         )
 
+    def test_email_index_is_case_insensitive_and_unique(self):
+        user = self.__user("1", "User@Example.com")
+        self.local_user_repository.add(user)
+
+        self.assertEqual(
+            self.local_user_repository.get_by_email("user@example.COM"), user
+        )
+        with self.assertRaises(ValueError):
+            self.local_user_repository.add(self.__user("2", "user@example.com"))
+
+    def test_email_index_follows_update_and_delete(self):
+        user = self.__user("1", "old@example.com")
+        self.local_user_repository.add(user)
+        user.email = "new@example.com"
+        self.local_user_repository.update(user)
+
+        self.assertIsNone(self.local_user_repository.get_by_email("old@example.com"))
+        self.assertEqual(
+            self.local_user_repository.get_by_email("new@example.com"), user
+        )
+
+        self.local_user_repository.delete(user)
+        self.local_user_repository.add(self.__user("2", "new@example.com"))
+        self.assertEqual(
+            self.local_user_repository.get_by_email("new@example.com").id, "2"
+        )
+
+    def test_iter_users_filters_and_orders_by_email(self):
+        for user_id, email, blocked in (
+            ("1", "c@example.com", False),
+            ("2", "a@example.com", True),
+            ("3", "b@test.com", False),
+            ("4", "ab@example.com", False),
+        ):
+            user = self.__user(user_id, email)
+            user.is_blocked = blocked
+            self.local_user_repository.add(user)
+
+        def emails(**kwargs):
+            users = self.local_user_repository.iter_users(**kwargs)
+            return [user.email for user in users]
+
+        self.assertEqual(
+            emails(),
+            ["a@example.com", "ab@example.com", "b@test.com", "c@example.com"],
+        )
+        self.assertEqual(emails(blocked=True), ["a@example.com"])
+        self.assertEqual(emails(email_prefix="a"), ["a@example.com", "ab@example.com"])
+        self.assertEqual(emails(email_prefix="AB"), ["ab@example.com"])
+        self.assertEqual(
+            emails(blocked=False, after="ab@example.com"),
+            ["b@test.com", "c@example.com"],
+        )
+        with self.assertRaises(ValueError):
+            emails(batch_size=0)
+
+    @staticmethod
+    def __user(user_id: str, email: str) -> IUser:
+        user = MagicMock(spec=IUser)
+        user.id = user_id
+        user.email = email
+        return user
+
     def test_get_by_email_not_found_returns_none(self):
         self.assertEqual(self.local_user_repository.get_by_email("4"), None)
 
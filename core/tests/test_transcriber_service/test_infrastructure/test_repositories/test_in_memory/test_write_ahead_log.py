@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.domain.interfaces import IFileManager, ISerializer
+from transcriber_service.infrastructure.repositories.in_memory.write_ahead_log import (
+    WriteAheadLog,
+)
+
+
+class TestWriteAheadLog(unittest.TestCase):
+    def setUp(self):
+        self.file_manager = MagicMock(spec=IFileManager)
+        self.serializer = MagicMock(spec=ISerializer)
+        self.state = {"1": "value"}
+        self.log = WriteAheadLog(
+            "data",
+            self.file_manager,
+            self.serializer,
+            lambda: self.state,
+            compact_threshold=3,
+        )
+
+    def test_put_and_delete_append_entries(self):
+        self.log.put("1", "value")
+        self.log.delete("2")
+
+        self.file_manager.append.assert_any_call(
+            [("1", "value")], "data", self.serializer
+        )
+        self.file_manager.append.assert_any_call([("2", None)], "data", self.serializer)
+        self.file_manager.save.assert_not_called()
+
+    def test_compacts_after_threshold(self):
+        for i in range(3):
+            self.log.put(str(i), "value")
+
+        self.file_manager.save.assert_called_once_with(
+            self.state, "data", self.serializer
+        )
+        self.file_manager.clear_log.assert_called_once_with("data")
+
+    def test_replayed_entries_count_towards_threshold(self):
+        self.file_manager.load_log.return_value = [("1", "value"), ("2", None)]
+
+        entries = self.log.replay()
+        self.log.put("3", "value")
+
+        self.assertEqual(entries, [("1", "value"), ("2", None)])
+        self.file_manager.save.assert_called_once()
+
+    def test_batch_appends_coalesced_entries_once(self):
+        self.log.begin_batch()
+        self.log.put("1", "first")
+        self.log.put("2", "value")
+        self.log.put("1", "second")
+        self.file_manager.append.assert_not_called()
+        self.log.end_batch()
+
+        self.file_manager.append.assert_called_once_with(
+            [("2", "value"), ("1", "second")], "data", self.serializer
+        )
+        self.file_manager.save.assert_not_called()
+
+    def test_invalid_threshold_raises_error(self):
+        with self.assertRaises(ValueError):
+            WriteAheadLog("data", self.file_manager, self.serializer, dict, 0)
+
+    def test_patch_appends_changes(self):
+        self.log.patch("1", {"tags": ["jazz"]}, "value")
+
+        self.file_manager.append.assert_called_once_with(
+            [("1", {"tags": ["jazz"]})], "data", self.serializer
+        )
+
+    def test_batch_merges_patches(self):
+        self.log.begin_batch()
+        self.log.patch("1", {"tags": ["jazz"]}, "first")
+        self.log.patch("1", {"status": "done"}, "second")
+        self.log.put("2", "value")
+        self.log.patch("2", {"tags": []}, "third")
+        self.log.end_batch()
+
+        self.file_manager.append.assert_called_once_with(
+            [("1", {"tags": ["jazz"], "status": "done"}), ("2", "third")],
+            "data",
+            self.serializer,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import copy
+import re
+from types import SimpleNamespace
+
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict]):
+        self.__documents = documents
+
+    def sort(self, key, direction: int = 1) -> "FakeCursor":
+        keys = [(key, direction)] if isinstance(key, str) else key
+        for field, order in reversed(keys):
+            self.__documents.sort(key=lambda doc: doc[field], reverse=order < 0)
+        return self
+
+    def skip(self, count: int) -> "FakeCursor":
+        self.__documents = self.__documents[count:]
+        return self
+
+    def limit(self, count: int) -> "FakeCursor":
+        self.__documents = self.__documents[:count]
+        return self
+
+    def batch_size(self, size: int) -> "FakeCursor":
+        return self
+
+    def __iter__(self):
+        return iter(self.__documents)
+
+
+class FakeCollection:
+    """
+    In-memory stand-in of a pymongo collection with the queries, update
+    operators and unique indexes used by Mongo repositories.
+    """
+
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+        self.indexes: dict[str, tuple[list[str], bool]] = {}
+        self.bulk_writes: list[list] = []
+
+    def create_index(self, keys, unique: bool = False) -> str:
+        keys = [(keys, 1)] if isinstance(keys, str) else keys
+        name = "_".join(f"{field}_{order}" for field, order in keys)
+        fields = [field for field, _ in keys]
+        if name in self.indexes and self.indexes[name] != (fields, unique):
+            raise OperationFailure(f"Index {name} exists with other options", 85)
+        self.indexes[name] = (fields, unique)
+        return name
+
+    def drop_index(self, name: str) -> None:
+        del self.indexes[name]
+
+    def insert_one(self, document: dict) -> None:
+        if document["_id"] in self.documents:
+            raise DuplicateKeyError("Duplicate _id", 11000, {"keyPattern": {"_id": 1}})
+        for fields, unique in self.indexes.values():
+            key = [document.get(field) for field in fields]
+            if unique and any(
+                [doc.get(field) for field in fields] == key
+                for doc in self.documents.values()
+            ):
+                raise DuplicateKeyError(
+                    "Duplicate key", 11000, {"keyPattern": dict.fromkeys(fields, 1)}
+                )
+        self.documents[document["_id"]] = copy.deepcopy(document)
+
+    def find(self, query: dict, projection: dict | None = None) -> FakeCursor:
+        return FakeCursor(
+            [copy.deepcopy(doc) for doc in self.documents.values() if match(doc, query)]
+        )
+
+    def find_one(self, query: dict) -> dict | None:
+        return next(iter(self.find(query)), None)
+
+    def count_documents(self, query: dict, limit: int = 0) -> int:
+        count = len(list(self.find(query)))
+        return min(count, limit) if limit else count
+
+    def update_one(self, query: dict, update: dict) -> SimpleNamespace:
+        for doc in self.documents.values():
+            if match(doc, query):
+                apply_update(doc, update)
+                return SimpleNamespace(matched_count=1)
+        return SimpleNamespace(matched_count=0)
+
+    def bulk_write(self, operations: list, ordered: bool = True) -> SimpleNamespace:
+        self.bulk_writes.append(operations)
+        matched = sum(
+            self.update_one(op._filter, op._doc).matched_count for op in operations
+        )
+        return SimpleNamespace(matched_count=matched)
+
+    def delete_one(self, query: dict) -> SimpleNamespace:
+        doc = self.find_one(query)
+        if doc:
+            del self.documents[doc["_id"]]
+        return SimpleNamespace(deleted_count=1 if doc else 0)
+
+    def find_one_and_delete(self, query: dict, projection: dict | None = None):
+        doc = self.find_one(query)
+        if doc:
+            del self.documents[doc["_id"]]
+        return doc
+
+
+def match(doc: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(match(doc, branch) for branch in condition):
+                return False
+        elif isinstance(condition, dict) and all(k.startswith("$") for k in condition):
+            if not all(
+                match_operator(doc, field, operator, value)
+                for operator, value in condition.items()
+            ):
+                return False
+        elif not equals(doc.get(field), condition):
+            return False
+    return True
+
+
+def match_operator(doc: dict, field: str, operator: str, value) -> bool:
+    current = doc.get(field)
+    if operator == "$exists":
+        return (field in doc) == value
+    if operator == "$in":
+        return any(equals(current, item) for item in value)
+    if operator == "$all":
+        return all(equals(current, item) for item in value)
+    if operator == "$regex":
+        return current is not None and re.search(value, current) is not None
+    if operator == "$lt":
+        return current is not None and current < value
+    if operator == "$gt":
+        return current is not None and current > value
+    raise NotImplementedError(operator)
+
+
+def equals(current, value) -> bool:
+    if isinstance(current, list) and not isinstance(value, list):
+        return value in current
+    return current == value
+
+
+def apply_update(doc: dict, update: dict) -> None:
+    for operator, fields in update.items():
+        for field, value in fields.items():
+            if operator == "$set":
+                doc[field] = copy.deepcopy(value)
+            elif operator == "$unset":
+                doc.pop(field, None)
+            elif operator == "$addToSet":
+                items = value["$each"] if isinstance(value, dict) else [value]
+                array = doc.setdefault(field, [])
+                array.extend(item for item in items if item not in array)
+            elif operator == "$pull":
+                doc[field] = [item for item in doc.get(field, []) if item != value]
+            else:
+                raise NotImplementedError(operator)
@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import MagicMock
+
+from fake_collection import FakeCollection
+from transcriber_service.application.serialization import (
+    EntityMapperFactory,
+    FastSerializerAdapter,
+)
+from transcriber_service.domain import AudioRecord
+from transcriber_service.domain.interfaces import IStorageRepository
+from transcriber_service.infrastructure.repositories import (
+    MongoAudioRepository,
+    MongoConnectionProvider,
+)
+from transcriber_service.infrastructure.serializers import RecordFormatSerializer
+
+
+class TestMongoAudioRepository(unittest.TestCase):
+    def setUp(self):
+        self.collection = FakeCollection()
+        self.connection = MagicMock(spec=MongoConnectionProvider)
+        self.connection.collection.return_value = self.collection
+        self.storage_repository = MagicMock(spec=IStorageRepository)
+        self.repository = MongoAudioRepository(
+            self.storage_repository,
+            FastSerializerAdapter(RecordFormatSerializer(), EntityMapperFactory()),
+            self.connection,
+        )
+        self.record = AudioRecord(
+            "first.mp3", "/path/first.mp3", "storage_1", "text " * 100, "en"
+        )
+        self.repository.add(self.record)
+
+    def document(self) -> dict:
+        return self.collection.documents[self.record.id]
+
+    def test_add_adds_record_to_storage(self):
+        self.storage_repository.add_audio_record.assert_called_once_with(
+            "storage_1", self.record.id
+        )
+        self.assertEqual(self.document()["record_name_lower"], "first.mp3")
+
+    def test_update_sets_changed_fields_only(self):
+        data = self.document()["data"]
+        stored = self.repository.get_by_id(self.record.id)
+        stored.add_tag("Jazz")
+
+        self.repository.update(stored)
+
+        self.assertEqual(self.document()["data"], data)
+        self.assertEqual(self.document()["tags"], ["jazz"])
+        self.assertEqual(self.document()["patched"], ["last_updated", "tags"])
+        restored = self.repository.get_by_id(self.record.id)
+        self.assertEqual(restored.tags, ["jazz"])
+        self.assertEqual(restored.last_updated, stored.last_updated)
+        self.assertEqual(restored.text, "text " * 100)
+
+    def test_text_change_rewrites_document(self):
+        stored = self.repository.get_by_id(self.record.id)
+        stored.add_tag("jazz")
+        self.repository.update(stored)
+        stored.text = "new text"
+
+        self.repository.update(stored)
+
+        self.assertNotIn("patched", self.document())
+        restored = self.repository.get_by_id(self.record.id)
+        self.assertEqual(restored.text, "new text")
+        self.assertEqual(restored.tags, ["jazz"])
+
+    def test_update_missing_record_raises_error(self):
+        stored = self.repository.get_by_id(self.record.id)
+        stored.add_tag("jazz")
+        del self.collection.documents[self.record.id]
+
+        with self.assertRaises(ValueError):
+            self.repository.update(stored)
+
+    def test_batch_writes_updates_with_one_bulk_write(self):
+        second = AudioRecord("second.mp3", "/path/second.mp3", "storage_1", "", "en")
+        self.repository.add(second)
+        first = self.repository.get_by_id(self.record.id)
+        second = self.repository.get_by_id(second.id)
+
+        self.repository.begin_batch()
+        first.add_tag("jazz")
+        self.repository.update(first)
+        first.record_name = "Renamed.mp3"
+        self.repository.update(first)
+        second.add_tag("rock")
+        self.repository.update(second)
+        self.assertEqual(self.collection.bulk_writes, [])
+        self.repository.end_batch()
+
+        self.assertEqual(len(self.collection.bulk_writes), 1)
+        self.assertEqual(len(self.collection.bulk_writes[0]), 2)
+        self.assertEqual(self.document()["record_name_lower"], "renamed.mp3")
+        self.assertEqual(
+            self.document()["patched"], ["last_updated", "record_name", "tags"]
+        )
+        self.assertEqual(self.repository.get_by_id(second.id).tags, ["rock"])
+
+    def test_batch_with_missing_record_raises_error(self):
+        stored = self.repository.get_by_id(self.record.id)
+        del self.collection.documents[self.record.id]
+
+        self.repository.begin_batch()
+        stored.add_tag("jazz")
+        self.repository.update(stored)
+
+        with self.assertRaises(ValueError):
+            self.repository.end_batch()
+
+    def test_unchanged_record_is_not_written(self):
+        stored = self.repository.get_by_id(self.record.id)
+        document = self.document()
+
+        self.repository.begin_batch()
+        self.repository.update(stored)
+        self.repository.end_batch()
+        self.repository.update(stored)
+
+        self.assertEqual(self.collection.bulk_writes, [])
+        self.assertEqual(self.document(), document)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import MagicMock
+
+from bson.binary import Binary
+
+from fake_collection import FakeCollection
+from transcriber_service.application.serialization import (
+    EntityMapperFactory,
+    FastSerializerAdapter,
+)
+from transcriber_service.domain import Storage
+from transcriber_service.infrastructure.repositories import (
+    MongoConnectionProvider,
+    MongoStorageRepository,
+)
+from transcriber_service.infrastructure.serializers import RecordFormatSerializer
+
+
+class TestMongoStorageRepository(unittest.TestCase):
+    def setUp(self):
+        self.collection = FakeCollection()
+        self.connection = MagicMock(spec=MongoConnectionProvider)
+        self.connection.collection.return_value = self.collection
+        self.serializer = FastSerializerAdapter(
+            RecordFormatSerializer(), EntityMapperFactory()
+        )
+        self.repository = MongoStorageRepository(self.serializer, self.connection)
+
+    def add_legacy_storage(self, *record_ids: str) -> Storage:
+        """Insert storage written before record ids were kept in an array."""
+
+        storage = Storage("user_1")
+        for record_id in record_ids:
+            storage.add_audio_record(record_id)
+        self.collection.insert_one(
+            {
+                "_id": storage.id,
+                "user_id": storage.user_id,
+                "data": Binary(self.serializer.serialize(storage)),
+            }
+        )
+        return storage
+
+    def test_add_and_remove_audio_record_change_array(self):
+        storage = Storage("user_1")
+        self.repository.add(storage)
+        data = self.collection.documents[storage.id]["data"]
+
+        self.repository.add_audio_record(storage.id, "record_1")
+        self.repository.add_audio_record(storage.id, "record_2")
+        self.repository.add_audio_record(storage.id, "record_1")
+        self.repository.remove_audio_record(storage.id, "record_1")
+
+        document = self.collection.documents[storage.id]
+        self.assertEqual(document["audio_record_ids"], ["record_2"])
+        self.assertEqual(document["data"], data)
+        self.assertEqual(
+            self.repository.get_by_id(storage.id).audio_record_ids, ["record_2"]
+        )
+
+    def test_change_records_of_missing_storage_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.repository.add_audio_record("missing", "record_1")
+        with self.assertRaises(ValueError):
+            self.repository.remove_audio_record("missing", "record_1")
+
+    def test_add_audio_record_keeps_ids_of_legacy_storage(self):
+        storage = self.add_legacy_storage("record_1", "record_2")
+
+        self.repository.add_audio_record(storage.id, "record_3")
+        self.repository.remove_audio_record(storage.id, "record_1")
+
+        self.assertEqual(
+            self.collection.documents[storage.id]["audio_record_ids"],
+            ["record_2", "record_3"],
+        )
+        self.assertEqual(
+            self.repository.get_by_id(storage.id).audio_record_ids,
+            ["record_2", "record_3"],
+        )
+
+    def test_update_of_record_ids_only_is_not_written(self):
+        storage = Storage("user_1")
+        self.repository.add(storage)
+        self.repository.add_audio_record(storage.id, "record_1")
+        stored = self.repository.get_by_id(storage.id)
+        stored.add_audio_record("record_2")
+        document = self.collection.documents[storage.id]
+
+        self.repository.update(stored)
+        self.repository.begin_batch()
+        self.repository.update(stored)
+        self.repository.end_batch()
+
+        self.assertEqual(self.collection.documents[storage.id], document)
+        self.assertEqual(self.collection.bulk_writes, [])
+
+    def test_update_missing_storage_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.repository.update(Storage("user_1"))
+
+    def test_ensure_indexes_replaces_non_unique_user_index(self):
+        self.collection.create_index("user_id")
+
+        self.repository.ensure_indexes()
+        self.repository.ensure_indexes()
+        self.repository.add(Storage("user_1"))
+
+        self.assertEqual(self.collection.indexes["user_id_1"], (["user_id"], True))
+        with self.assertRaisesRegex(ValueError, "already has a storage"):
+            self.repository.add(Storage("user_1"))
+
+    def test_ensure_indexes_backfills_record_ids(self):
+        storage = self.add_legacy_storage("record_1", "record_2")
+
+        self.repository.ensure_indexes()
+
+        self.assertEqual(
+            self.collection.documents[storage.id]["audio_record_ids"],
+            ["record_1", "record_2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+
+from transcriber_service.domain import AudioRecord
+from transcriber_service.infrastructure.repositories import FileTranscriptStore
+from transcriber_service.infrastructure.repositories.stored_text import (
+    detach_text,
+    sample_texts,
+)
+from transcriber_service.infrastructure.serializers import TextCompressor
+
+
+class TestStoredText(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = FileTranscriptStore(self.temp_dir.name)
+        self.texts = [
+            f"speaker {i}: good morning everyone, let us start the weekly meeting "
+            f"about the project status and the next release number {i}"
+            for i in range(50)
+        ]
+        self.records = []
+        for i, text in enumerate(self.texts):
+            record = AudioRecord(f"name_{i}", f"/path/{i}.mp3", "storage_1", text, "en")
+            self.records.append(detach_text(record, self.store))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sample_texts_loads_stored_transcripts(self):
+        inline = AudioRecord(
+            "inline", "/path/inline.mp3", "storage_1", "old text", "en"
+        )
+        empty = AudioRecord("empty", "/path/empty.mp3", "storage_1", "", "en")
+
+        samples = sample_texts([*self.records[:2], inline, empty], self.store)
+
+        self.assertEqual(self.records[0].text, "")
+        self.assertEqual(samples, [*self.texts[:2], "old text"])
+
+    def test_train_on_stored_transcripts(self):
+        compressor = TextCompressor(threshold=100, algorithm="zlib")
+        text = self.texts[0] + " " + self.texts[1]
+        plain = compressor.compress(text, "en")
+
+        compressor.train("en", sample_texts(self.records, self.store))
+        trained = compressor.compress(text, "en")
+
+        self.assertLess(len(trained), len(plain))
+        self.assertEqual(compressor.decompress(trained), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
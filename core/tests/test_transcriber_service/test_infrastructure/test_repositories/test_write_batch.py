@@ -0,0 +1,69 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.infrastructure.repositories.write_batch import WriteBatch
+
+
+class TestWriteBatch(unittest.TestCase):
+    def setUp(self):
+        self.flush = MagicMock()
+        self.batch = WriteBatch(self.flush, max_size=3)
+
+    def test_coalesces_writes_until_batch_ends(self):
+        self.batch.begin()
+        self.batch.add("1", "first")
+        self.batch.add("2", "second")
+        self.batch.add("1", "third")
+
+        self.assertEqual(self.batch.get("1"), "third")
+        self.flush.assert_not_called()
+
+        self.batch.end()
+
+        self.flush.assert_called_once_with({"2": "second", "1": "third"})
+        self.assertFalse(self.batch.active)
+        self.assertIsNone(self.batch.get("1"))
+
+    def test_nested_batch_flushes_on_outermost_end(self):
+        self.batch.begin()
+        self.batch.begin()
+        self.batch.add("1", "value")
+        self.batch.end()
+
+        self.flush.assert_not_called()
+        self.batch.end()
+        self.flush.assert_called_once_with({"1": "value"})
+
+    def test_flushes_when_max_size_reached(self):
+        self.batch.begin()
+        for key in "123":
+            self.batch.add(key, "value")
+
+        self.flush.assert_called_once()
+        self.assertIsNone(self.batch.get("1"))
+        self.batch.end()
+        self.flush.assert_called_once()
+
+    def test_batches_are_per_thread(self):
+        self.batch.begin()
+        self.batch.add("1", "value")
+
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.update(
+                active=self.batch.active, pending=self.batch.get("1")
+            )
+        )
+        thread.start()
+        thread.join()
+
+        self.assertEqual(result, {"active": False, "pending": None})
+
+    def test_end_without_begin_raises_error(self):
+        with self.assertRaises(RuntimeError):
+            self.batch.end()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+
+from transcriber_service.infrastructure.search import LocalFullTextIndex
+from transcriber_service.infrastructure.search.local_full_text_index import tokenize
+
+
+class TestLocalFullTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index = LocalFullTextIndex(self.temp_dir.name)
+        self.index.index(
+            "record_1",
+            "storage_1",
+            "[SPEAKER_00: 0.0] The quick brown fox jumps over the lazy dog",
+        )
+        self.index.index(
+            "record_2", "storage_1", "[SPEAKER_01: 1.5] A brown dog and a brown fox"
+        )
+        self.index.index("record_3", "storage_1", "Nothing to see here")
+        self.index.index("record_4", "storage_2", "The quick brown fox")
+
+    def tearDown(self):
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def test_empty_index_dir_raises_error(self):
+        with self.assertRaises(ValueError):
+            LocalFullTextIndex("")
+
+    def test_tokenize_skips_speaker_labels(self):
+        self.assertEqual(
+            tokenize("[SPEAKER_00: 1.5] Привет, Ёжик!"), ["привет", "ежик"]
+        )
+
+    def test_search_ranks_by_relevance(self):
+        result = self.index.search("storage_1", "brown")
+
+        self.assertEqual(result, ["record_2", "record_1"])
+
+    def test_search_scoped_by_storage(self):
+        self.assertEqual(self.index.search("storage_2", "fox"), ["record_4"])
+        self.assertEqual(self.index.search("missing", "fox"), [])
+
+    def test_search_phrase(self):
+        self.assertEqual(
+            self.index.search("storage_1", '"brown fox"'), ["record_2", "record_1"]
+        )
+        self.assertEqual(self.index.search("storage_1", '"quick brown"'), ["record_1"])
+        self.assertEqual(self.index.search("storage_1", '"fox brown"'), [])
+
+    def test_search_phrase_with_terms(self):
+        result = self.index.search("storage_1", '"brown dog" lazy')
+
+        self.assertEqual(result, ["record_2"])
+
+    def test_search_limit(self):
+        self.assertEqual(self.index.search("storage_1", "brown", limit=1), ["record_2"])
+
+    def test_search_no_terms(self):
+        self.assertEqual(self.index.search("storage_1", "  ,. "), [])
+
+    def test_reindex_replaces_text(self):
+        self.index.index("record_3", "storage_1", "A lonely fox")
+
+        self.assertIn("record_3", self.index.search("storage_1", "lonely"))
+        self.assertEqual(self.index.search("storage_1", "nothing"), [])
+
+    def test_remove(self):
+        self.index.remove("record_2")
+        self.index.remove("missing")
+
+        self.assertEqual(self.index.search("storage_1", "brown"), ["record_1"])
+        self.assertEqual(len(self.index), 3)
+
+    def test_index_persists_between_instances(self):
+        self.index.remove("record_3")
+        self.index.close()
+
+        other = LocalFullTextIndex(self.temp_dir.name)
+        other.close()
+
+        self.assertEqual(len(other), 3)
+        self.assertEqual(other.search("storage_1", "brown"), ["record_2", "record_1"])
+
+    def test_second_instance_raises_error(self):
+        with self.assertRaises(RuntimeError):
+            LocalFullTextIndex(self.temp_dir.name)
+
+    def test_rebuild_replaces_documents(self):
+        count = self.index.rebuild(
+            [
+                ("record_1", "storage_1", "An old transcript"),
+                ("record_5", "storage_1", "Another old transcript"),
+            ]
+        )
+        self.index.close()
+
+        other = LocalFullTextIndex(self.temp_dir.name)
+        other.close()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(len(other), 2)
+        self.assertEqual(other.search("storage_1", "old"), ["record_1", "record_5"])
+        self.assertEqual(other.search("storage_2", "fox"), [])
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.temp_dir.name, "index.log")), 0
+        )
+
+    def test_compaction_keeps_documents(self):
+        index = LocalFullTextIndex(
+            os.path.join(self.temp_dir.name, "compact"), compact_threshold=2
+        )
+        index.index("record_1", "storage_1", "first text")
+        index.index("record_2", "storage_1", "second text")
+        index.index("record_3", "storage_1", "third text")
+        index.remove("record_1")
+        index.close()
+
+        other = LocalFullTextIndex(os.path.join(self.temp_dir.name, "compact"))
+        other.close()
+
+        self.assertEqual(
+            sorted(other.search("storage_1", "text")), ["record_2", "record_3"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import msgpack
+
+from transcriber_service.infrastructure.serializers import (
+    JsonSerializer,
+    RecordField,
+    RecordFormatSerializer,
+    RecordSchema,
+)
+
+
+class TestRecordFormatSerializer(unittest.TestCase):
+    def setUp(self):
+        self.serializer = RecordFormatSerializer(legacy=JsonSerializer())
+        self.audio = {
+            "entity_type": "audiorecord",
+            "id": "record_1",
+            "record_name": "name",
+            "file_path": "/path/name.mp3",
+            "storage_id": "storage_1",
+            "text": "long text " * 100,
+            "language": "en",
+            "tags": ["first", "second"],
+            "last_updated": "2025-01-01T10:00:00",
+            "status": "done",
+        }
+
+    def test_record_round_trip_with_lazy_text(self):
+        data = self.serializer.serialize(self.audio)
+
+        result = self.serializer.deserialize(data)
+
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(callable(result["text"]))
+        self.assertEqual(result["text"](), self.audio["text"])
+        self.assertEqual({**result, "text": self.audio["text"]}, self.audio)
+
+    def test_metadata_does_not_decode_text(self):
+        data = self.serializer.serialize(self.audio)
+
+        with patch.object(msgpack, "unpackb", wraps=msgpack.unpackb) as unpackb:
+            self.serializer.deserialize(data)
+
+        decoded = b"".join(bytes(call.args[0]) for call in unpackb.call_args_list)
+        self.assertIn(b"storage_1", decoded)
+        self.assertNotIn(b"long text", decoded)
+
+    def test_records_inside_containers(self):
+        user = {
+            "entity_type": "admin",
+            "id": "user_1",
+            "email": "admin@example.com",
+            "password_hash": "hash",
+            "registration_date": "2025-01-01T10:00:00",
+            "last_updated": "2025-01-01T10:00:00",
+            "is_blocked": False,
+            "temp_password_hash": None,
+        }
+
+        result = self.serializer.deserialize(
+            self.serializer.serialize({"users": [user], "count": 1})
+        )
+
+        self.assertEqual(result, {"users": [user], "count": 1})
+
+    def test_reads_legacy_json(self):
+        data = json.dumps({"key": "value"}).encode()
+
+        self.assertEqual(self.serializer.deserialize(data), {"key": "value"})
+
+    def test_without_legacy_unknown_data_raises_error(self):
+        with self.assertRaises(ValueError):
+            RecordFormatSerializer().deserialize(b'{"key": "value"}')
+
+    def test_schema_versions(self):
+        old = RecordFormatSerializer(
+            [
+                RecordSchema(
+                    "storage",
+                    4,
+                    1,
+                    (RecordField(1, "id"), RecordField(2, "owner", "nobody")),
+                )
+            ]
+        )
+        new = RecordFormatSerializer(
+            [
+                RecordSchema(
+                    "storage",
+                    4,
+                    2,
+                    (
+                        RecordField(1, "id"),
+                        RecordField(3, "user_id"),
+                        RecordField(4, "audio_record_ids", ()),
+                    ),
+                    migrations={1: lambda fields: {**fields, "user_id": "migrated"}},
+                )
+            ]
+        )
+        storage = {
+            "entity_type": "storage",
+            "id": "s",
+            "user_id": "u",
+            "audio_record_ids": ["r"],
+        }
+
+        upgraded = new.deserialize(old.serialize({"entity_type": "storage", "id": "s"}))
+        read_by_old = old.deserialize(new.serialize(storage))
+
+        self.assertEqual(
+            upgraded,
+            {
+                "entity_type": "storage",
+                "id": "s",
+                "user_id": "migrated",
+                "audio_record_ids": [],
+            },
+        )
+        self.assertEqual(
+            read_by_old, {"entity_type": "storage", "id": "s", "owner": "nobody"}
+        )
+
+    def test_missing_required_field_raises_error(self):
+        del self.audio["id"]
+
+        with self.assertRaises(ValueError):
+            self.serializer.deserialize(self.serializer.serialize(self.audio))
+
+
+if __name__ == "__main__":
+    unittest.main()
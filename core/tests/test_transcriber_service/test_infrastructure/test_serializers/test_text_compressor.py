@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from transcriber_service.infrastructure.serializers import (
+    RecordFormatSerializer,
+    TextCompressor,
+)
+
+
+class TestTextCompressor(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.compressor = TextCompressor(
+            threshold=100, dictionary_dir=self.temp_dir.name, algorithm="zlib"
+        )
+        self.samples = [
+            f"speaker {i}: good morning everyone, let us start the weekly meeting "
+            f"about the project status and the next release number {i}"
+            for i in range(50)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_short_text_is_kept_raw(self):
+        self.assertIsNone(self.compressor.compress("short text", "en"))
+
+    def test_round_trip(self):
+        text = "hello world " * 100
+
+        payload = self.compressor.compress(text, "en")
+
+        self.assertLess(len(payload), len(text))
+        self.assertEqual(self.compressor.decompress(payload), text)
+
+    def test_dictionary_improves_compression(self):
+        text = self.samples[0] + " " + self.samples[1]
+        plain = self.compressor.compress(text, "en")
+
+        self.compressor.train("en", self.samples)
+        trained = self.compressor.compress(text, "en")
+
+        self.assertLess(len(trained), len(plain))
+        self.assertEqual(self.compressor.decompress(trained), text)
+        self.assertEqual(len(self.compressor.compress(text, "ru")), len(plain))
+
+    def test_saved_dictionaries_are_loaded(self):
+        text = self.samples[0] + " " + self.samples[1]
+        self.compressor.train("en", self.samples)
+        payload = self.compressor.compress(text, "en")
+
+        reopened = TextCompressor(threshold=100, dictionary_dir=self.temp_dir.name)
+
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+        self.assertEqual(reopened.decompress(payload), text)
+
+    def test_unknown_dictionary_raises_error(self):
+        self.compressor.train("en", self.samples)
+        payload = self.compressor.compress(self.samples[0] * 2, "en")
+
+        with self.assertRaises(ValueError):
+            TextCompressor(algorithm="zlib").decompress(payload)
+
+    def test_disabled_compression_still_reads(self):
+        payload = self.compressor.compress("hello world " * 100)
+        reader = TextCompressor(threshold=None, algorithm="zlib")
+
+        self.assertIsNone(reader.compress("hello world " * 100))
+        self.assertEqual(reader.decompress(payload), "hello world " * 100)
+
+    def test_record_text_is_compressed(self):
+        serializer = RecordFormatSerializer(compressor=self.compressor)
+        record = {
+            "entity_type": "audiorecord",
+            "id": "record_1",
+            "record_name": "name",
+            "file_path": "/path/name.mp3",
+            "storage_id": "storage_1",
+            "text": "hello world " * 100,
+            "language": "en",
+            "tags": [],
+            "last_updated": "2025-01-01T10:00:00",
+            "status": "done",
+        }
+
+        data = serializer.serialize(record)
+        result = serializer.deserialize(data)
+
+        self.assertLess(len(data), len(record["text"]))
+        self.assertEqual(result["text"](), record["text"])
+        with self.assertRaises(ValueError):
+            RecordFormatSerializer().deserialize(data)["text"]()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from transcriber_service.domain.interfaces import ITranscriber
+from transcriber_service.infrastructure.services.caching_transcriber import (
+    CachingTranscriber,
+)
+
+
+class TestCachingTranscriber(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.transcriber = MagicMock(spec=ITranscriber)
+        self.transcriber.transcribe.return_value = ("text", "en")
+        self.cache = CachingTranscriber(self.transcriber, self.temp_dir.name, "medium")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_empty_cache_dir_raises_error(self):
+        with self.assertRaises(ValueError):
+            CachingTranscriber(self.transcriber, "")
+
+    def test_invalid_max_entries_raises_error(self):
+        with self.assertRaises(ValueError):
+            CachingTranscriber(self.transcriber, self.temp_dir.name, max_entries=0)
+
+    def test_hit_skips_inference(self):
+        first = self.cache.transcribe(b"audio", "en", 2, "meeting")
+        second = self.cache.transcribe(b"audio", "en", 2, "meeting")
+
+        self.assertEqual(first, ("text", "en"))
+        self.assertEqual(second, ("text", "en"))
+        self.transcriber.transcribe.assert_called_once_with(
+            b"audio", "en", 2, "meeting"
+        )
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_different_options_miss(self):
+        self.cache.transcribe(b"audio", "en", 2, None)
+        self.cache.transcribe(b"audio", "ru", 2, None)
+        self.cache.transcribe(b"audio", "en", 3, None)
+        self.cache.transcribe(b"other", "en", 2, None)
+
+        self.assertEqual(self.transcriber.transcribe.call_count, 4)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_different_model_misses(self):
+        self.cache.transcribe(b"audio", None, None, None)
+        other = CachingTranscriber(self.transcriber, self.temp_dir.name, "large")
+
+        other.transcribe(b"audio", None, None, None)
+
+        self.assertEqual(self.transcriber.transcribe.call_count, 2)
+
+    def test_cache_persists_between_instances(self):
+        self.cache.transcribe(b"audio", None, None, None)
+        other = CachingTranscriber(self.transcriber, self.temp_dir.name, "medium")
+
+        result = other.transcribe(b"audio", None, None, None)
+
+        self.assertEqual(result, ("text", "en"))
+        self.transcriber.transcribe.assert_called_once()
+        self.assertEqual(other.hits, 1)
+
+    def test_lru_eviction_by_entries(self):
+        cache = CachingTranscriber(self.transcriber, self.temp_dir.name, max_entries=2)
+        cache.transcribe(b"a", None, None, None)
+        cache.transcribe(b"b", None, None, None)
+        cache.transcribe(b"a", None, None, None)
+        cache.transcribe(b"c", None, None, None)
+
+        cache.transcribe(b"a", None, None, None)
+        cache.transcribe(b"b", None, None, None)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 4)
+
+    def test_eviction_by_size(self):
+        cache = CachingTranscriber(self.transcriber, self.temp_dir.name, max_size=100)
+        cache.transcribe(b"a", None, None, None)
+        entry_size = cache.size
+        cache.transcribe(b"b", None, None, None)
+        cache.transcribe(b"c", None, None, None)
+
+        self.assertLessEqual(cache.size, 100)
+        self.assertEqual(len(cache), 100 // entry_size)
+
+    def test_transcribe_file_shares_cache_with_content(self):
+        file_path = os.path.join(self.temp_dir.name, "test.mp3")
+        with open(file_path, "wb") as f:
+            f.write(b"audio")
+        self.cache.transcribe(b"audio", "en", None, None)
+
+        result = self.cache.transcribe_file(file_path, "en", None, None)
+
+        self.assertEqual(result, ("text", "en"))
+        self.transcriber.transcribe_file.assert_not_called()
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_transcribe_file_miss_delegates_file(self):
+        file_path = os.path.join(self.temp_dir.name, "test.mp3")
+        with open(file_path, "wb") as f:
+            f.write(b"audio")
+        self.transcriber.transcribe_file.return_value = ("file_text", "ru")
+
+        result = self.cache.transcribe_file(file_path, None, None, None)
+
+        self.assertEqual(result, ("file_text", "ru"))
+        self.transcriber.transcribe_file.assert_called_once_with(
+            file_path, None, None, None
+        )
+        self.transcriber.transcribe.assert_not_called()
+
+    def test_inference_error_not_cached(self):
+        self.transcriber.transcribe.side_effect = RuntimeError("model error")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.transcribe(b"audio", None, None, None)
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.transcribe(b"audio", None, None, None)
+
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+        self.assertEqual(self.cache.misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
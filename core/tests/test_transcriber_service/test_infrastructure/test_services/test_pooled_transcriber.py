@@ -0,0 +1,138 @@
+import os
+import signal
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from transcriber_service.domain.interfaces import ITranscriber
+from transcriber_service.infrastructure.services.pooled_transcriber import (
+    PooledTranscriber,
+)
+
+
+class FakeTranscriber(ITranscriber):
+    def __init__(self):
+        self.pid = os.getpid()
+
+    def transcribe(self, content, language, max_speakers, main_theme):
+        if content == b"crash":
+            os._exit(1)
+        return f"{bytes(content).decode()}:{self.pid}", language or "en"
+
+
+class LoggingTranscriber(FakeTranscriber):
+    def __init__(self, log_path: str):
+        super().__init__()
+        with open(log_path, "a") as f:
+            f.write(f"{self.pid}\n")
+
+
+class TestPooledTranscriber(unittest.TestCase):
+    def test_invalid_pool_size_raises_error(self):
+        with self.assertRaises(ValueError):
+            PooledTranscriber(FakeTranscriber, pool_size=-1)
+
+    def test_invalid_max_jobs_per_worker_raises_error(self):
+        with self.assertRaises(ValueError):
+            PooledTranscriber(FakeTranscriber, pool_size=1, max_jobs_per_worker=0)
+
+    def test_transcribe_in_worker_process(self):
+        transcriber = PooledTranscriber(FakeTranscriber, pool_size=1)
+        try:
+            text, language = transcriber.transcribe(b"audio", "ru", None, None)
+        finally:
+            transcriber.close()
+
+        content, pid = text.split(":")
+        self.assertEqual(content, "audio")
+        self.assertNotEqual(int(pid), os.getpid())
+        self.assertEqual(language, "ru")
+
+    def test_transcribe_file_in_worker_process(self):
+        transcriber = PooledTranscriber(FakeTranscriber, pool_size=1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.mp3")
+            with open(file_path, "wb") as f:
+                f.write(b"audio")
+            try:
+                text, _ = transcriber.transcribe_file(file_path, None, None, None)
+            finally:
+                transcriber.close()
+
+        self.assertEqual(text.split(":")[0], "audio")
+
+    def test_worker_reused_between_jobs(self):
+        transcriber = PooledTranscriber(FakeTranscriber, pool_size=1)
+        try:
+            first, _ = transcriber.transcribe(b"a", None, None, None)
+            second, _ = transcriber.transcribe(b"b", None, None, None)
+        finally:
+            transcriber.close()
+
+        self.assertEqual(first.split(":")[1], second.split(":")[1])
+
+    def test_worker_recycled_after_max_jobs(self):
+        transcriber = PooledTranscriber(
+            FakeTranscriber, pool_size=1, max_jobs_per_worker=1, preload=False
+        )
+        try:
+            first, _ = transcriber.transcribe(b"a", None, None, None)
+            second, _ = transcriber.transcribe(b"b", None, None, None)
+        finally:
+            transcriber.close()
+
+        self.assertNotEqual(first.split(":")[1], second.split(":")[1])
+
+    def test_killed_worker_is_replaced(self):
+        transcriber = PooledTranscriber(FakeTranscriber, pool_size=1)
+        try:
+            text, _ = transcriber.transcribe(b"a", None, None, None)
+            first_pid = int(text.split(":")[1])
+            os.kill(first_pid, signal.SIGKILL)
+
+            text, _ = transcriber.transcribe(b"b", None, None, None)
+        finally:
+            transcriber.close()
+
+        content, pid = text.split(":")
+        self.assertEqual(content, "b")
+        self.assertNotEqual(int(pid), first_pid)
+
+    def test_job_killing_workers_raises_error(self):
+        transcriber = PooledTranscriber(FakeTranscriber, pool_size=1)
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                transcriber.transcribe(b"crash", None, None, None)
+
+            text, _ = transcriber.transcribe(b"audio", None, None, None)
+        finally:
+            transcriber.close()
+
+        self.assertEqual(text.split(":")[0], "audio")
+
+    def test_warm_up_is_not_counted_as_job(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, "loads.log")
+            transcriber = PooledTranscriber(
+                partial(LoggingTranscriber, log_path),
+                pool_size=1,
+                max_jobs_per_worker=1,
+            )
+            try:
+                with open(log_path) as f:
+                    warmed = f.read().split()
+                first, _ = transcriber.transcribe(b"a", None, None, None)
+                second, _ = transcriber.transcribe(b"b", None, None, None)
+            finally:
+                transcriber.close()
+            with open(log_path) as f:
+                loaded = f.read().split()
+
+        self.assertEqual(warmed, [first.split(":")[1]])
+        self.assertIn(second.split(":")[1], loaded[1:])
+        self.assertNotEqual(first.split(":")[1], second.split(":")[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
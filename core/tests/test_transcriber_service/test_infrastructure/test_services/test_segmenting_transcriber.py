@@ -0,0 +1,159 @@
+import os
+import tempfile
+import threading
+import unittest
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import soundfile as sf
+
+from transcriber_service.domain.interfaces import ITranscriber
+from transcriber_service.infrastructure.services.segmenting_transcriber import (
+    SegmentingTranscriber,
+)
+
+SAMPLE_RATE = 1000
+
+
+def make_audio(duration: float, silences: list[tuple[float, float]]) -> np.ndarray:
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = 0.5 * np.sin(2 * np.pi * 50 * t)
+    for start, end in silences:
+        audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)] = 0
+    return audio.reshape(-1, 1)
+
+
+def to_wav(audio: np.ndarray) -> bytes:
+    stream = BytesIO()
+    sf.write(stream, audio, SAMPLE_RATE, format="WAV")
+    return stream.getvalue()
+
+
+def open_pipe(content: bytes) -> sf.SoundFile:
+    """Open content as audio read from a pipe, which cannot be seeked."""
+
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, "wb") as f:
+            f.write(content)
+
+    threading.Thread(target=write, daemon=True).start()
+    return sf.SoundFile(read_fd)
+
+
+class TestSegmentingTranscriber(unittest.TestCase):
+    def setUp(self):
+        self.inner = MagicMock(spec=ITranscriber)
+        self.transcriber = SegmentingTranscriber(
+            self.inner, segment_duration=4, overlap=0.5, search_window=1
+        )
+
+    def test_invalid_arguments_raise_error(self):
+        with self.assertRaises(ValueError):
+            SegmentingTranscriber(self.inner, segment_duration=0)
+        with self.assertRaises(ValueError):
+            SegmentingTranscriber(self.inner, segment_duration=4, overlap=2)
+        with self.assertRaises(ValueError):
+            SegmentingTranscriber(self.inner, workers=0)
+
+    def test_short_audio_passes_through(self):
+        content = to_wav(make_audio(3, []))
+        self.inner.transcribe.return_value = ("text", "en")
+
+        result = self.transcriber.transcribe(content, "en", 2, "meeting")
+
+        self.assertEqual(result, ("text", "en"))
+        self.inner.transcribe.assert_called_once_with(content, "en", 2, "meeting")
+
+    def test_short_file_passes_through(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.wav")
+            sf.write(file_path, make_audio(3, []), SAMPLE_RATE)
+            self.inner.transcribe_file.return_value = ("text", "en")
+
+            result = self.transcriber.transcribe_file(file_path, None, None, None)
+
+        self.assertEqual(result, ("text", "en"))
+        self.inner.transcribe.assert_not_called()
+
+    def test_split_cuts_at_silence(self):
+        audio = make_audio(9, [(4.6, 4.8)])
+
+        with sf.SoundFile(BytesIO(to_wav(audio))) as source:
+            chunks = self.transcriber.split(source)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertAlmostEqual(chunks[0][1] / SAMPLE_RATE, 4.6, delta=0.02)
+        self.assertEqual(chunks[1][1], len(audio))
+
+    def test_transcribe_stitches_chunks(self):
+        audio = make_audio(9, [(4.6, 4.8)])
+        self.inner.transcribe.side_effect = [
+            ("[SPEAKER_00: 0.5] first\n\n[SPEAKER_01: 4.8] overlap", "en"),
+            ("[SPEAKER_00: 0.1] overlap\n\n[SPEAKER_01: 1.0] second", "en"),
+        ]
+
+        text, language = self.transcriber.transcribe(to_wav(audio), None, 2, None)
+
+        self.assertEqual(self.inner.transcribe.call_count, 2)
+        self.assertEqual(text, "[SPEAKER_00: 0.5] first\n\n[SPEAKER_01: 5.1] second")
+        self.assertEqual(language, "en")
+
+    def test_chunks_include_overlap(self):
+        audio = make_audio(9, [(4.6, 4.8)])
+        self.inner.transcribe.return_value = ("", "en")
+
+        self.transcriber.transcribe(to_wav(audio), None, None, None)
+
+        durations = [
+            sf.info(BytesIO(call.args[0])).duration
+            for call in self.inner.transcribe.call_args_list
+        ]
+        self.assertAlmostEqual(durations[0], 5.1, delta=0.02)
+        self.assertAlmostEqual(durations[1], 4.9, delta=0.02)
+
+    def test_long_file_read_in_chunks(self):
+        audio = make_audio(9, [(4.6, 4.8)])
+        self.inner.transcribe.return_value = ("", "en")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.wav")
+            sf.write(file_path, audio, SAMPLE_RATE)
+
+            with patch.object(sf, "read", side_effect=AssertionError):
+                self.transcriber.transcribe_file(file_path, None, None, None)
+
+        self.assertEqual(self.inner.transcribe.call_count, 2)
+        self.inner.transcribe_file.assert_not_called()
+        first = sf.read(BytesIO(self.inner.transcribe.call_args_list[0].args[0]))[0]
+        np.testing.assert_allclose(first, audio[:5100, 0], atol=1e-4)
+
+    def test_not_seekable_audio_read_sequentially(self):
+        content = to_wav(make_audio(13, [(4.6, 4.8), (8.6, 8.8)]))
+        with sf.SoundFile(BytesIO(content)) as source:
+            expected = list(self.transcriber.read_chunks(source))
+
+        with open_pipe(content) as source:
+            self.assertFalse(source.seekable())
+            with patch.object(source, "seek", side_effect=AssertionError):
+                chunks = list(self.transcriber.read_chunks(source))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(
+            [bounds for bounds, _ in chunks], [bounds for bounds, _ in expected]
+        )
+        for (_, samples), (_, expected_samples) in zip(chunks, expected):
+            np.testing.assert_array_equal(samples, expected_samples)
+
+    def test_language_is_most_common(self):
+        audio = make_audio(13, [(4.6, 4.8), (8.6, 8.8)])
+        self.inner.transcribe.side_effect = [("", "ru"), ("", "en"), ("", "ru")]
+
+        _, language = self.transcriber.transcribe(to_wav(audio), None, None, None)
+
+        self.assertEqual(language, "ru")
+
+
+if __name__ == "__main__":
+    unittest.main()
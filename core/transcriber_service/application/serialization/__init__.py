@@ -1,10 +1,17 @@
 from .audio_mapper import *
+from .entity_codecs import *
 from .entity_mapper_factory import *
+from .fast_serializer_adapter import *
 from .serializer_adapter import *
 from .storage_mapper import *
 from .user_mapper import *
 
 __all__ = [
+    "AudioRecordCodec",
+    "EntityCodec",
     "EntityMapperFactory",
+    "FastSerializerAdapter",
     "SerializerAdapter",
+    "StorageCodec",
+    "UserCodec",
 ]
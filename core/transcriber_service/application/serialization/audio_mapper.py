@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from .dto.audio_record_dto import AudioRecordDTO
+from .dto.audio_record_dto import AudioRecordDTO, AudioRecordSummaryDTO
+from ...domain import AudioRecordSummary
 from ...domain.factories import AudioRecordFactory, IAudioRecordFactory
 from ...domain.interfaces import IMapper, IAudioRecord
 
@@ -23,6 +24,19 @@ class AudioRecordMapper(IMapper):
             language=audio.language,
             tags=audio.tags,
             last_updated=audio.last_updated.isoformat(),
+            status=audio.status,
+        )
+
+    @staticmethod
+    def to_summary_dto(summary: AudioRecordSummary) -> AudioRecordSummaryDTO:
+        return AudioRecordSummaryDTO(
+            id=summary.id,
+            record_name=summary.record_name,
+            storage_id=summary.storage_id,
+            language=summary.language,
+            tags=summary.tags,
+            last_updated=summary.last_updated.isoformat(),
+            status=summary.status,
         )
 
     def from_dto(self, dto: AudioRecordDTO) -> IAudioRecord:
@@ -34,8 +48,10 @@ class AudioRecordMapper(IMapper):
             language=dto.language or "",
         )
         audio.id = dto.id
+        audio.status = dto.status
         audio.last_updated = datetime.fromisoformat(dto.last_updated)
         for tag in dto.tags:
             audio.add_tag(tag, False)
+        audio.mark_clean()
 
         return audio
@@ -3,4 +3,4 @@ from .storage_dto import *
 from .user_dto import *
 
 
-__all__ = ["UserDTO", "StorageDTO", "AudioRecordDTO"]
+__all__ = ["UserDTO", "StorageDTO", "AudioRecordDTO", "AudioRecordSummaryDTO"]
@@ -11,6 +11,20 @@ class AudioRecordDTO(BaseModel):
     language: str | None = None
     tags: list[str]
     last_updated: str
+    status: str = Field("done", pattern="^(pending|running|done|failed)$")
+
+    class Config:
+        from_attributes = True
+
+
+class AudioRecordSummaryDTO(BaseModel):
+    id: str
+    record_name: str
+    storage_id: str
+    language: str | None = None
+    tags: list[str]
+    last_updated: str
+    status: str = Field("done", pattern="^(pending|running|done|failed)$")
 
     class Config:
         from_attributes = True
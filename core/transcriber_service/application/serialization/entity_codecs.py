@@ -0,0 +1,124 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from ...domain import Admin, AudioRecord, AuthUser, Storage, TranscriptionStatus
+
+
+class EntityCodec(ABC):
+    """
+    Fast path between an entity and its DTO dictionary.
+
+    Produces and reads the same dictionaries as mappers and DTOs, but
+    without building pydantic models, so it must only be used for data
+    written by the application itself. Decoding restores entity state
+    directly instead of calling constructors and setters, which would
+    generate ids and touch last_updated only to be overwritten.
+    """
+
+    entity_types: tuple[str, ...] = ()
+    entity_classes: tuple[type, ...] = ()
+
+    @abstractmethod
+    def encode(self, entity) -> dict:
+        """
+        Convert the entity to a DTO dictionary.
+
+        :param entity: Entity of one of entity_classes.
+        :return: Dictionary equal to model_dump of the entity DTO.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: dict):
+        """
+        Restore an entity from a trusted DTO dictionary.
+
+        :param data: Dictionary with entity_type of one of entity_types.
+        :return: Entity instance.
+        :raise KeyError: If a required field is missing.
+        """
+        pass
+
+
+class AudioRecordCodec(EntityCodec):
+    entity_types = ("audiorecord",)
+    entity_classes = (AudioRecord,)
+
+    def encode(self, audio: AudioRecord) -> dict:
+        return {
+            "entity_type": "audiorecord",
+            "id": audio.id,
+            "record_name": audio.record_name,
+            "file_path": audio.file_path,
+            "storage_id": audio.storage_id,
+            "text": audio.text,
+            "language": audio.language,
+            "tags": audio.tags,
+            "last_updated": audio.last_updated.isoformat(),
+            "status": audio.status.value,
+        }
+
+    def decode(self, data: dict) -> AudioRecord:
+        audio = AudioRecord.__new__(AudioRecord)
+        audio._id = data["id"]
+        audio._record_name = data["record_name"]
+        audio._file_path = data["file_path"]
+        audio._storage_id = data["storage_id"]
+        audio._text = data.get("text") or ""
+        audio._language = data.get("language") or ""
+        audio._tags = list(data["tags"])
+        audio._last_updated = datetime.fromisoformat(data["last_updated"])
+        audio._status = TranscriptionStatus(data.get("status", "done"))
+        audio.mark_clean()
+        return audio
+
+
+class UserCodec(EntityCodec):
+    entity_types = ("authuser", "admin")
+    entity_classes = (AuthUser, Admin)
+
+    def encode(self, user: AuthUser) -> dict:
+        return {
+            "entity_type": "admin" if isinstance(user, Admin) else "authuser",
+            "id": user.id,
+            "email": user.email,
+            "password_hash": user.password_hash,
+            "registration_date": user.registration_date.isoformat(),
+            "last_updated": user.last_updated.isoformat(),
+            "is_blocked": user.is_blocked,
+            "temp_password_hash": user.temp_password_hash,
+        }
+
+    def decode(self, data: dict) -> AuthUser:
+        cls = Admin if data["entity_type"] == "admin" else AuthUser
+        user = cls.__new__(cls)
+        user._id = data["id"]
+        user._email = data["email"]
+        user._password_hash = data["password_hash"]
+        user._temp_password_hash = data.get("temp_password_hash") or None
+        user._registration_date = datetime.fromisoformat(data["registration_date"])
+        user._last_updated = datetime.fromisoformat(data["last_updated"])
+        user._is_blocked = data["is_blocked"]
+        user.mark_clean()
+        return user
+
+
+class StorageCodec(EntityCodec):
+    entity_types = ("storage",)
+    entity_classes = (Storage,)
+
+    def encode(self, storage: Storage) -> dict:
+        return {
+            "entity_type": "storage",
+            "id": storage.id,
+            "user_id": storage.user_id,
+            "audio_record_ids": storage.audio_record_ids,
+        }
+
+    def decode(self, data: dict) -> Storage:
+        storage = Storage.__new__(Storage)
+        storage._id = data["id"]
+        storage._user_id = data["user_id"]
+        storage._audio_record_ids = list(data["audio_record_ids"])
+        storage.mark_clean()
+        return storage
@@ -0,0 +1,62 @@
+from typing import Any
+
+from .entity_codecs import AudioRecordCodec, EntityCodec, StorageCodec, UserCodec
+from .entity_mapper_factory import EntityMapperFactory
+from .serializer_adapter import SerializerAdapter
+from ...domain.interfaces import ISerializer
+
+
+class FastSerializerAdapter(SerializerAdapter):
+    def __init__(
+        self,
+        base_serializer: ISerializer,
+        entity_mapper_factory: EntityMapperFactory,
+        codecs: list[EntityCodec] | None = None,
+        validate: bool = False,
+    ):
+        """
+        Serializer adapter that converts known entities with codecs instead
+        of mappers and pydantic DTOs. Output is the same as of
+        SerializerAdapter, so both read data written by each other.
+        Entities without a codec fall back to mappers.
+
+        :param base_serializer: Serializer of plain data (JSON, msgpack).
+        :param entity_mapper_factory: Mappers of entities without a codec.
+        :param codecs: Entity codecs, audio record, user and storage if None.
+        :param validate: Validate decoded data against DTOs before decoding.
+        Enable it when data comes from outside of the application. Lazy
+        fields are loaded to be validated.
+        """
+
+        super().__init__(base_serializer, entity_mapper_factory)
+        if codecs is None:
+            codecs = [AudioRecordCodec(), UserCodec(), StorageCodec()]
+
+        self._validate = validate
+        self._encoders: dict[type, EntityCodec] = {}
+        self._decoders: dict[str, EntityCodec] = {}
+        for codec in codecs:
+            for cls in codec.entity_classes:
+                self._encoders[cls] = codec
+            for entity_type in codec.entity_types:
+                self._decoders[entity_type] = codec
+
+    def _to_dto(self, obj):
+        codec = self._encoders.get(type(obj))
+        if codec is not None:
+            return codec.encode(obj)
+        if type(obj) is list:
+            return [self._to_dto(item) for item in obj]
+        return super()._to_dto(obj)
+
+    def _from_dto(self, data: Any) -> Any:
+        if type(data) is dict:
+            codec = self._decoders.get(data.get("entity_type"))
+            if codec is not None:
+                if self._validate:
+                    dto_class = self._dto_mapping[data["entity_type"]]
+                    data = dto_class(**self._resolve(data)).model_dump()
+                return codec.decode(data)
+        elif type(data) is list:
+            return [self._from_dto(item) for item in data]
+        return super()._from_dto(data)
@@ -70,13 +70,24 @@ class SerializerAdapter(ISerializer):
         elif isinstance(data, dict) and "entity_type" in data:
             dto_class = self._dto_mapping.get(data["entity_type"])
             if dto_class:
-                dto = dto_class(**data)
+                dto = dto_class(**self._resolve(data))
                 serializer = self._entity_mapper_factory.get_mapper(data["entity_type"])
                 return serializer.from_dto(dto)
         elif isinstance(data, dict):
             return {key: self._from_dto(value) for key, value in data.items()}
         return data
 
+    @staticmethod
+    def _resolve(data: dict) -> dict:
+        """
+        Call loaders of lazily restored fields (e.g. audio record text of
+        RecordFormatSerializer), so data can be validated against a DTO.
+        """
+
+        return {
+            key: value() if callable(value) else value for key, value in data.items()
+        }
+
     @property
     def extension(self) -> str:
         return self._base_serializer.extension
@@ -23,5 +23,6 @@ class StorageMapper(IMapper):
         storage.id = dto.id
         for record_id in dto.audio_record_ids:
             storage.add_audio_record(record_id)
+        storage.mark_clean()
 
         return storage
@@ -44,5 +44,6 @@ class UserMapper(IMapper):
         user.id = dto.id
         user.last_updated = datetime.fromisoformat(dto.last_updated)
         user.registration_date = datetime.fromisoformat(dto.registration_date)
+        user.mark_clean()
 
         return user
@@ -1,6 +1,8 @@
 from .audio_service import *
 from .auth_service import *
 from .storage_service import *
+from .transcription_service import *
+from .unit_of_work import *
 from .user_service import *
 
 __all__ = [
@@ -10,4 +12,7 @@ __all__ = [
     "AudioTagService",
     "AudioTextService",
     "StorageService",
+    "TextIndexService",
+    "TranscriptionJobService",
+    "UnitOfWork",
 ]
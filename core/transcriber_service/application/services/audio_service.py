@@ -1,17 +1,26 @@
+import base64
+import json
 import logging
+import os
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
 
 from ..serialization.audio_mapper import (
     AudioRecordDTO,
     AudioRecordMapper,
+    AudioRecordSummaryDTO,
 )
+from ...domain import AudioRecordSummary, TranscriptionJob, TranscriptionStatus
 from ...domain.factories import IAudioRecordFactory, AudioRecordFactory
 from ...domain.interfaces import (
+    IAudioRecord,
     IAudioRepository,
+    IFullTextIndex,
     ITextExporter,
     IStopwordsRemover,
     ITranscriber,
+    ITranscriptionQueue,
 )
-from ...domain.services.audio_search_service import AudioSearchService
 
 logger = logging.getLogger(__name__)
 
@@ -21,21 +30,32 @@ class AudioRecordService(object):
     Service class for managing audio records and their lifecycle operations.
 
     Provides functionality to create and retrieve audio records with optional
-    transcription processing.
+    transcription processing. If a transcription queue is given, records are
+    created as pending and transcribed in background by queue workers.
     """
 
     def __init__(
         self,
         repo: IAudioRepository,
         transcriber: ITranscriber,
+        transcription_queue: ITranscriptionQueue | None = None,
+        max_size: int = 1024 * 1024 * 10,
+        text_index: IFullTextIndex | None = None,
     ):
-        self._MAX_SIZE = 1024 * 1024 * 10
+        self._MAX_SIZE = max_size
         self._repository = repo
         self._transcriber = transcriber
+        self._transcription_queue = transcription_queue
+        self._text_index = text_index
         self._audio_factory: IAudioRecordFactory = AudioRecordFactory()
-        self._search_service = AudioSearchService()
         self.mapper = AudioRecordMapper()
 
+    @property
+    def max_size(self) -> int:
+        """Max size of audio file in bytes."""
+
+        return self._MAX_SIZE
+
     def create_audio(
         self,
         file_name: str,
@@ -48,7 +68,8 @@ class AudioRecordService(object):
     ) -> AudioRecordDTO:
         """
         Create AudioRecord instance with basic metadata and do transcription
-        into text with given transcribe services.
+        into text with given transcribe services. With a transcription queue
+        the record is returned as pending and transcribed later.
 
         :param file_name: Name of audio file.
         :param content: Content of audio file (mp3).
@@ -63,6 +84,11 @@ class AudioRecordService(object):
 
         if len(content) > self._MAX_SIZE:
             raise Exception("Audio file too large.")
+        if self._transcription_queue:
+            return self._enqueue_audio(
+                file_name, file_path, storage_id, language, max_speakers, main_theme
+            )
+
         text, language = self._transcriber.transcribe(
             content, language, max_speakers, main_theme
         )
@@ -70,38 +96,255 @@ class AudioRecordService(object):
             file_name, file_path, storage_id, text, language
         )
         self._repository.add(audio)
+        if self._text_index:
+            self._text_index.index(audio.id, storage_id, text)
         return self.mapper.to_dto(audio)
 
-    def get_records(self, storage_id: str) -> tuple[AudioRecordDTO, ...]:
+    def create_audio_from_file(
+        self,
+        file_name: str,
+        file_path: str,
+        storage_id: str,
+        language: str = None,
+        max_speakers: int = None,
+        main_theme: str = None,
+    ) -> AudioRecordDTO:
+        """
+        Create AudioRecord from an already saved audio file. Unlike
+        create_audio the file content is never loaded into memory here, the
+        transcriber reads it from file_path.
+
+        :param file_name: Name of audio file.
+        :param file_path: Full path to saved audio file.
+        :param storage_id: Storage id of audio file.
+        :param language: Language of audio file (defaults None).
+        :param max_speakers: Max number of speakers (defaults None).
+        :param main_theme: Main theme of audio file (defaults None).
+        :return: Created Audio Record.
+        """
+
+        if os.path.getsize(file_path) > self._MAX_SIZE:
+            raise Exception("Audio file too large.")
+        if self._transcription_queue:
+            return self._enqueue_audio(
+                file_name, file_path, storage_id, language, max_speakers, main_theme
+            )
+
+        text, language = self._transcriber.transcribe_file(
+            file_path, language, max_speakers, main_theme
+        )
+        audio = self._audio_factory.create_audio(
+            file_name, file_path, storage_id, text, language
+        )
+        self._repository.add(audio)
+        if self._text_index:
+            self._text_index.index(audio.id, storage_id, text)
+        return self.mapper.to_dto(audio)
+
+    def _enqueue_audio(
+        self,
+        file_name: str,
+        file_path: str,
+        storage_id: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> AudioRecordDTO:
+        audio = self._audio_factory.create_audio(
+            file_name, file_path, storage_id, "", language or ""
+        )
+        audio.status = TranscriptionStatus.PENDING
+        self._repository.add(audio)
+
+        job = TranscriptionJob(audio.id, file_path, language, max_speakers, main_theme)
+        self._transcription_queue.enqueue(job)
+        logger.info(f"Transcription job {job.id} queued for record {audio.id}")
+
+        return self.mapper.to_dto(audio)
+
+    def get_status(self, record_id: str) -> TranscriptionStatus:
+        """
+        Return transcription status of audio record.
+
+        :raise ValueError: If record does not exist.
+        """
+
+        record = self._repository.get_by_id(record_id)
+        if not record:
+            raise ValueError("Record not found")
+
+        return record.status
+
+    def get_records(
+        self, storage_id: str, offset: int = 0, limit: int | None = None
+    ) -> tuple[AudioRecordDTO, ...]:
         """
         Retrieves audio record by its storage container ID.
 
         :param storage_id: Storage id of audio file.
+        :param offset: Number of records to skip (defaults 0).
+        :param limit: Max number of records (defaults None, no limit).
         :return: Tuple of audio records if it is found else None.
         """
-        records = self._repository.get_by_storage(storage_id)
+        records = self._repository.get_by_storage(storage_id, offset, limit)
         return tuple(self.mapper.to_dto(record) for record in records)
 
+    def get_records_page(
+        self, storage_id: str, limit: int, cursor: str | None = None
+    ) -> tuple[tuple[AudioRecordDTO, ...], str | None]:
+        """
+        Retrieves one page of storage records, most recently updated first.
+
+        :param storage_id: Storage id of audio file.
+        :param limit: Page size.
+        :param cursor: Cursor returned with previous page (defaults None, first page).
+        :return: Page records and cursor of the next page (None if it is the last one).
+        :raise ValueError: If limit is not positive or cursor is invalid.
+        """
+
+        records, next_cursor = self._get_page(
+            self._repository.get_page_by_storage, storage_id, limit, cursor
+        )
+        return tuple(self.mapper.to_dto(record) for record in records), next_cursor
+
+    def get_summaries_page(
+        self, storage_id: str, limit: int, cursor: str | None = None
+    ) -> tuple[tuple[AudioRecordSummaryDTO, ...], str | None]:
+        """
+        Same as get_records_page, but returns record summaries without
+        transcript text. Use it for record lists.
+        """
+
+        summaries, next_cursor = self._get_page(
+            self._repository.get_summaries_by_storage, storage_id, limit, cursor
+        )
+        return (
+            tuple(self.mapper.to_summary_dto(summary) for summary in summaries),
+            next_cursor,
+        )
+
     def get_by_id(self, record_id: str) -> AudioRecordDTO:
         record = self._repository.get_by_id(record_id)
         return self.mapper.to_dto(record)
 
     def search_by_tags(
-        self, storage_id: str, tags: list[str], match_all: bool = False
-    ) -> list[AudioRecordDTO]:
+        self,
+        storage_id: str,
+        tags: list[str],
+        match_all: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[AudioRecordSummaryDTO]:
+        """
+        Search storage records by tags. Results are summaries, so transcripts
+        are not read.
+        """
+
+        records = self._repository.search_by_tags(
+            storage_id, tags, match_all, offset, limit
+        )
+        return self._summaries(records)
 
-        records = self._repository.get_by_storage(storage_id)
-        matching_records = self._search_service.search_by_tags(records, tags, match_all)
-        return [self.mapper.to_dto(record) for record in matching_records]
+    def search_by_text(
+        self,
+        storage_id: str,
+        query: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[AudioRecordSummaryDTO]:
+        """
+        Full-text search over transcripts of storage records. Only
+        summaries of the requested page are read, with one query.
+
+        :param storage_id: Storage to search in.
+        :param query: Words to search, quoted parts are matched as phrases.
+        :param offset: Number of matching records to skip (defaults 0).
+        :param limit: Max number of results (defaults None, no limit).
+        :return: Summaries of matching audio records, most relevant first.
+        :raise ValueError: If full-text index is not configured or offset
+        or limit is negative.
+        """
+
+        if not self._text_index:
+            raise ValueError("Full-text search is not configured")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit cannot be negative")
+
+        end = None if limit is None else offset + limit
+        ids = self._text_index.search(storage_id, query, end)[offset:]
+        summaries = self._repository.get_summaries(ids)
+        if len(summaries) < len(ids):
+            found = {summary.id for summary in summaries}
+            for record_id in ids:
+                if record_id not in found:
+                    logger.warning(f"Record {record_id} is indexed but not found")
+        return [self.mapper.to_summary_dto(summary) for summary in summaries]
+
+    def search_by_name(
+        self,
+        storage_id: str,
+        name: str,
+        prefix: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[AudioRecordSummaryDTO]:
+        """
+        Search storage records by name, case insensitive.
+
+        :param storage_id: Storage to search in.
+        :param name: Name part to search for.
+        :param prefix: True if name must start with given part (defaults False).
+        :param offset: Number of matching records to skip (defaults 0).
+        :param limit: Max number of records (defaults None, no limit).
+        :return: Summaries of matching audio records.
+        """
 
-    def search_by_name(self, storage_id: str, name: str) -> list[AudioRecordDTO]:
+        records = self._repository.search_by_name(
+            storage_id, name, prefix, offset, limit
+        )
+        return self._summaries(records)
 
-        records = self._repository.get_by_storage(storage_id)
-        matching_records = self._search_service.search_by_name(records, name)
-        return [self.mapper.to_dto(record) for record in matching_records]
+    def _summaries(self, records) -> list[AudioRecordSummaryDTO]:
+        return [
+            self.mapper.to_summary_dto(AudioRecordSummary.from_record(record))
+            for record in records
+        ]
+
+    def _get_page(
+        self,
+        fetch: Callable[[str, int, tuple[datetime, str] | None], tuple],
+        storage_id: str,
+        limit: int,
+        cursor: str | None,
+    ) -> tuple[tuple, str | None]:
+        if limit < 1:
+            raise ValueError("Page size must be positive")
+
+        after = self._decode_cursor(cursor) if cursor else None
+        items = fetch(storage_id, limit + 1, after)
+        if len(items) <= limit:
+            return items, None
+
+        items = items[:limit]
+        return items, self._encode_cursor(items[-1])
+
+    @staticmethod
+    def _encode_cursor(record: IAudioRecord | AudioRecordSummary) -> str:
+        key = json.dumps([record.last_updated.isoformat(), record.id])
+        return base64.urlsafe_b64encode(key.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            last_updated, record_id = json.loads(base64.urlsafe_b64decode(cursor))
+            return datetime.fromisoformat(last_updated), record_id
+        except (TypeError, ValueError):
+            raise ValueError("Invalid page cursor")
 
     def delete(self, record_id):
         self._repository.delete(record_id)
+        if self._text_index:
+            self._text_index.remove(record_id)
 
 
 class AudioTagService(object):
@@ -134,10 +377,12 @@ class AudioTextService(object):
         repository: IAudioRepository,
         export_service: ITextExporter,
         stopwords_remover: IStopwordsRemover,
+        text_index: IFullTextIndex | None = None,
     ):
         self._repository = repository
         self._export_service = export_service
         self._stopwords_remover = stopwords_remover
+        self._text_index = text_index
 
     def export_record_text(
         self, record_id: str, output_dir: str, file_format: str
@@ -172,6 +417,7 @@ class AudioTextService(object):
         logger.info(f"Text after removing stopwords: {updated_text}")
         record.text = updated_text
         self._repository.update(record)
+        self._reindex(record)
 
     def remove_words(self, record_id: str, words: list | tuple) -> None:
         record = self._repository.get_by_id(record_id)
@@ -182,6 +428,7 @@ class AudioTextService(object):
 
         record.text = self._stopwords_remover.remove_words(record.text, words)
         self._repository.update(record)
+        self._reindex(record)
 
     def change_record_name(self, record_id: str, name: str) -> None:
         record = self._repository.get_by_id(record_id)
@@ -190,3 +437,43 @@ class AudioTextService(object):
 
         record.record_name = name
         self._repository.update(record)
+
+    def _reindex(self, record: IAudioRecord) -> None:
+        if self._text_index:
+            self._text_index.index(record.id, record.storage_id, record.text)
+
+
+class TextIndexService(object):
+    def __init__(self, repository: IAudioRepository, text_index: IFullTextIndex):
+        self._repository = repository
+        self._text_index = text_index
+
+    def rebuild(self, storage_ids: Iterable[str], page_size: int = 100) -> int:
+        """
+        Rebuild full-text index from transcripts of all records of given
+        storages, e.g. records transcribed before the index was added.
+
+        :param storage_ids: Storages to index.
+        :param page_size: Records read from repository at a time.
+        :return: Number of indexed records.
+        :raise ValueError: If page_size is not positive.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be positive")
+
+        return self._text_index.rebuild(self._documents(storage_ids, page_size))
+
+    def _documents(
+        self, storage_ids: Iterable[str], page_size: int
+    ) -> Iterator[tuple[str, str, str]]:
+        for storage_id in storage_ids:
+            offset = 0
+            while True:
+                records = self._repository.get_by_storage(storage_id, offset, page_size)
+                for record in records:
+                    if record.text:
+                        yield record.id, record.storage_id, record.text
+                if len(records) < page_size:
+                    break
+                offset += page_size
@@ -26,9 +26,7 @@ class StorageService(IStorageService):
         return self.mapper.to_dto(storage)
 
     def remove_audio_record(self, storage_id: str, record_id: str) -> None:
-        storage = self.__storage_repository.get_by_id(storage_id)
-        storage.remove_audio_record(record_id)
-        self.__storage_repository.update(storage)
+        self.__storage_repository.remove_audio_record(storage_id, record_id)
 
     def get_all_record_ids(self, storage_id: str) -> list[str] | None:
         storage = self.__storage_repository.get_by_id(storage_id)
@@ -0,0 +1,74 @@
+import logging
+
+from ...domain import TranscriptionJob, TranscriptionStatus
+from ...domain.interfaces import IAudioRepository, IFullTextIndex, ITranscriber
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionJobService(object):
+    """
+    Runs queued transcription jobs and moves audio records through
+    pending/running/done/failed states.
+    """
+
+    def __init__(
+        self,
+        repository: IAudioRepository,
+        transcriber: ITranscriber,
+        text_index: IFullTextIndex | None = None,
+    ):
+        self._repository = repository
+        self._transcriber = transcriber
+        self._text_index = text_index
+
+    def process(self, job: TranscriptionJob) -> None:
+        """
+        Transcribe the audio file of a job and save result into its record.
+
+        :param job: Claimed transcription job.
+        :raise ValueError: If audio record of the job does not exist.
+        :raise Exception: Any transcription error is re-raised after the record
+        is marked as failed.
+        """
+
+        record = self._repository.get_by_id(job.record_id)
+        if not record:
+            raise ValueError("Audio record not found")
+
+        record.status = TranscriptionStatus.RUNNING
+        self._repository.update(record)
+
+        try:
+            text, language = self._transcriber.transcribe_file(
+                job.file_path, job.language, job.max_speakers, job.main_theme
+            )
+        except Exception:
+            logger.exception(f"Transcription job {job.id} failed")
+            record.status = TranscriptionStatus.FAILED
+            self._repository.update(record)
+            raise
+
+        record.text = text
+        record.language = language
+        record.status = TranscriptionStatus.DONE
+        self._repository.update(record)
+        if self._text_index:
+            self._text_index.index(record.id, record.storage_id, text)
+        logger.info(f"Transcription job {job.id} done")
+
+    def fail(self, job: TranscriptionJob) -> None:
+        """
+        Mark audio record of a job that will not be processed as failed,
+        e.g. its worker was lost on the last attempt.
+
+        :param job: Failed transcription job.
+        """
+
+        record = self._repository.get_by_id(job.record_id)
+        if not record:
+            logger.warning(f"Audio record of failed job {job.id} not found")
+            return
+
+        record.status = TranscriptionStatus.FAILED
+        self._repository.update(record)
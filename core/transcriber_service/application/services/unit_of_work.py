@@ -0,0 +1,47 @@
+from ...domain.interfaces import IBatchingRepository
+
+
+class UnitOfWork(object):
+    """
+    Groups repository writes of current thread into one commit.
+
+    Used as a context manager: writes issued inside are buffered by
+    repositories and flushed together on exit, updates of the same entity
+    are coalesced. Units of work may be nested, only the outermost one
+    flushes. Buffered writes are flushed on error too, because changes
+    that were already applied in memory must not be lost.
+    """
+
+    def __init__(self, *repositories: IBatchingRepository):
+        """
+        :param repositories: Repositories to batch, flushed in given order.
+        """
+
+        self._repositories = repositories
+
+    def __enter__(self) -> "UnitOfWork":
+        started = []
+        try:
+            for repository in self._repositories:
+                repository.begin_batch()
+                started.append(repository)
+        except BaseException:
+            self.__end(started)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.__end(self._repositories)
+
+    @staticmethod
+    def __end(repositories) -> None:
+        """End batches of all repositories, first flush error is raised."""
+
+        error = None
+        for repository in repositories:
+            try:
+                repository.end_batch()
+            except Exception as e:
+                error = error or e
+        if error:
+            raise error
@@ -1,4 +1,5 @@
 import logging
+from itertools import islice
 
 from password_strength import PasswordPolicy
 
@@ -51,6 +52,39 @@ class UserService(object):
     def get_all(self) -> list[IUser]:
         return self._repository.get_all()
 
+    def get_users_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        blocked: bool | None = None,
+        email_prefix: str | None = None,
+    ) -> tuple[list[IUser], str | None]:
+        """
+        Retrieves one page of users ordered by email.
+
+        :param limit: Page size.
+        :param after: Cursor returned with previous page (defaults None, first page).
+        :param blocked: Only blocked (True) or active (False) users, all if None.
+        :param email_prefix: Only users whose email starts with it.
+        :return: Page users and cursor of the next page (None if it is the last one).
+        :raise ValueError: If limit is not positive.
+        """
+
+        if limit < 1:
+            raise ValueError("Page size must be positive")
+
+        users = list(
+            islice(
+                self._repository.iter_users(limit + 1, blocked, email_prefix, after),
+                limit + 1,
+            )
+        )
+        if len(users) <= limit:
+            return users, None
+
+        users = users[:limit]
+        return users, users[-1].email
+
     def set_blocked(self, initiator: IUser, target_email: str, block: bool) -> None:
         if not initiator.can_block():
             raise PermissionError("Only admins can block users")
@@ -1,6 +1,18 @@
 from .entities.audio import AudioRecord
+from .entities.audio_summary import AudioRecordSummary
 from .entities.storage import Storage
+from .entities.transcription_job import TranscriptionJob, TranscriptionStatus
 from .entities.user import User, AuthUser, Admin
 from .exceptions import AuthException
 
-__all__ = ["AudioRecord", "User", "AuthUser", "Admin", "AuthException", "Storage"]
+__all__ = [
+    "AudioRecord",
+    "AudioRecordSummary",
+    "User",
+    "AuthUser",
+    "Admin",
+    "AuthException",
+    "Storage",
+    "TranscriptionJob",
+    "TranscriptionStatus",
+]
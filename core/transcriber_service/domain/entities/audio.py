@@ -1,10 +1,24 @@
 from datetime import datetime
+from typing import Callable
 from uuid import uuid4
 
+from .change_tracking import ChangeTracking
+from .transcription_job import TranscriptionStatus
 from ..interfaces import IAudioRecord
 
 
-class AudioRecord(IAudioRecord):
+class AudioRecord(ChangeTracking, IAudioRecord):
+    tracked_fields = (
+        "record_name",
+        "file_path",
+        "storage_id",
+        "text",
+        "language",
+        "status",
+        "tags",
+        "last_updated",
+    )
+
     def __init__(
         self,
         file_name: str,
@@ -12,6 +26,7 @@ class AudioRecord(IAudioRecord):
         storage_id: str,
         text: str,
         language: str,
+        status: TranscriptionStatus = TranscriptionStatus.DONE,
     ):
         """
         Create AudioRecord instance with basic metadata and do transcription into text with given transcribe services.
@@ -21,6 +36,7 @@ class AudioRecord(IAudioRecord):
         :param storage_id: Storage id of audio file.
         :param text: Text of audio file.
         :param language: Language of audio file.
+        :param status: Transcription status (defaults done).
         """
 
         self._id = uuid4().hex
@@ -30,7 +46,9 @@ class AudioRecord(IAudioRecord):
         self._last_updated = datetime.now()
         self._text = text
         self._language = language
+        self._status = TranscriptionStatus(status)
         self._tags = []
+        self._mark_new()
 
     @property
     def id(self) -> str:
@@ -40,13 +58,19 @@ class AudioRecord(IAudioRecord):
 
     @id.setter
     def id(self, value: str):
-        """Set ID of audio record."""
+        """Set ID of audio record, record is then written whole."""
         self._id = value
+        self._mark_new()
 
     @property
     def text(self) -> str:
-        """Return text of audio record."""
+        """
+        Return text of audio record. Text may be restored as a loader
+        callable, which is called on first access.
+        """
 
+        if callable(self._text):
+            self._text = self._text()
         return self._text
 
     @text.setter
@@ -55,6 +79,22 @@ class AudioRecord(IAudioRecord):
 
         self._text = value
         self._last_updated = datetime.now()
+        self._mark_dirty("text", "last_updated")
+
+    @property
+    def text_loader(self) -> Callable[[], str] | None:
+        """Return loader of text restored lazily, None if text is loaded."""
+
+        return self._text if callable(self._text) else None
+
+    def restore_text(self, text: str | Callable[[], str]) -> None:
+        """
+        Set text restored from storage, last_updated is not changed.
+
+        :param text: Text or loader callable, called on first access of text.
+        """
+
+        self._text = text
 
     @property
     def language(self) -> str:
@@ -62,6 +102,28 @@ class AudioRecord(IAudioRecord):
 
         return self._language
 
+    @language.setter
+    def language(self, value: str) -> None:
+        """Set language of audio file (e.g. detected by transcription)."""
+
+        self._language = value
+        self._last_updated = datetime.now()
+        self._mark_dirty("language", "last_updated")
+
+    @property
+    def status(self) -> TranscriptionStatus:
+        """Return transcription status of audio record."""
+
+        return self._status
+
+    @status.setter
+    def status(self, value: TranscriptionStatus) -> None:
+        """Set transcription status of audio record."""
+
+        self._status = TranscriptionStatus(value)
+        self._last_updated = datetime.now()
+        self._mark_dirty("status", "last_updated")
+
     @property
     def tags(self) -> list:
         """Return tags of audio record."""
@@ -73,8 +135,10 @@ class AudioRecord(IAudioRecord):
 
         if tag_name.lower() not in self._tags:
             self._tags.append(tag_name.lower())
+            self._mark_dirty("tags")
             if update:
                 self._last_updated = datetime.now()
+                self._mark_dirty("last_updated")
 
     def remove_tag(self, tag_name: str) -> None:
         """
@@ -85,6 +149,7 @@ class AudioRecord(IAudioRecord):
 
         self._tags.remove(tag_name.lower())
         self._last_updated = datetime.now()
+        self._mark_dirty("tags", "last_updated")
 
     @property
     def record_name(self) -> str:
@@ -98,6 +163,7 @@ class AudioRecord(IAudioRecord):
 
         self._record_name = note_name
         self._last_updated = datetime.now()
+        self._mark_dirty("record_name", "last_updated")
 
     @property
     def file_path(self) -> str:
@@ -120,3 +186,4 @@ class AudioRecord(IAudioRecord):
     @last_updated.setter
     def last_updated(self, value: datetime):
         self._last_updated = value
+        self._mark_dirty("last_updated")
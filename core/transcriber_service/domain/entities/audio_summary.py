@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from .transcription_job import TranscriptionStatus
+from ..interfaces.entities.iaudio import IAudioRecord
+
+
+class AudioRecordSummary(object):
+    def __init__(
+        self,
+        record_id: str,
+        record_name: str,
+        storage_id: str,
+        language: str,
+        tags: list[str],
+        status: TranscriptionStatus,
+        last_updated: datetime,
+    ):
+        """
+        Read-only view of audio record for lists, without transcript text.
+
+        :param record_id: ID of audio record.
+        :param record_name: Name of audio record.
+        :param storage_id: Storage id of audio record.
+        :param language: Language of audio record.
+        :param tags: Tags of audio record.
+        :param status: Transcription status of audio record.
+        :param last_updated: Time of last record change.
+        """
+
+        self.id = record_id
+        self.record_name = record_name
+        self.storage_id = storage_id
+        self.language = language
+        self.tags = list(tags)
+        self.status = status
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_record(cls, record: IAudioRecord) -> "AudioRecordSummary":
+        """Create summary of given audio record."""
+
+        return cls(
+            record.id,
+            record.record_name,
+            record.storage_id,
+            record.language,
+            record.tags,
+            record.status,
+            record.last_updated,
+        )
@@ -0,0 +1,24 @@
+from ..interfaces import IChangeTracking
+
+
+class ChangeTracking(IChangeTracking):
+    """
+    Set of fields changed since entity was restored or persisted, so
+    repositories write changed fields only. New entities have all
+    tracked_fields changed and are written whole.
+    """
+
+    tracked_fields: tuple[str, ...] = ()
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        return frozenset(self._dirty)
+
+    def mark_clean(self) -> None:
+        self._dirty = set()
+
+    def _mark_new(self) -> None:
+        self._dirty = set(self.tracked_fields)
+
+    def _mark_dirty(self, *fields: str) -> None:
+        self._dirty.update(fields)
@@ -1,9 +1,12 @@
 from uuid import uuid4
 
+from .change_tracking import ChangeTracking
 from ..interfaces import IStorage
 
 
-class Storage(IStorage):
+class Storage(ChangeTracking, IStorage):
+    tracked_fields = ("user_id", "audio_record_ids")
+
     def __init__(self, user_id: str):
         """
         Represents a user's personal storage container for audio records.
@@ -14,6 +17,7 @@ class Storage(IStorage):
         self._id = uuid4().hex
         self._user_id = user_id
         self._audio_record_ids: list[str] = []
+        self._mark_new()
 
     @property
     def id(self) -> str:
@@ -23,6 +27,7 @@ class Storage(IStorage):
     @id.setter
     def id(self, value: str) -> None:
         self._id = value
+        self._mark_new()
 
     @property
     def user_id(self) -> str:
@@ -43,6 +48,7 @@ class Storage(IStorage):
         """
         if record_id not in self._audio_record_ids:
             self._audio_record_ids.append(record_id)
+            self._mark_dirty("audio_record_ids")
 
     def remove_audio_record(self, record_id: str) -> None:
         """
@@ -53,3 +59,4 @@ class Storage(IStorage):
         :raise ValueError: If record_id is not in the list of audio record IDs.
         """
         self._audio_record_ids.remove(record_id)
+        self._mark_dirty("audio_record_ids")
@@ -0,0 +1,44 @@
+from datetime import datetime
+from enum import Enum
+from uuid import uuid4
+
+
+class TranscriptionStatus(str, Enum):
+    """Lifecycle state of a transcription job and of its audio record."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class TranscriptionJob(object):
+    def __init__(
+        self,
+        record_id: str,
+        file_path: str,
+        language: str | None = None,
+        max_speakers: int | None = None,
+        main_theme: str | None = None,
+    ):
+        """
+        Represents a queued request to transcribe an already stored audio file.
+
+        :param record_id: ID of the audio record that receives the transcription.
+        :param file_path: Full path to the stored audio file.
+        :param language: Language of audio file (defaults None).
+        :param max_speakers: Max number of speakers (defaults None).
+        :param main_theme: Main theme of audio file (defaults None).
+        """
+
+        self.id: str = uuid4().hex
+        self.record_id = record_id
+        self.file_path = file_path
+        self.language = language
+        self.max_speakers = max_speakers
+        self.main_theme = main_theme
+        self.status: TranscriptionStatus = TranscriptionStatus.PENDING
+        self.attempts: int = 0
+        self.error: str | None = None
+        self.created_at: datetime = datetime.now()
+        self.updated_at: datetime = self.created_at
@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
+from .change_tracking import ChangeTracking
 from ..exceptions import AuthException
 from ..interfaces import IUser
 
 
-class User(IUser):
+class User(ChangeTracking, IUser):
     """
     Represents a base user in the system.
 
@@ -13,6 +14,15 @@ class User(IUser):
     Should not be instantiated directly - use AuthUser or Admin subclasses.
     """
 
+    tracked_fields = (
+        "email",
+        "password_hash",
+        "temp_password_hash",
+        "registration_date",
+        "last_updated",
+        "is_blocked",
+    )
+
     def __init__(self, email: str, password_hash: str):
         """
         Create User instance with validated credentials.
@@ -29,6 +39,7 @@ class User(IUser):
         self._registration_date: datetime = datetime.now()
         self._last_updated: datetime = self._registration_date
         self._is_blocked: bool = False
+        self._mark_new()
 
     @property
     def is_blocked(self) -> bool:
@@ -42,6 +53,7 @@ class User(IUser):
 
         self._is_blocked = is_blocked
         self._last_updated = datetime.now()
+        self._mark_dirty("is_blocked", "last_updated")
 
     @property
     def password_hash(self) -> str:
@@ -53,6 +65,7 @@ class User(IUser):
             raise AuthException("Password hash cannot be empty.")
         self._password_hash = password_hash
         self._last_updated = datetime.now()
+        self._mark_dirty("password_hash", "last_updated")
 
     @property
     def temp_password_hash(self) -> str | None:
@@ -62,6 +75,7 @@ class User(IUser):
     def temp_password_hash(self, temp_password_hash: str):
         self._temp_password_hash = temp_password_hash
         self._last_updated = datetime.now()
+        self._mark_dirty("temp_password_hash", "last_updated")
 
     @property
     def id(self) -> str:
@@ -71,8 +85,9 @@ class User(IUser):
 
     @id.setter
     def id(self, id_: str):
-        """Sets the user ID."""
+        """Sets the user ID, user is then written whole."""
         self._id = id_
+        self._mark_new()
 
     @property
     def email(self) -> str:
@@ -96,6 +111,7 @@ class User(IUser):
     def last_updated(self, value: datetime):
         """Sets the user last updated date."""
         self._last_updated = value
+        self._mark_dirty("last_updated")
 
     def can_block(self) -> bool:
         raise NotImplementedError()
@@ -104,6 +120,7 @@ class User(IUser):
     def registration_date(self, value: datetime):
         """Sets the user registration date."""
         self._registration_date = value
+        self._mark_dirty("registration_date")
 
 
 class AuthUser(User):
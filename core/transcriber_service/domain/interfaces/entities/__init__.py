@@ -1,6 +1,7 @@
 from .iaudio import *
+from .ichange_tracking import *
 from .imapper import *
 from .istorage import *
 from .iuser import *
 
-__all__ = ["IMapper", "IStorage", "IUser", "IAudioRecord"]
+__all__ = ["IMapper", "IStorage", "IUser", "IAudioRecord", "IChangeTracking"]
@@ -1,8 +1,11 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from datetime import datetime
+from typing import Callable
 
+from .ichange_tracking import IChangeTracking
 
-class IAudioRecord(ABC):
+
+class IAudioRecord(IChangeTracking):
     @property
     @abstractmethod
     def id(self) -> str: ...
@@ -19,10 +22,29 @@ class IAudioRecord(ABC):
     @abstractmethod
     def text(self, value: str) -> None: ...
 
+    @property
+    @abstractmethod
+    def text_loader(self) -> Callable[[], str] | None: ...
+
+    @abstractmethod
+    def restore_text(self, text: str | Callable[[], str]) -> None: ...
+
     @property
     @abstractmethod
     def language(self) -> str: ...
 
+    @language.setter
+    @abstractmethod
+    def language(self, value: str) -> None: ...
+
+    @property
+    @abstractmethod
+    def status(self) -> str: ...
+
+    @status.setter
+    @abstractmethod
+    def status(self, value: str) -> None: ...
+
     @property
     @abstractmethod
     def tags(self) -> list: ...
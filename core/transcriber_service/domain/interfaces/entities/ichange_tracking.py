@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class IChangeTracking(ABC):
+    @property
+    @abstractmethod
+    def dirty_fields(self) -> frozenset[str]:
+        """Return names of fields changed since entity was last persisted."""
+        pass
+
+    @abstractmethod
+    def mark_clean(self) -> None:
+        """Forget changed fields, called after entity is restored or persisted."""
+        pass
@@ -1,7 +1,9 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
+from .ichange_tracking import IChangeTracking
 
-class IStorage(ABC):
+
+class IStorage(IChangeTracking):
     @property
     @abstractmethod
     def id(self) -> str: ...
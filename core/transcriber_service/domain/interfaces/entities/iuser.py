@@ -1,8 +1,10 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from datetime import datetime
 
+from .ichange_tracking import IChangeTracking
 
-class IUser(ABC):
+
+class IUser(IChangeTracking):
     @property
     @abstractmethod
     def is_blocked(self) -> bool:
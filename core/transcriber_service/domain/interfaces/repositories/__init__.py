@@ -2,6 +2,8 @@ from .repository_interfaces import *
 
 __all__ = [
     "IAudioRepository",
+    "IBatchingRepository",
     "IStorageRepository",
+    "ITranscriptStore",
     "IUserRepository",
 ]
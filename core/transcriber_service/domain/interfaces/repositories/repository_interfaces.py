@@ -1,8 +1,25 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator
 
 from ..entities.iaudio import IAudioRecord
 from ..entities.istorage import IStorage
 from ..entities.iuser import IUser
+from ...entities.audio_summary import AudioRecordSummary
+
+
+class IBatchingRepository(ABC):
+    """Repository that can buffer writes of current thread and flush them at once."""
+
+    @abstractmethod
+    def begin_batch(self) -> None:
+        """Start buffering writes (batches may be nested)."""
+        pass
+
+    @abstractmethod
+    def end_batch(self) -> None:
+        """End batch, buffered writes are flushed when outermost batch ends."""
+        pass
 
 
 class IUserRepository(ABC):
@@ -24,6 +41,24 @@ class IUserRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[IUser]: ...
 
+    @abstractmethod
+    def iter_users(
+        self,
+        batch_size: int = 100,
+        blocked: bool | None = None,
+        email_prefix: str | None = None,
+        after: str | None = None,
+    ) -> Iterator[IUser]:
+        """
+        Stream users ordered by email, fetched batch_size users at a time.
+
+        :param blocked: Only blocked (True) or active (False) users, all if None.
+        :param email_prefix: Only users whose email starts with it.
+        :param after: Only users with email greater than it (keyset paging).
+        :raise ValueError: If batch_size is not positive.
+        """
+        pass
+
 
 class IStorageRepository(ABC):
     @abstractmethod
@@ -41,14 +76,89 @@ class IStorageRepository(ABC):
     @abstractmethod
     def delete(self, storage_id: str) -> None: ...
 
+    @abstractmethod
+    def add_audio_record(self, storage_id: str, record_id: str) -> None:
+        """
+        Add record id to storage without rewriting the whole storage,
+        so concurrent membership changes are not lost.
+
+        :raise ValueError: If storage does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def remove_audio_record(self, storage_id: str, record_id: str) -> None:
+        """
+        Remove record id from storage, unknown record ids are ignored.
+
+        :raise ValueError: If storage does not exist.
+        """
+        pass
+
 
 class IAudioRepository(ABC):
     @abstractmethod
-    def get_by_storage(self, storage_id: str) -> tuple[IAudioRecord, ...]: ...
+    def get_by_storage(
+        self, storage_id: str, offset: int = 0, limit: int | None = None
+    ) -> tuple[IAudioRecord, ...]: ...
+
+    @abstractmethod
+    def get_page_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Return up to limit storage records ordered by (last_updated, id),
+        most recently updated first, starting after given key.
+        """
+        ...
+
+    @abstractmethod
+    def get_summaries_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[AudioRecordSummary, ...]:
+        """
+        Same page as get_page_by_storage, but only with summaries, so
+        transcript text is neither read nor decoded.
+        """
+        ...
 
     @abstractmethod
     def get_by_id(self, record_id: str) -> IAudioRecord: ...
 
+    @abstractmethod
+    def get_summaries(self, record_ids: list[str]) -> tuple[AudioRecordSummary, ...]:
+        """
+        Return summaries of given records in the same order, fetched at
+        once. Records that do not exist are skipped.
+        """
+        ...
+
+    @abstractmethod
+    def search_by_tags(
+        self,
+        storage_id: str,
+        tags: list[str],
+        match_all: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]: ...
+
+    @abstractmethod
+    def search_by_name(
+        self,
+        storage_id: str,
+        name: str,
+        prefix: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]: ...
+
     @abstractmethod
     def add(self, record: IAudioRecord) -> None: ...
 
@@ -57,3 +167,27 @@ class IAudioRepository(ABC):
 
     @abstractmethod
     def delete(self, record_id: str) -> None: ...
+
+
+class ITranscriptStore(ABC):
+    """Store of audio record transcripts, kept apart from record metadata."""
+
+    @abstractmethod
+    def get(self, record_id: str) -> str | None:
+        """Return transcript of record, None if it is not stored."""
+        ...
+
+    @abstractmethod
+    def put(self, record_id: str, text: str, language: str = "") -> None:
+        """
+        Store transcript of record, replacing the previous one.
+        Empty text removes the transcript.
+
+        :param language: Language of text, may be used to compress it.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, record_id: str) -> None:
+        """Remove transcript of record. Missing transcripts are ignored."""
+        ...
@@ -1,17 +1,21 @@
 from .iemail_service import *
 from .ifile_manager import *
+from .ifull_text_index import *
 from .ipassword_manager import *
 from .iserializer import *
 from .istopwords_remover import *
 from .itext_exporter import *
 from .itranscriber import *
+from .itranscription_queue import *
 
 __all__ = [
     "ISerializer",
     "IStopwordsRemover",
     "IPasswordManager",
     "IFileManager",
+    "IFullTextIndex",
     "ITextExporter",
     "ITranscriber",
+    "ITranscriptionQueue",
     "IEmailService",
 ]
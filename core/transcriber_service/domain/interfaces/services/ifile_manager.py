@@ -2,10 +2,30 @@ from abc import ABC, abstractmethod
 
 
 class IFileManager(ABC):
-    @staticmethod
     @abstractmethod
-    def save(data, path: str, serializer) -> None: ...
+    def save(self, data, path: str, serializer) -> None: ...
 
-    @staticmethod
     @abstractmethod
-    def load(path: str, serializer): ...
+    def load(self, path: str, serializer):
+        """
+        Load data saved at path.
+
+        :raise FileNotFoundError: If nothing was saved at path.
+        """
+        ...
+
+    @abstractmethod
+    def append(self, entries: list[tuple[str, object]], path: str, serializer) -> None:
+        """
+        Append (key, value) entries to log next to data file at path.
+        None value marks key as deleted.
+        """
+        ...
+
+    @abstractmethod
+    def load_log(self, path: str, serializer) -> list[tuple[str, object]]:
+        """Return entries of log at path in append order (empty if no log)."""
+        ...
+
+    @abstractmethod
+    def clear_log(self, path: str) -> None: ...
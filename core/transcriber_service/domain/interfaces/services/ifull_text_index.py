@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IFullTextIndex(ABC):
+    @abstractmethod
+    def index(self, record_id: str, storage_id: str, text: str) -> None:
+        """Add record text to index or replace previously indexed text."""
+        pass
+
+    @abstractmethod
+    def remove(self, record_id: str) -> None:
+        """Remove record from index. Unknown ids are ignored."""
+        pass
+
+    @abstractmethod
+    def search(
+        self, storage_id: str, query: str, limit: int | None = None
+    ) -> list[str]:
+        """
+        Search records of storage by text.
+
+        Quoted parts of query are phrases that must occur in text as is,
+        other words are ranked by relevance.
+
+        :return: Ids of matching records, most relevant first.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild(self, documents: Iterable[tuple[str, str, str]]) -> int:
+        """
+        Replace whole index with given documents, e.g. to index transcripts
+        written before the index was added.
+
+        :param documents: Tuples (record_id, storage_id, text).
+        :return: Number of indexed documents.
+        """
+        pass
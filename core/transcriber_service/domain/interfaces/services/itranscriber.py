@@ -1,3 +1,5 @@
+import mmap
+import os
 from abc import ABC, abstractmethod
 
 
@@ -12,3 +14,28 @@ class ITranscriber(ABC):
     ) -> tuple[str, str]:
         """Transcribe audio content to text and return text and detected language."""
         pass
+
+    def transcribe_file(
+        self,
+        file_path: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        """
+        Transcribe audio file to text and return text and detected language.
+
+        By default the file is memory-mapped and the read-only mapping is
+        passed as content instead of a bytes object read from the file.
+        This only spares the read here: a backend that wraps content in
+        ``BytesIO`` (as ``audio_transcribing`` does) still copies the whole
+        file. Override this method to hand the path to a backend that can
+        read files itself.
+        """
+
+        if os.path.getsize(file_path) == 0:
+            return self.transcribe(b"", language, max_speakers, main_theme)
+
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self.transcribe(content, language, max_speakers, main_theme)
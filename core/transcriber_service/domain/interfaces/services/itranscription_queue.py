@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+
+from ...entities.transcription_job import TranscriptionJob
+
+
+class ITranscriptionQueue(ABC):
+    @abstractmethod
+    def enqueue(self, job: TranscriptionJob) -> None:
+        """Persist a new pending job."""
+        pass
+
+    @abstractmethod
+    def claim(self) -> TranscriptionJob | None:
+        """
+        Atomically take the oldest pending job and mark it as running.
+
+        :return: Claimed job or None if the queue is empty.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str) -> None:
+        """Mark a running job as done."""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark a running job as failed with the given error message."""
+        pass
+
+    @abstractmethod
+    def expire(self) -> list[TranscriptionJob]:
+        """
+        Mark running jobs that were lost on their last attempt as failed.
+
+        :return: Jobs marked as failed.
+        """
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> TranscriptionJob | None:
+        """Return job by its ID if it exists else None."""
+        pass
+
+    @abstractmethod
+    def get_by_record(self, record_id: str) -> TranscriptionJob | None:
+        """Return the latest job of an audio record if it exists else None."""
+        pass
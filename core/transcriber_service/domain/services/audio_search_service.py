@@ -20,9 +20,10 @@ class AudioSearchService(object):
         tags = [tag.lower() for tag in tags]
 
         def matches(record: IAudioRecord) -> bool:
+            record_tags = set(record.tags)
             if match_all:
-                return all(tag in record.tags for tag in tags)
-            return any(tag in record.tags for tag in tags)
+                return all(tag in record_tags for tag in tags)
+            return any(tag in record_tags for tag in tags)
 
         return tuple(record for record in records if matches(record))
 
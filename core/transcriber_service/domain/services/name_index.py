@@ -0,0 +1,97 @@
+from bisect import bisect_left, insort
+
+from ..interfaces import IAudioRecord
+
+
+class NameIndex(object):
+    """
+    Index of audio record names per storage.
+
+    Keeps record ids of every storage in the order records were first
+    indexed and a sorted list of lower case names, so prefix search is a
+    binary search and substring search only compares names of one storage.
+    """
+
+    def __init__(self):
+        self.__names: dict[str, dict[str, str]] = {}
+        self.__sorted: dict[str, list[tuple[str, str]]] = {}
+        self.__indexed: dict[str, tuple[str, str]] = {}
+        self.__order: dict[str, int] = {}
+        self.__next_order = 0
+
+    def __len__(self) -> int:
+        return len(self.__indexed)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__indexed
+
+    def add(self, record: IAudioRecord) -> None:
+        """Index record or re-index it with its current storage and name."""
+
+        storage_id = record.storage_id
+        name = record.record_name.lower()
+        previous = self.__indexed.get(record.id)
+        if previous == (storage_id, name):
+            return
+
+        if previous:
+            self.__unlink_sorted(record.id, *previous)
+            if previous[0] != storage_id:
+                self.__unlink_name(record.id, previous[0])
+        else:
+            self.__order[record.id] = self.__next_order
+            self.__next_order += 1
+
+        self.__names.setdefault(storage_id, {})[record.id] = name
+        insort(self.__sorted.setdefault(storage_id, []), (name, record.id))
+        self.__indexed[record.id] = (storage_id, name)
+
+    def remove(self, record_id: str) -> None:
+        """Remove record from index. Unknown ids are ignored."""
+
+        previous = self.__indexed.pop(record_id, None)
+        if previous:
+            self.__unlink_sorted(record_id, *previous)
+            self.__unlink_name(record_id, previous[0])
+            del self.__order[record_id]
+
+    def ids(self, storage_id: str) -> list[str]:
+        """Return ids of storage records in indexing order."""
+
+        return list(self.__names.get(storage_id, {}))
+
+    def search(self, storage_id: str, name: str, prefix: bool = False) -> list[str]:
+        """
+        Search record ids by name (case insensitive).
+
+        :param storage_id: Storage to search in.
+        :param name: Name part to search for.
+        :param prefix: True if name must start with given part, else it may
+        occur anywhere in name.
+        :return: Ids of matching records in indexing order.
+        """
+
+        name = name.lower()
+        if not prefix:
+            names = self.__names.get(storage_id, {})
+            return [record_id for record_id, value in names.items() if name in value]
+
+        entries = self.__sorted.get(storage_id, [])
+        ids = []
+        for i in range(bisect_left(entries, (name, "")), len(entries)):
+            if not entries[i][0].startswith(name):
+                break
+            ids.append(entries[i][1])
+        return sorted(ids, key=self.__order.__getitem__)
+
+    def __unlink_name(self, record_id: str, storage_id: str) -> None:
+        names = self.__names[storage_id]
+        del names[record_id]
+        if not names:
+            del self.__names[storage_id]
+
+    def __unlink_sorted(self, record_id: str, storage_id: str, name: str) -> None:
+        entries = self.__sorted[storage_id]
+        del entries[bisect_left(entries, (name, record_id))]
+        if not entries:
+            del self.__sorted[storage_id]
@@ -0,0 +1,68 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from ..interfaces import IAudioRecord
+
+
+class RecencyIndex(object):
+    """
+    Index of audio records per storage ordered by (last_updated, id).
+
+    Keeps a sorted key list per storage, so a page of most recently
+    updated records after a given key is a binary search plus a slice.
+    """
+
+    def __init__(self):
+        self.__sorted: dict[str, list[tuple[datetime, str]]] = {}
+        self.__indexed: dict[str, tuple[str, datetime]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__indexed)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__indexed
+
+    def add(self, record: IAudioRecord) -> None:
+        """Index record or re-index it with its current storage and update time."""
+
+        current = (record.storage_id, record.last_updated)
+        previous = self.__indexed.get(record.id)
+        if previous == current:
+            return
+
+        if previous:
+            self.__unlink(record.id, *previous)
+        insort(self.__sorted.setdefault(current[0], []), (current[1], record.id))
+        self.__indexed[record.id] = current
+
+    def remove(self, record_id: str) -> None:
+        """Remove record from index. Unknown ids are ignored."""
+
+        previous = self.__indexed.pop(record_id, None)
+        if previous:
+            self.__unlink(record_id, *previous)
+
+    def page(
+        self, storage_id: str, limit: int, after: tuple[datetime, str] | None = None
+    ) -> list[str]:
+        """
+        Return ids of storage records, most recently updated first.
+
+        :param storage_id: Storage to list.
+        :param limit: Max number of ids.
+        :param after: (last_updated, id) key of the last record of previous
+        page, only records ordered after it are returned.
+        :return: Record ids.
+        """
+
+        entries = self.__sorted.get(storage_id, [])
+        end = bisect_left(entries, after) if after else len(entries)
+        return [
+            record_id for _, record_id in reversed(entries[max(0, end - limit) : end])
+        ]
+
+    def __unlink(self, record_id: str, storage_id: str, last_updated: datetime) -> None:
+        entries = self.__sorted[storage_id]
+        del entries[bisect_left(entries, (last_updated, record_id))]
+        if not entries:
+            del self.__sorted[storage_id]
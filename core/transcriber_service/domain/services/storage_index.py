@@ -0,0 +1,70 @@
+from itertools import islice
+
+from ..interfaces import IAudioRecord
+
+
+class StorageIndex(object):
+    """
+    Index of audio record ids per storage.
+
+    Keeps record ids of every storage in the order records were added, so
+    listing a storage costs the size of requested page instead of a scan
+    over records of every storage.
+    """
+
+    def __init__(self):
+        self.__ids: dict[str, dict[str, None]] = {}
+        self.__storages: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.__storages)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__storages
+
+    def add(self, record: IAudioRecord) -> None:
+        """Index record or move it to its current storage."""
+
+        storage_id = record.storage_id
+        previous = self.__storages.get(record.id)
+        if previous == storage_id:
+            return
+
+        if previous is not None:
+            self.__unlink(record.id, previous)
+        self.__ids.setdefault(storage_id, {})[record.id] = None
+        self.__storages[record.id] = storage_id
+
+    def remove(self, record_id: str) -> None:
+        """Remove record from index. Unknown ids are ignored."""
+
+        storage_id = self.__storages.pop(record_id, None)
+        if storage_id is not None:
+            self.__unlink(record_id, storage_id)
+
+    def count(self, storage_id: str) -> int:
+        return len(self.__ids.get(storage_id, ()))
+
+    def ids(
+        self, storage_id: str, offset: int = 0, limit: int | None = None
+    ) -> list[str]:
+        """
+        Return ids of storage records in the order they were added.
+
+        :param storage_id: Storage to list.
+        :param offset: Number of ids to skip.
+        :param limit: Max number of ids to return, all if None.
+        :raise ValueError: If offset or limit is negative.
+        """
+
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit cannot be negative")
+
+        end = None if limit is None else offset + limit
+        return list(islice(self.__ids.get(storage_id, ()), offset, end))
+
+    def __unlink(self, record_id: str, storage_id: str) -> None:
+        ids = self.__ids[storage_id]
+        del ids[record_id]
+        if not ids:
+            del self.__ids[storage_id]
@@ -0,0 +1,94 @@
+from ..interfaces import IAudioRecord
+
+
+class TagIndex(object):
+    """
+    Inverted index of audio record tags.
+
+    Keeps tag -> record ids posting sets per storage, so tag search costs
+    set union/intersection over matching postings instead of a scan over
+    every record in storage. Results are returned in the order records were
+    first indexed.
+    """
+
+    def __init__(self):
+        self.__postings: dict[str, dict[str, set[str]]] = {}
+        self.__indexed: dict[str, tuple[str, frozenset[str]]] = {}
+        self.__order: dict[str, int] = {}
+        self.__next_order = 0
+
+    def __len__(self) -> int:
+        return len(self.__indexed)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__indexed
+
+    def add(self, record: IAudioRecord) -> None:
+        """Index record or re-index it with its current storage and tags."""
+
+        storage_id = record.storage_id
+        tags = frozenset(record.tags)
+        previous = self.__indexed.get(record.id)
+        if previous == (storage_id, tags):
+            return
+
+        if previous:
+            self.__unlink(record.id, *previous)
+        else:
+            self.__order[record.id] = self.__next_order
+            self.__next_order += 1
+
+        postings = self.__postings.setdefault(storage_id, {})
+        for tag in tags:
+            postings.setdefault(tag, set()).add(record.id)
+        self.__indexed[record.id] = (storage_id, tags)
+
+    def remove(self, record_id: str) -> None:
+        """Remove record from index. Unknown ids are ignored."""
+
+        previous = self.__indexed.pop(record_id, None)
+        if previous:
+            self.__unlink(record_id, *previous)
+            del self.__order[record_id]
+
+    def search(
+        self, storage_id: str, tags: list[str], match_all: bool = False
+    ) -> list[str]:
+        """
+        Search record ids by tags.
+
+        :param storage_id: Storage to search in.
+        :param tags: Tags to search for (case insensitive).
+        :param match_all: True if record must contain all tags.
+        :return: Ids of matching records.
+        """
+
+        postings = self.__postings.get(storage_id, {})
+        lists = [postings.get(tag.lower(), set()) for tag in set(tags)]
+        if not lists:
+            return []
+
+        if match_all:
+            lists.sort(key=len)
+            ids = lists[0].intersection(*lists[1:])
+        else:
+            ids = set().union(*lists)
+
+        return sorted(ids, key=self.__order.__getitem__)
+
+    def clear(self) -> None:
+        self.__postings.clear()
+        self.__indexed.clear()
+        self.__order.clear()
+
+    def __unlink(self, record_id: str, storage_id: str, tags: frozenset[str]) -> None:
+        postings = self.__postings.get(storage_id, {})
+        for tag in tags:
+            posting = postings.get(tag)
+            if posting is None:
+                continue
+            posting.discard(record_id)
+            if not posting:
+                del postings[tag]
+        if not postings:
+            self.__postings.pop(storage_id, None)
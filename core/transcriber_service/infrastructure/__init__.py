@@ -1,4 +1,6 @@
 from .export import *
+from .jobs import *
 from .repositories import *
+from .search import *
 from .serializers import *
 from .services import *
@@ -0,0 +1,4 @@
+from .sqlite_transcription_queue import *
+from .transcription_worker_pool import *
+
+__all__ = ["SqliteTranscriptionQueue", "TranscriptionWorkerPool"]
@@ -0,0 +1,225 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+from ...domain import TranscriptionJob, TranscriptionStatus
+from ...domain.interfaces import ITranscriptionQueue
+
+
+class SqliteTranscriptionQueue(ITranscriptionQueue):
+    """
+    Transcription queue stored in a local SQLite file.
+
+    Works without an external broker and can be shared by several processes:
+    jobs are claimed inside an immediate transaction, so one job is never
+    given to two workers. Running jobs whose lease expired (e.g. the worker
+    process died) are claimed again until max_attempts is reached, after
+    that they are marked as failed by expire.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        lease_timeout: float = 60 * 60,
+        max_attempts: int = 3,
+    ):
+        """
+        Create SQLite transcription queue.
+
+        :param db_path: Path to SQLite database file.
+        :param lease_timeout: Seconds after which a running job is considered lost.
+        :param max_attempts: Max number of times a job can be claimed.
+        """
+
+        if not db_path:
+            raise ValueError("db_path cannot be empty")
+
+        self.__db_path = db_path
+        self.__lease_timeout = lease_timeout
+        self.__max_attempts = max_attempts
+
+        with self.__connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS transcription_jobs (
+                    id TEXT PRIMARY KEY,
+                    record_id TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    language TEXT,
+                    max_speakers INTEGER,
+                    main_theme TEXT,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_created "
+                "ON transcription_jobs (status, created_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_record "
+                "ON transcription_jobs (record_id, created_at)"
+            )
+
+    def enqueue(self, job: TranscriptionJob) -> None:
+        with self.__connect() as connection:
+            connection.execute(
+                "INSERT INTO transcription_jobs (id, record_id, file_path, language, "
+                "max_speakers, main_theme, status, attempts, error, created_at, "
+                "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.record_id,
+                    job.file_path,
+                    job.language,
+                    job.max_speakers,
+                    job.main_theme,
+                    TranscriptionStatus.PENDING.value,
+                    job.attempts,
+                    job.error,
+                    job.created_at.timestamp(),
+                    job.updated_at.timestamp(),
+                ),
+            )
+
+    def claim(self) -> TranscriptionJob | None:
+        now = time.time()
+        with self.__connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.__claim_row(connection, now)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+        if row is None:
+            return None
+
+        job = self.__to_job(row)
+        job.status = TranscriptionStatus.RUNNING
+        job.attempts += 1
+        job.updated_at = datetime.fromtimestamp(now)
+        return job
+
+    def complete(self, job_id: str) -> None:
+        self.__set_status(job_id, TranscriptionStatus.DONE, None)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self.__set_status(job_id, TranscriptionStatus.FAILED, error)
+
+    def expire(self) -> list[TranscriptionJob]:
+        now = time.time()
+        error = f"Lease expired after {self.__max_attempts} attempts"
+        with self.__connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = connection.execute(
+                    "SELECT * FROM transcription_jobs WHERE status = ? "
+                    "AND updated_at < ? AND attempts >= ?",
+                    (
+                        TranscriptionStatus.RUNNING.value,
+                        now - self.__lease_timeout,
+                        self.__max_attempts,
+                    ),
+                ).fetchall()
+                connection.executemany(
+                    "UPDATE transcription_jobs SET status = ?, error = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    [
+                        (TranscriptionStatus.FAILED.value, error, now, row["id"])
+                        for row in rows
+                    ],
+                )
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+        jobs = [self.__to_job(row) for row in rows]
+        for job in jobs:
+            job.status = TranscriptionStatus.FAILED
+            job.error = error
+            job.updated_at = datetime.fromtimestamp(now)
+        return jobs
+
+    def get(self, job_id: str) -> TranscriptionJob | None:
+        with self.__connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM transcription_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+
+        return self.__to_job(row) if row else None
+
+    def get_by_record(self, record_id: str) -> TranscriptionJob | None:
+        with self.__connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM transcription_jobs WHERE record_id = ? "
+                "ORDER BY created_at DESC, rowid DESC LIMIT 1",
+                (record_id,),
+            ).fetchone()
+
+        return self.__to_job(row) if row else None
+
+    def __claim_row(self, connection: sqlite3.Connection, now: float):
+        row = connection.execute(
+            "SELECT * FROM transcription_jobs WHERE status = ? "
+            "OR (status = ? AND updated_at < ? AND attempts < ?) "
+            "ORDER BY created_at, rowid LIMIT 1",
+            (
+                TranscriptionStatus.PENDING.value,
+                TranscriptionStatus.RUNNING.value,
+                now - self.__lease_timeout,
+                self.__max_attempts,
+            ),
+        ).fetchone()
+        if row is not None:
+            connection.execute(
+                "UPDATE transcription_jobs SET status = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (TranscriptionStatus.RUNNING.value, now, row["id"]),
+            )
+
+        return row
+
+    def __set_status(
+        self, job_id: str, status: TranscriptionStatus, error: str | None
+    ) -> None:
+        with self.__connect() as connection:
+            cursor = connection.execute(
+                "UPDATE transcription_jobs SET status = ?, error = ?, updated_at = ? "
+                "WHERE id = ?",
+                (status.value, error, time.time(), job_id),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Job with ID {job_id} not found")
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.__db_path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __to_job(row: sqlite3.Row) -> TranscriptionJob:
+        job = TranscriptionJob(
+            row["record_id"],
+            row["file_path"],
+            row["language"],
+            row["max_speakers"],
+            row["main_theme"],
+        )
+        job.id = row["id"]
+        job.status = TranscriptionStatus(row["status"])
+        job.attempts = row["attempts"]
+        job.error = row["error"]
+        job.created_at = datetime.fromtimestamp(row["created_at"])
+        job.updated_at = datetime.fromtimestamp(row["updated_at"])
+        return job
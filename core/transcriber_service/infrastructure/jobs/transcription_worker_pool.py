@@ -0,0 +1,115 @@
+import logging
+import threading
+from typing import Callable
+
+from ...domain import TranscriptionJob
+from ...domain.interfaces import ITranscriptionQueue
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionWorkerPool(object):
+    """
+    Local pool of background workers that claim jobs from a transcription queue
+    and pass them to a handler, so web requests never wait for model inference.
+    """
+
+    def __init__(
+        self,
+        queue: ITranscriptionQueue,
+        handler: Callable[[TranscriptionJob], None],
+        workers: int = 1,
+        poll_interval: float = 1.0,
+        on_expired: Callable[[TranscriptionJob], None] | None = None,
+    ):
+        """
+        Create worker pool.
+
+        :param queue: Queue to claim jobs from.
+        :param handler: Callable that processes one job. A raised exception
+        marks the job as failed.
+        :param workers: Number of worker threads.
+        :param poll_interval: Seconds to wait when the queue is empty.
+        :param on_expired: Called with every job the queue marked as failed
+        because it was lost on its last attempt.
+        """
+
+        if workers < 1:
+            raise ValueError("Number of workers must be positive")
+
+        self.__queue = queue
+        self.__handler = handler
+        self.__workers = workers
+        self.__poll_interval = poll_interval
+        self.__on_expired = on_expired
+        self.__stop_event = threading.Event()
+        self.__threads: list[threading.Thread] = []
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self.__threads)
+
+    def start(self) -> None:
+        """Start worker threads if they are not started yet."""
+
+        if self.running:
+            return
+
+        self.__stop_event.clear()
+        self.__threads = [
+            threading.Thread(
+                target=self.__run,
+                name=f"transcription-worker-{i}",
+                daemon=True,
+            )
+            for i in range(self.__workers)
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+        logger.info(f"Started {self.__workers} transcription workers")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Ask workers to stop after their current job and wait for them."""
+
+        self.__stop_event.set()
+        for thread in self.__threads:
+            thread.join(timeout)
+
+    def run_once(self) -> bool:
+        """
+        Claim and process a single job in the calling thread. Jobs lost on
+        their last attempt are failed first.
+
+        :return: True if a job was processed else False.
+        """
+
+        for expired in self.__queue.expire():
+            logger.warning(f"Transcription job {expired.id} failed: {expired.error}")
+            if self.__on_expired:
+                self.__on_expired(expired)
+
+        job = self.__queue.claim()
+        if job is None:
+            return False
+
+        try:
+            self.__handler(job)
+        except Exception as e:
+            logger.warning(f"Transcription job {job.id} failed: {e}")
+            self.__queue.fail(job.id, str(e))
+        else:
+            self.__queue.complete(job.id)
+
+        return True
+
+    def __run(self) -> None:
+        while not self.__stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                logger.exception("Transcription worker error")
+                processed = False
+
+            if not processed:
+                self.__stop_event.wait(self.__poll_interval)
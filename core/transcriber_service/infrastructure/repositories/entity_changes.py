@@ -0,0 +1,71 @@
+from datetime import datetime
+from enum import Enum
+
+from ...domain.interfaces import IChangeTracking
+
+# Fields written by field-level updates, others are written with the whole entity
+AUDIO_RECORD_FIELDS = frozenset(
+    ("text", "language", "status", "tags", "record_name", "last_updated")
+)
+USER_FIELDS = frozenset(
+    ("is_blocked", "password_hash", "temp_password_hash", "last_updated")
+)
+
+
+def changed_fields(
+    entity: IChangeTracking, patchable: frozenset[str]
+) -> frozenset[str] | None:
+    """
+    Return changed fields of entity to write, empty if nothing changed.
+
+    :param patchable: Fields that can be written without the whole entity.
+    :return: Changed fields, None if entity must be written whole.
+    """
+
+    fields = frozenset(entity.dirty_fields)
+    return fields if fields <= patchable else None
+
+
+def field_values(entity, fields) -> dict:
+    """
+    Return values of entity fields as plain data of serializers:
+    enums as values and dates in ISO format.
+    """
+
+    values = {}
+    for field in fields:
+        value = getattr(entity, field)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values[field] = value
+    return values
+
+
+def restore_fields(entity, values: dict) -> None:
+    """
+    Set field values written by a field-level update on entity restored
+    from older data. Entity is clean afterwards.
+
+    :param values: Field values, dates are datetime or ISO format.
+    """
+
+    last_updated = values.get("last_updated", entity.last_updated)
+    for field, value in values.items():
+        if field == "last_updated":
+            continue
+        if field == "text":
+            entity.restore_text(value)
+        elif field == "tags":
+            for tag in entity.tags:
+                entity.remove_tag(tag)
+            for tag in value:
+                entity.add_tag(tag, False)
+        else:
+            setattr(entity, field, value)
+
+    if isinstance(last_updated, str):
+        last_updated = datetime.fromisoformat(last_updated)
+    entity.last_updated = last_updated
+    entity.mark_clean()
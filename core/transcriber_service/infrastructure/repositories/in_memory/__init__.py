@@ -1,5 +1,8 @@
 from .audio_repository import *
+from .file_transcript_store import *
 from .local_file_manager import *
+from .mapped_record_store import *
+from .record_store import *
 from .storage_repository import *
 from .user_reposityory import *
 
@@ -8,4 +11,9 @@ __all__ = [
     "LocalUserRepository",
     "LocalStorageRepository",
     "LocalFileManager",
+    "FsyncPolicy",
+    "RecordStore",
+    "MemoryRecordStore",
+    "MappedRecordStore",
+    "FileTranscriptStore",
 ]
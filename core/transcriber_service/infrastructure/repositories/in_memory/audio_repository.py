@@ -1,66 +1,170 @@
+from datetime import datetime
+
+from ....domain import AudioRecordSummary
 from ....domain.interfaces import (
+    IBatchingRepository,
     IAudioRepository,
     IStorageRepository,
     IAudioRecord,
     IFileManager,
     ISerializer,
+    ITranscriptStore,
 )
+from ....domain.services.name_index import NameIndex
+from ....domain.services.recency_index import RecencyIndex
+from ....domain.services.storage_index import StorageIndex
+from ....domain.services.tag_index import TagIndex
+from .record_store import MemoryRecordStore, RecordStore
+from ..entity_changes import AUDIO_RECORD_FIELDS, changed_fields
+from ..stored_text import attach_text, detach_text
 
 
-class LocalAudioRepository(IAudioRepository):
+class LocalAudioRepository(IAudioRepository, IBatchingRepository):
     def __init__(
         self,
         storage_repository: IStorageRepository,
         data_dir: str,
         file_manager: IFileManager,
         serializer: ISerializer,
+        compact_threshold: int = 1000,
+        store: RecordStore | None = None,
+        transcripts: ITranscriptStore | None = None,
     ) -> None:
         """
         Create local audio repository.
 
         :type storage_repository: IStorageRepository.
         :param data_dir: Directory to store local audio data.
+        :param compact_threshold: Logged changes after which snapshot is rewritten.
+        :param store: Store of records, e.g. MappedRecordStore to decode records
+        lazily. By default all records are loaded from snapshot and log in data_dir.
+        :param transcripts: Store of transcripts kept apart from records, e.g.
+        FileTranscriptStore, so records are written and read without text.
+        Text is kept in records if None.
         """
-        self.__serializer = serializer
-        self.__file_manager = file_manager
-        self.__records: dict[str, IAudioRecord] = {}
         self.__storage_repository = storage_repository
-        self.__dir = data_dir
+        self.__tag_index = TagIndex()
+        self.__storage_index = StorageIndex()
+        self.__name_index = NameIndex()
+        self.__recency_index = RecencyIndex()
+        self.__summaries: dict[str, AudioRecordSummary] = {}
+        if store is None:
+            store = MemoryRecordStore(
+                data_dir, file_manager, serializer, compact_threshold
+            )
+        self.__records = store
+        self.__transcripts = transcripts
+
+        for summary in self.__records.summaries():
+            self.__index(summary)
+
+    def get_by_storage(
+        self, storage_id: str, offset: int = 0, limit: int | None = None
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Return list of audio records by storage id.
+        Uses storage index, so only records of the page are visited.
+        """
 
-        try:
-            self.__records = file_manager.load(self.__dir, serializer)
-        except:
-            self.__records = {}
+        ids = self.__storage_index.ids(storage_id, offset, limit)
+        return tuple(self.__get(record_id) for record_id in ids)
 
-    def get_by_storage(self, storage_id: str) -> tuple[IAudioRecord, ...]:
-        """Return list of audio records by storage id."""
-        return tuple(r for r in self.__records.values() if r.storage_id == storage_id)
+    def get_page_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """Return page of storage records, most recently updated first."""
+
+        if limit < 0:
+            raise ValueError("Limit cannot be negative")
+
+        ids = self.__recency_index.page(storage_id, limit, after)
+        return tuple(self.__get(record_id) for record_id in ids)
+
+    def get_summaries_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[AudioRecordSummary, ...]:
+        """Return page of storage record summaries, most recently updated first."""
+
+        if limit < 0:
+            raise ValueError("Limit cannot be negative")
+
+        ids = self.__recency_index.page(storage_id, limit, after)
+        return tuple(self.__summaries[record_id] for record_id in ids)
+
+    def get_summaries(self, record_ids: list[str]) -> tuple[AudioRecordSummary, ...]:
+        """Return summaries of given records, missing records are skipped."""
+
+        return tuple(
+            self.__summaries[record_id]
+            for record_id in record_ids
+            if record_id in self.__summaries
+        )
 
     def get_by_id(self, record_id: str) -> IAudioRecord | None:
         """Return audio record by id if it exists else None."""
 
-        return self.__records.get(record_id)
+        return self.__get(record_id)
+
+    def search_by_tags(
+        self,
+        storage_id: str,
+        tags: list[str],
+        match_all: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Return audio records of storage with any (or all) of given tags.
+        Uses tag index, so records without matching tags are not visited.
+        """
+
+        if not tags:
+            return self.get_by_storage(storage_id, offset, limit) if match_all else ()
+
+        ids = self.__tag_index.search(storage_id, tags, match_all)
+        return self.__get_page(ids, offset, limit)
+
+    def search_by_name(
+        self,
+        storage_id: str,
+        name: str,
+        prefix: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Return audio records of storage whose name starts with (prefix) or
+        contains given name, case insensitive. Uses name index.
+        """
+
+        ids = self.__name_index.search(storage_id, name, prefix)
+        return self.__get_page(ids, offset, limit)
 
     def add(self, record: IAudioRecord) -> None:
         """
         Add audio record to repository.
 
-        :raise ValueError: If audio record already exists.
+        :raise ValueError: If audio record already exists or storage does not exist.
         """
 
         if record.id in self.__records:
             raise ValueError("Record already exists.")
 
-        storage = self.__storage_repository.get_by_id(record.storage_id)
-        if storage:
-            storage.add_audio_record(record.id)
-            self.__storage_repository.update(storage)
-            self.__records[record.id] = record
-            self.__save()
+        self.__storage_repository.add_audio_record(record.storage_id, record.id)
+        self.__records.put(self.__detach(record))
+        self.__index(record)
+        record.mark_clean()
 
     def update(self, record: IAudioRecord) -> None:
         """
-        Update audio record from repository with new value.
+        Update audio record from repository with new value. Only changed
+        fields are written if record was read from repository.
 
         :param record: new value of audio record.
         :raise ValueError: If audio record does not exist.
@@ -68,8 +172,20 @@ class LocalAudioRepository(IAudioRepository):
 
         if record.id not in self.__records:
             raise ValueError("Record not found.")
-        self.__records[record.id] = record
-        self.__save()
+
+        fields = changed_fields(record, AUDIO_RECORD_FIELDS)
+        metadata = self.__detach(record)
+        if fields is None:
+            self.__records.put(metadata)
+        else:
+            if not fields:
+                record.mark_clean()
+                return
+            # Changed text is patched empty, so inline text of records
+            # written before transcripts were stored apart is dropped
+            self.__records.patch(metadata, fields)
+        self.__index(record)
+        record.mark_clean()
 
     def delete(self, record_id: str) -> None:
         """
@@ -83,13 +199,49 @@ class LocalAudioRepository(IAudioRepository):
         if not record:
             raise ValueError("Record not found.")
 
-        storage = self.__storage_repository.get_by_id(record.storage_id)
-        if storage:
-            storage.remove_audio_record(record_id)
-            self.__storage_repository.update(storage)
-
-        del self.__records[record_id]
-        self.__save()
-
-    def __save(self) -> None:
-        self.__file_manager.save(self.__records, self.__dir, self.__serializer)
+        try:
+            self.__storage_repository.remove_audio_record(record.storage_id, record_id)
+        except ValueError:
+            pass  # storage was already deleted
+
+        self.__records.delete(record_id)
+        if self.__transcripts:
+            self.__transcripts.delete(record_id)
+        self.__storage_index.remove(record_id)
+        self.__tag_index.remove(record_id)
+        self.__name_index.remove(record_id)
+        self.__recency_index.remove(record_id)
+        self.__summaries.pop(record_id, None)
+
+    def begin_batch(self) -> None:
+        self.__records.begin_batch()
+
+    def end_batch(self) -> None:
+        self.__records.end_batch()
+
+    def __index(self, record: IAudioRecord | AudioRecordSummary) -> None:
+        self.__storage_index.add(record)
+        self.__tag_index.add(record)
+        self.__name_index.add(record)
+        self.__recency_index.add(record)
+        self.__summaries[record.id] = AudioRecordSummary.from_record(record)
+
+    def __get_page(
+        self, ids: list[str], offset: int, limit: int | None
+    ) -> tuple[IAudioRecord, ...]:
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit cannot be negative")
+
+        end = None if limit is None else offset + limit
+        return tuple(self.__get(record_id) for record_id in ids[offset:end])
+
+    def __get(self, record_id: str) -> IAudioRecord | None:
+        record = self.__records.get(record_id)
+        if record is None or not self.__transcripts:
+            return record
+        return attach_text(record, self.__transcripts)
+
+    def __detach(self, record: IAudioRecord) -> IAudioRecord:
+        if not self.__transcripts:
+            return record
+        return detach_text(record, self.__transcripts)
@@ -0,0 +1,63 @@
+import os
+
+from ...serializers.text_compressor import TextCompressor
+from ....domain.interfaces import ITranscriptStore
+
+RAW = b"\x00"
+COMPRESSED = b"\x01"
+
+
+class FileTranscriptStore(ITranscriptStore):
+    def __init__(self, directory: str, compressor: TextCompressor | None = None):
+        """
+        Transcripts stored as one file per record, in subdirectories by
+        first characters of record id. Files are replaced atomically, so
+        a transcript is either old or new after a crash.
+
+        :param directory: Root directory of transcripts.
+        :param compressor: Compressor of transcripts, raw text is written if None.
+        """
+
+        self.__directory = directory
+        self.__compressor = compressor
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, record_id: str) -> str | None:
+        try:
+            with open(self.__path(record_id), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        if data[:1] == COMPRESSED:
+            if self.__compressor is None:
+                raise ValueError("Compressed transcript requires a compressor")
+            return self.__compressor.decompress(data[1:])
+        return data[1:].decode()
+
+    def put(self, record_id: str, text: str, language: str = "") -> None:
+        if not text:
+            self.delete(record_id)
+            return
+
+        payload = (
+            self.__compressor.compress(text, language) if self.__compressor else None
+        )
+        data = COMPRESSED + payload if payload is not None else RAW + text.encode()
+
+        path = self.__path(record_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    def delete(self, record_id: str) -> None:
+        try:
+            os.remove(self.__path(record_id))
+        except FileNotFoundError:
+            pass
+
+    def __path(self, record_id: str) -> str:
+        if not record_id or os.sep in record_id or record_id.startswith("."):
+            raise ValueError(f"Invalid record ID: {record_id}")
+        return os.path.join(self.__directory, record_id[:2], record_id)
@@ -0,0 +1,63 @@
+import struct
+import zlib
+from typing import Iterator
+
+# Frame: body length and crc32 of body, then body
+FRAME_HEADER = struct.Struct(">II")
+# Frame body: key length and put (1) / delete (0) flag, then key and value
+ENTRY_HEADER = struct.Struct(">HB")
+
+
+def pack_frame(key: str, data: bytes | None) -> bytes:
+    """
+    Pack key and serialized value into a checksummed frame.
+
+    :param key: Entry key.
+    :param data: Serialized value, None marks key as deleted.
+    """
+
+    key_bytes = key.encode()
+    body = ENTRY_HEADER.pack(len(key_bytes), data is not None) + key_bytes
+    if data is not None:
+        body += data
+    return FRAME_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def read_frame(buffer, offset: int = 0) -> tuple[str, bytes | None, int] | None:
+    """
+    Read frame starting at offset of buffer (bytes or mmap).
+
+    :return: Key, serialized value (None for deleted key) and frame end,
+    None if frame is truncated or corrupted.
+    """
+
+    start = offset + FRAME_HEADER.size
+    if start > len(buffer):
+        return None
+
+    length, checksum = FRAME_HEADER.unpack_from(buffer, offset)
+    body = buffer[start : start + length]
+    if len(body) < length or zlib.crc32(body) != checksum:
+        return None
+
+    key_length, put = ENTRY_HEADER.unpack_from(body)
+    key_end = ENTRY_HEADER.size + key_length
+    key = body[ENTRY_HEADER.size : key_end].decode()
+    return key, (body[key_end:] if put else None), start + length
+
+
+def iter_frames(
+    buffer, offset: int = 0
+) -> Iterator[tuple[str, bytes | None, int, int]]:
+    """
+    Yield key, serialized value, start and end of consecutive frames.
+    Stops at the first truncated or corrupted frame.
+    """
+
+    while True:
+        frame = read_frame(buffer, offset)
+        if frame is None:
+            return
+        key, data, end = frame
+        yield key, data, offset, end
+        offset = end
@@ -1,34 +1,254 @@
-from pathlib import Path
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from enum import Enum
 
+from .frames import iter_frames, pack_frame
 from ....domain.interfaces import ISerializer, IFileManager
 
+logger = logging.getLogger(__name__)
+
+# Snapshot header line: magic, generation, crc32 and length of data
+_SNAPSHOT_MAGIC = b"TSNAP1"
+
+
+class FsyncPolicy(str, Enum):
+    """When written files are flushed to disk."""
+
+    ALWAYS = "always"
+    BATCHED = "batched"
+    NEVER = "never"
+
 
 class LocalFileManager(IFileManager):
-    @staticmethod
-    def save(data, filename: str, serializer: ISerializer) -> None:
-        """Save data to file."""
+    def __init__(
+        self,
+        fsync: FsyncPolicy | str = FsyncPolicy.ALWAYS,
+        fsync_interval: int = 100,
+        checksum: bool = True,
+    ):
+        """
+        Create local file manager.
+
+        Snapshots are written to a temp file and renamed over the old one,
+        so readers and crashes never see a partially written snapshot.
+
+        :param fsync: ALWAYS fsyncs every write, BATCHED fsyncs snapshots and
+        every fsync_interval log appends, NEVER leaves flushing to the OS.
+        :param fsync_interval: Log appends between fsyncs with BATCHED policy.
+        :param checksum: Write snapshots with generation and crc32 header,
+        checked on load (headerless snapshots are still loaded).
+        :raise ValueError: If fsync policy is unknown or fsync_interval is not positive.
+        """
+
+        if fsync_interval < 1:
+            raise ValueError("Fsync interval must be positive")
+
+        self.__fsync = FsyncPolicy(fsync)
+        self.__fsync_interval = fsync_interval
+        self.__checksum = checksum
+        self.__unsynced: dict[str, int] = {}
+        self.__lock = threading.Lock()
+
+    def save(self, data, filename: str, serializer: ISerializer) -> None:
+        """
+        Atomically replace snapshot file with data.
+
+        :raise ValueError: If filename is empty.
+        """
         if not filename:
             raise ValueError("filename cannot be empty")
 
-        filename = f"{filename}.{serializer.extension}"
+        path = f"{filename}.{serializer.extension}"
         data = serializer.serialize(data)
-        binary = serializer.binary
+        if not serializer.binary:
+            data = data.encode()
+        if self.__checksum:
+            header = b"%s %d %d %d\n" % (
+                _SNAPSHOT_MAGIC,
+                self.generation(filename, serializer) + 1,
+                zlib.crc32(data),
+                len(data),
+            )
+            data = header + data
 
-        file_path = Path(filename)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                if self.__fsync != FsyncPolicy.NEVER:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
-        with open(file_path, "wb" if binary else "w") as f:
-            f.write(data)
+        if self.__fsync != FsyncPolicy.NEVER:
+            self.__fsync_dir(directory)
+
+    def load(self, filename: str, serializer: ISerializer):
+        """
+        Load data from snapshot file.
+
+        :raise FileNotFoundError: If there is no snapshot.
+        :raise ValueError: If filename is empty or snapshot checksum does not match.
+        """
+        if not filename:
+            raise ValueError("filename cannot be empty")
+
+        path = f"{filename}.{serializer.extension}"
+        with open(path, "rb") as f:
+            data = f.read()
+
+        header = self.__read_header(data)
+        if header:
+            _, checksum, length, start = header
+            data = data[start:]
+            if len(data) != length or zlib.crc32(data) != checksum:
+                raise ValueError(f"Snapshot {path} is corrupted")
+
+        return serializer.deserialize(data if serializer.binary else data.decode())
+
+    def generation(self, filename: str, serializer: ISerializer) -> int:
+        """Return generation of snapshot, 0 if it is missing or has no header."""
+
+        path = f"{filename}.{serializer.extension}"
+        try:
+            with open(path, "rb") as f:
+                header = self.__read_header(f.readline())
+        except FileNotFoundError:
+            return 0
+        return header[0] if header else 0
+
+    def append(
+        self, entries: list[tuple[str, object]], filename: str, serializer: ISerializer
+    ) -> None:
+        """
+        Append entries to log file of data file.
+
+        Every entry is written as a checksummed frame, so a write torn by a
+        crash is detected and dropped on load instead of breaking the log.
+
+        :param entries: (key, value) pairs, None value marks key as deleted.
+        :param filename: Data file name without extension.
+        :param serializer: Serializer of values.
+        """
 
-    @staticmethod
-    def load(filename: str, serializer: ISerializer):
-        """Load data from file."""
         if not filename:
             raise ValueError("filename cannot be empty")
 
-        filename = f"{filename}.{serializer.extension}"
-        binary = serializer.binary
+        frames = [
+            pack_frame(key, None if value is None else self.__encode(value, serializer))
+            for key, value in entries
+        ]
 
-        with open(filename, "rb" if binary else "r") as f:
+        path = f"{filename}.log"
+        with self.__lock, open(path, "ab") as f:
+            f.write(b"".join(frames))
+            if self.__should_sync(path):
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load_log(
+        self, filename: str, serializer: ISerializer
+    ) -> list[tuple[str, object]]:
+        """
+        Load entries from log file of data file.
+
+        Reading stops at the first truncated or corrupted frame, the file is
+        cut there so later appends follow the last valid entry.
+        """
+
+        if not filename:
+            raise ValueError("filename cannot be empty")
+
+        path = f"{filename}.log"
+        if not os.path.exists(path):
+            return []
+
+        with open(path, "rb") as f:
             data = f.read()
 
-            return serializer.deserialize(data) if serializer else data
+        entries = []
+        offset = 0
+        for key, value, _, offset in iter_frames(data):
+            if value is not None:
+                value = serializer.deserialize(
+                    value if serializer.binary else value.decode()
+                )
+            entries.append((key, value))
+
+        if offset < len(data):
+            logger.warning(
+                f"Dropping {len(data) - offset} bytes of broken log tail in {path}"
+            )
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+        return entries
+
+    def clear_log(self, filename: str) -> None:
+        """Remove log file of data file."""
+        if not filename:
+            raise ValueError("filename cannot be empty")
+
+        path = f"{filename}.log"
+        with self.__lock:
+            self.__unsynced.pop(path, None)
+            if not os.path.exists(path):
+                return
+            os.remove(path)
+
+        if self.__fsync != FsyncPolicy.NEVER:
+            self.__fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+    def __should_sync(self, path: str) -> bool:
+        if self.__fsync == FsyncPolicy.ALWAYS:
+            return True
+        if self.__fsync == FsyncPolicy.NEVER:
+            return False
+
+        unsynced = self.__unsynced.get(path, 0) + 1
+        if unsynced < self.__fsync_interval:
+            self.__unsynced[path] = unsynced
+            return False
+        self.__unsynced[path] = 0
+        return True
+
+    @staticmethod
+    def __fsync_dir(directory: str) -> None:
+        """Persist renames and removals in directory (not supported on Windows)."""
+
+        if os.name == "nt":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def __read_header(data: bytes) -> tuple[int, int, int, int] | None:
+        """Return generation, crc32, data length and data offset of snapshot header."""
+
+        if not data.startswith(_SNAPSHOT_MAGIC + b" "):
+            return None
+
+        end = data.index(b"\n") if b"\n" in data else len(data)
+        try:
+            _, generation, checksum, length = data[:end].split()
+            return int(generation), int(checksum), int(length), end + 1
+        except ValueError:
+            raise ValueError("Snapshot header is corrupted")
+
+    @staticmethod
+    def __encode(value, serializer: ISerializer) -> bytes:
+        data = serializer.serialize(value)
+        return data if serializer.binary else data.encode()
@@ -0,0 +1,442 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable
+
+from .frames import iter_frames, pack_frame, read_frame
+from .local_file_manager import FsyncPolicy
+from .record_store import RecordStore
+from ..entity_changes import field_values, restore_fields
+from ....domain import AudioRecordSummary, TranscriptionStatus
+from ....domain.interfaces import IAudioRecord, ISerializer
+
+logger = logging.getLogger(__name__)
+
+# Data file header: magic and id of data file, index is valid only for its id
+_DATA_HEADER = struct.Struct(">6s16s")
+_DATA_MAGIC = b"TREC1\n"
+
+# Patches of a record after which it is written whole, bounds cost of reading it
+_MAX_PATCHES = 16
+
+
+class MappedRecordStore(RecordStore):
+    def __init__(
+        self,
+        path: str,
+        serializer: ISerializer,
+        cache_size: int = 1024,
+        fsync: FsyncPolicy | str = FsyncPolicy.ALWAYS,
+        fsync_interval: int = 100,
+        index_interval: int = 1000,
+        compact_threshold: int = 1 << 20,
+    ):
+        """
+        Record store that decodes records only when they are read.
+
+        Records are appended as checksummed frames to a memory-mapped data
+        file. Offset of every record together with its summary is kept in an
+        index file, so opening the store reads the index only and never
+        decodes transcripts. Decoded records are kept in an LRU cache.
+        Frames appended after the last index save are scanned on open.
+        Patched records get frames of changed fields appended, which are
+        applied to the record frame when it is read.
+
+        :param path: Data file name without extension.
+        :param serializer: Serializer of records.
+        :param cache_size: Max number of decoded records kept in memory.
+        :param fsync: ALWAYS fsyncs every write (once per batch inside a batch),
+        BATCHED fsyncs every fsync_interval writes, NEVER leaves flushing to the OS.
+        :param fsync_interval: Writes between fsyncs with BATCHED policy.
+        :param index_interval: Writes after which index file is saved.
+        :param compact_threshold: Bytes of overwritten records after which data
+        file is rewritten, if they take more than half of it.
+        :raise ValueError: If fsync policy is unknown, data file is not
+        a record store or any size parameter is not positive.
+        """
+
+        if min(cache_size, fsync_interval, index_interval, compact_threshold) < 1:
+            raise ValueError("Cache size, intervals and threshold must be positive")
+
+        self.__data_path = f"{path}.records"
+        self.__index_path = f"{path}.records.idx"
+        self.__serializer = serializer
+        self.__cache_size = cache_size
+        self.__fsync = FsyncPolicy(fsync)
+        self.__fsync_interval = fsync_interval
+        self.__index_interval = index_interval
+        self.__compact_threshold = compact_threshold
+
+        self.__offsets: dict[str, tuple[int, int]] = {}
+        self.__patches: dict[str, list[tuple[int, int]]] = {}
+        self.__summaries: dict[str, AudioRecordSummary] = {}
+        self.__cache: OrderedDict[str, IAudioRecord] = OrderedDict()
+        self.__garbage = 0
+        self.__unindexed = 0
+        self.__unsynced = 0
+        self.__lock = threading.RLock()
+        self.__local = threading.local()
+
+        self.__open()
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__offsets
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def get(self, record_id: str) -> IAudioRecord | None:
+        """Return record, decoding it from data file if it is not cached."""
+
+        with self.__lock:
+            record = self.__cache.get(record_id)
+            if record is not None:
+                self.__cache.move_to_end(record_id)
+                return record
+
+            if record_id not in self.__offsets:
+                return None
+
+            record = self.__load(record_id)
+            self.__cache_put(record_id, record)
+            return record
+
+    def summaries(self) -> Iterable[AudioRecordSummary]:
+        return list(self.__summaries.values())
+
+    def put(self, record: IAudioRecord) -> None:
+        frame = pack_frame(record.id, self.__encode(record))
+        with self.__lock:
+            start = self.__append(frame)
+            self.__drop_offsets(record.id)
+            self.__offsets[record.id] = (start, start + len(frame))
+            self.__summaries[record.id] = AudioRecordSummary.from_record(record)
+            self.__cache_put(record.id, record)
+            self.__after_write()
+
+    def patch(self, record: IAudioRecord, fields: frozenset[str]) -> None:
+        """Append changed fields only, so the frame size depends on the change."""
+
+        with self.__lock:
+            patches = self.__patches.get(record.id, [])
+            if record.id not in self.__offsets or len(patches) >= _MAX_PATCHES:
+                self.put(record)
+                return
+
+            frame = pack_frame(record.id, self.__encode(field_values(record, fields)))
+            start = self.__append(frame)
+            self.__patches[record.id] = [*patches, (start, start + len(frame))]
+            self.__summaries[record.id] = AudioRecordSummary.from_record(record)
+            self.__cache_put(record.id, record)
+            self.__after_write()
+
+    def delete(self, record_id: str) -> None:
+        """:raise KeyError: If record does not exist."""
+
+        with self.__lock:
+            if record_id not in self.__offsets:
+                raise KeyError(record_id)
+
+            frame = pack_frame(record_id, None)
+            self.__append(frame)
+            self.__drop_offsets(record_id)
+            self.__garbage += len(frame)
+            self.__summaries.pop(record_id, None)
+            self.__cache.pop(record_id, None)
+            self.__after_write()
+
+    def begin_batch(self) -> None:
+        """Defer fsync of current thread writes until the batch ends."""
+
+        self.__local.depth = getattr(self.__local, "depth", 0) + 1
+
+    def end_batch(self) -> None:
+        if not getattr(self.__local, "depth", 0):
+            raise RuntimeError("No batch to end")
+
+        self.__local.depth -= 1
+        if not self.__local.depth and self.__fsync == FsyncPolicy.ALWAYS:
+            with self.__lock:
+                if self.__unsynced:
+                    self.__sync()
+
+    def compact(self) -> None:
+        """
+        Rewrite data file with live records only, copying their frames as is.
+        Patched records are written whole.
+        """
+
+        with self.__lock:
+            self.__remap()
+            directory = os.path.dirname(os.path.abspath(self.__data_path))
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.__data_path) + ".",
+                suffix=".tmp",
+                dir=directory,
+            )
+            data_id = uuid.uuid4().bytes
+            offsets = {}
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_DATA_HEADER.pack(_DATA_MAGIC, data_id))
+                    position = _DATA_HEADER.size
+                    for record_id, (start, end) in self.__offsets.items():
+                        if record_id in self.__patches:
+                            record = self.__load(record_id)
+                            frame = pack_frame(record_id, self.__encode(record))
+                        else:
+                            frame = self.__map[start:end]
+                        f.write(frame)
+                        offsets[record_id] = (position, position + len(frame))
+                        position += len(frame)
+                    if self.__fsync != FsyncPolicy.NEVER:
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                self.__close_files()
+                os.replace(temp_path, self.__data_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            finally:
+                if self.__file is None:
+                    self.__open_files()
+
+            self.__offsets = offsets
+            self.__patches = {}
+            self.__garbage = 0
+            self.save_index()
+
+    def save_index(self) -> None:
+        """Atomically write offsets, patches and summaries of records to index file."""
+
+        with self.__lock:
+            index = {
+                "data_id": self.__data_id.hex(),
+                "size": self.__size,
+                "garbage": self.__garbage,
+                "records": {
+                    record_id: [*offsets, *self.__dump_summary(record_id)]
+                    for record_id, offsets in self.__offsets.items()
+                },
+                "patches": self.__patches,
+            }
+
+            directory = os.path.dirname(os.path.abspath(self.__index_path))
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.__index_path) + ".",
+                suffix=".tmp",
+                dir=directory,
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(index, f)
+                    if self.__fsync != FsyncPolicy.NEVER:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(temp_path, self.__index_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            self.__unindexed = 0
+
+    def close(self) -> None:
+        """Save index and close data file."""
+
+        with self.__lock:
+            if self.__file is None:
+                return
+            self.save_index()
+            self.__close_files()
+
+    def __open(self) -> None:
+        if (
+            not os.path.exists(self.__data_path)
+            or os.path.getsize(self.__data_path) < _DATA_HEADER.size
+        ):
+            with open(self.__data_path, "wb") as f:
+                f.write(_DATA_HEADER.pack(_DATA_MAGIC, uuid.uuid4().bytes))
+
+        self.__file = None
+        self.__open_files()
+        start = self.__load_index()
+
+        end = start
+        for record_id, data, frame_start, end in iter_frames(self.__map, start):
+            value = None if data is None else self.__decode(data)
+            if isinstance(value, dict):
+                if record_id in self.__offsets:
+                    self.__patches.setdefault(record_id, []).append((frame_start, end))
+                    record = self.__load(record_id)
+                    self.__summaries[record_id] = AudioRecordSummary.from_record(record)
+                else:
+                    self.__garbage += end - frame_start
+            elif value is None:
+                self.__drop_offsets(record_id)
+                self.__garbage += end - frame_start
+                self.__summaries.pop(record_id, None)
+            else:
+                self.__drop_offsets(record_id)
+                self.__offsets[record_id] = (frame_start, end)
+                self.__summaries[record_id] = AudioRecordSummary.from_record(value)
+            self.__unindexed += 1
+
+        if end < self.__size:
+            logger.warning(
+                f"Dropping {self.__size - end} bytes of broken tail in {self.__data_path}"
+            )
+            self.__close_files()
+            with open(self.__data_path, "r+b") as f:
+                f.truncate(end)
+            self.__open_files()
+
+    def __load_index(self) -> int:
+        """Load index file, return offset of the first frame it does not cover."""
+
+        try:
+            with open(self.__index_path, "r") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return _DATA_HEADER.size
+        except ValueError:
+            logger.warning(f"Index {self.__index_path} is corrupted, rebuilding it")
+            return _DATA_HEADER.size
+
+        if index["data_id"] != self.__data_id.hex() or index["size"] > self.__size:
+            logger.warning(f"Index {self.__index_path} is stale, rebuilding it")
+            return _DATA_HEADER.size
+
+        for record_id, (start, end, *summary) in index["records"].items():
+            self.__offsets[record_id] = (start, end)
+            self.__summaries[record_id] = self.__load_summary(record_id, summary)
+        for record_id, patches in index.get("patches", {}).items():
+            self.__patches[record_id] = [tuple(offsets) for offsets in patches]
+        self.__garbage = index["garbage"]
+        return index["size"]
+
+    def __open_files(self) -> None:
+        self.__file = open(self.__data_path, "r+b")
+        magic, self.__data_id = _DATA_HEADER.unpack(self.__file.read(_DATA_HEADER.size))
+        if magic != _DATA_MAGIC:
+            self.__file.close()
+            self.__file = None
+            raise ValueError(f"{self.__data_path} is not a record store")
+
+        self.__size = self.__file.seek(0, os.SEEK_END)
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __close_files(self) -> None:
+        self.__map.close()
+        self.__file.close()
+        self.__file = None
+
+    def __append(self, frame: bytes) -> int:
+        """Append frame to data file, return its offset."""
+
+        start = self.__size
+        self.__file.seek(start)
+        self.__file.write(frame)
+        self.__file.flush()
+        self.__size += len(frame)
+        self.__unsynced += 1
+
+        if self.__fsync == FsyncPolicy.ALWAYS and getattr(self.__local, "depth", 0):
+            return start
+        if self.__fsync == FsyncPolicy.ALWAYS or (
+            self.__fsync == FsyncPolicy.BATCHED
+            and self.__unsynced >= self.__fsync_interval
+        ):
+            self.__sync()
+        return start
+
+    def __sync(self) -> None:
+        os.fsync(self.__file.fileno())
+        self.__unsynced = 0
+
+    def __remap(self) -> None:
+        """Map appended part of data file too."""
+
+        if len(self.__map) < self.__size:
+            self.__map.close()
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __read(self, start: int, end: int) -> bytes:
+        if end > len(self.__map):
+            self.__remap()
+
+        frame = read_frame(self.__map, start)
+        if frame is None or frame[1] is None:
+            raise ValueError(f"Record at {start} of {self.__data_path} is corrupted")
+        return frame[1]
+
+    def __load(self, record_id: str) -> IAudioRecord:
+        """Decode record frame and apply its patches."""
+
+        record = self.__decode(self.__read(*self.__offsets[record_id]))
+        for offsets in self.__patches.get(record_id, ()):
+            restore_fields(record, self.__decode(self.__read(*offsets)))
+        return record
+
+    def __after_write(self) -> None:
+        self.__unindexed += 1
+        live = self.__size - _DATA_HEADER.size - self.__garbage
+        if self.__garbage >= self.__compact_threshold and self.__garbage > live:
+            self.compact()
+        elif self.__unindexed >= self.__index_interval:
+            self.save_index()
+
+    def __drop_offsets(self, record_id: str) -> None:
+        offsets = self.__offsets.pop(record_id, None)
+        if offsets:
+            self.__garbage += offsets[1] - offsets[0]
+        for start, end in self.__patches.pop(record_id, ()):
+            self.__garbage += end - start
+
+    def __cache_put(self, record_id: str, record: IAudioRecord) -> None:
+        self.__cache[record_id] = record
+        self.__cache.move_to_end(record_id)
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+
+    def __dump_summary(self, record_id: str) -> list:
+        summary = self.__summaries[record_id]
+        return [
+            summary.record_name,
+            summary.storage_id,
+            summary.language,
+            summary.tags,
+            TranscriptionStatus(summary.status).value,
+            summary.last_updated.isoformat(),
+        ]
+
+    @staticmethod
+    def __load_summary(record_id: str, summary: list) -> AudioRecordSummary:
+        record_name, storage_id, language, tags, status, last_updated = summary
+        return AudioRecordSummary(
+            record_id,
+            record_name,
+            storage_id,
+            language,
+            tags,
+            TranscriptionStatus(status),
+            datetime.fromisoformat(last_updated),
+        )
+
+    def __encode(self, value: IAudioRecord | dict) -> bytes:
+        data = self.__serializer.serialize(value)
+        return data if self.__serializer.binary else data.encode()
+
+    def __decode(self, data: bytes) -> IAudioRecord | dict:
+        return self.__serializer.deserialize(
+            data if self.__serializer.binary else data.decode()
+        )
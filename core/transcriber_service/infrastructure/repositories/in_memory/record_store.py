@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from .write_ahead_log import WriteAheadLog
+from ..entity_changes import field_values, restore_fields
+from ....domain import AudioRecordSummary
+from ....domain.interfaces import IAudioRecord, IFileManager, ISerializer
+
+
+class RecordStore(ABC):
+    """Keyed storage of audio records behind local audio repository."""
+
+    @abstractmethod
+    def __contains__(self, record_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get(self, record_id: str) -> IAudioRecord | None:
+        pass
+
+    @abstractmethod
+    def summaries(self) -> Iterable[AudioRecordSummary]:
+        """Return summaries of all stored records, used to build indexes."""
+        pass
+
+    @abstractmethod
+    def put(self, record: IAudioRecord) -> None:
+        pass
+
+    def patch(self, record: IAudioRecord, fields: frozenset[str]) -> None:
+        """
+        Store record of which only given fields changed. Stores that can
+        write changed fields only override it, by default record is put whole.
+        """
+
+        self.put(record)
+
+    @abstractmethod
+    def delete(self, record_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def begin_batch(self) -> None:
+        pass
+
+    @abstractmethod
+    def end_batch(self) -> None:
+        pass
+
+
+class MemoryRecordStore(RecordStore):
+    def __init__(
+        self,
+        path: str,
+        file_manager: IFileManager,
+        serializer: ISerializer,
+        compact_threshold: int = 1000,
+    ):
+        """
+        Record store that keeps every record decoded in memory,
+        persisted as snapshot and write-ahead log.
+
+        :param path: Data file name without extension.
+        :param compact_threshold: Logged changes after which snapshot is rewritten.
+        """
+
+        self.__records: dict[str, IAudioRecord] = {}
+        self.__log = WriteAheadLog(
+            path, file_manager, serializer, lambda: self.__records, compact_threshold
+        )
+
+        try:
+            self.__records = file_manager.load(path, serializer)
+        except FileNotFoundError:
+            self.__records = {}
+
+        for record_id, record in self.__log.replay():
+            if record is None:
+                self.__records.pop(record_id, None)
+            elif isinstance(record, dict):
+                if record_id in self.__records:
+                    restore_fields(self.__records[record_id], record)
+            else:
+                self.__records[record_id] = record
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__records
+
+    def get(self, record_id: str) -> IAudioRecord | None:
+        return self.__records.get(record_id)
+
+    def summaries(self) -> Iterable[AudioRecordSummary]:
+        return [AudioRecordSummary.from_record(r) for r in self.__records.values()]
+
+    def put(self, record: IAudioRecord) -> None:
+        self.__records[record.id] = record
+        self.__log.put(record.id, record)
+
+    def patch(self, record: IAudioRecord, fields: frozenset[str]) -> None:
+        """Log changed fields only, so the entry size depends on the change."""
+
+        self.__records[record.id] = record
+        self.__log.patch(record.id, field_values(record, fields), record)
+
+    def delete(self, record_id: str) -> None:
+        del self.__records[record_id]
+        self.__log.delete(record_id)
+
+    def begin_batch(self) -> None:
+        self.__log.begin_batch()
+
+    def end_batch(self) -> None:
+        self.__log.end_batch()
@@ -1,21 +1,28 @@
 from copy import copy
 
 from ....domain.interfaces import (
+    IBatchingRepository,
     IStorageRepository,
     IStorage,
     ISerializer,
     IFileManager,
 )
+from .write_ahead_log import WriteAheadLog
 
 
-class LocalStorageRepository(IStorageRepository):
+class LocalStorageRepository(IStorageRepository, IBatchingRepository):
     def __init__(
-        self, data_dir: str, file_manager: IFileManager, serializer: ISerializer
+        self,
+        data_dir: str,
+        file_manager: IFileManager,
+        serializer: ISerializer,
+        compact_threshold: int = 1000,
     ):
         """
         Create local storage repository.
 
         :param data_dir: Directory to store local storage data.
+        :param compact_threshold: Logged changes after which snapshot is rewritten.
         """
 
         self.__serializer: ISerializer = serializer
@@ -23,15 +30,29 @@ class LocalStorageRepository(IStorageRepository):
         self.__file_manager: IFileManager = file_manager
         self.__user_storage_map: dict[str, str] = {}
         self.__dir: str = data_dir
+        self.__log = WriteAheadLog(
+            data_dir,
+            file_manager,
+            serializer,
+            lambda: (self.__storages, self.__user_storage_map),
+            compact_threshold,
+        )
 
         try:
             self.__storages, self.__user_storage_map = self.__file_manager.load(
                 data_dir,
                 self.__serializer,
             )
-        except:
+        except FileNotFoundError:
             pass
 
+        for storage_id, storage in self.__log.replay():
+            if storage is None:
+                self.__remove(storage_id)
+            else:
+                self.__storages[storage_id] = storage
+                self.__user_storage_map[storage.user_id] = storage_id
+
     def get_by_id(self, storage_id: str) -> IStorage | None:
         """Return storage object copy if it exists by ID else None."""
 
@@ -56,11 +77,13 @@ class LocalStorageRepository(IStorageRepository):
 
         self.__storages[storage.id] = storage
         self.__user_storage_map[storage.user_id] = storage.id
-        self.__save()
+        self.__log.put(storage.id, storage)
+        storage.mark_clean()
 
     def update(self, storage: IStorage) -> None:
         """
-        Update storage object in storage repository.
+        Update storage object in storage repository, nothing is logged
+        if storage did not change since it was read.
 
         :param storage: New storage value.
         :raise ValueError: If storage does not exist.
@@ -69,18 +92,45 @@ class LocalStorageRepository(IStorageRepository):
         if storage.id not in self.__storages:
             raise ValueError("Storage not found")
         self.__storages[storage.id] = storage
-        self.__save()
+        if storage.dirty_fields:
+            self.__log.put(storage.id, storage)
+            storage.mark_clean()
 
     def delete(self, storage_id: str) -> None:
         if storage_id not in self.__storages:
             raise ValueError("Storage not found")
 
-        del self.__storages[storage_id]
-        self.__save()
+        self.__remove(storage_id)
+        self.__log.delete(storage_id)
 
-    def __save(self):
-        self.__file_manager.save(
-            (self.__storages, self.__user_storage_map),
-            self.__dir,
-            self.__serializer,
-        )
+    def add_audio_record(self, storage_id: str, record_id: str) -> None:
+        """:raise ValueError: If storage does not exist."""
+
+        storage = self.__storages.get(storage_id)
+        if storage is None:
+            raise ValueError("Storage not found")
+        storage.add_audio_record(record_id)
+        self.__log.put(storage_id, storage)
+        storage.mark_clean()
+
+    def remove_audio_record(self, storage_id: str, record_id: str) -> None:
+        """:raise ValueError: If storage does not exist."""
+
+        storage = self.__storages.get(storage_id)
+        if storage is None:
+            raise ValueError("Storage not found")
+        if record_id in storage.audio_record_ids:
+            storage.remove_audio_record(record_id)
+            self.__log.put(storage_id, storage)
+            storage.mark_clean()
+
+    def begin_batch(self) -> None:
+        self.__log.begin_batch()
+
+    def end_batch(self) -> None:
+        self.__log.end_batch()
+
+    def __remove(self, storage_id: str) -> None:
+        storage = self.__storages.pop(storage_id, None)
+        if storage and self.__user_storage_map.get(storage.user_id) == storage_id:
+            del self.__user_storage_map[storage.user_id]
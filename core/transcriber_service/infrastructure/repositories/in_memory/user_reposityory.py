@@ -1,66 +1,112 @@
+import logging
+from typing import Iterator
+
 from ....domain.interfaces import (
+    IBatchingRepository,
     IUser,
     IUserRepository,
     ISerializer,
     IFileManager,
 )
+from .write_ahead_log import WriteAheadLog
+from ..entity_changes import USER_FIELDS, changed_fields, field_values, restore_fields
+
+logger = logging.getLogger(__name__)
 
 
-class LocalUserRepository(IUserRepository):
+class LocalUserRepository(IUserRepository, IBatchingRepository):
     def __init__(
-        self, data_dir: str, file_manager: IFileManager, serializer: ISerializer
+        self,
+        data_dir: str,
+        file_manager: IFileManager,
+        serializer: ISerializer,
+        compact_threshold: int = 1000,
     ):
         """
         Create local user repository.
 
         :param data_dir: Directory to store local user data.
+        :param compact_threshold: Logged changes after which snapshot is rewritten.
         """
 
         self.__serializer = serializer
         self.__file_manager = file_manager
         self._users: dict[str, IUser] = {}
+        self.__emails: dict[str, str] = {}
+        self.__user_emails: dict[str, str] = {}
         self.__dir: str = data_dir
+        self.__log = WriteAheadLog(
+            data_dir, file_manager, serializer, lambda: self._users, compact_threshold
+        )
 
         try:
             self._users = self.__file_manager.load(data_dir, self.__serializer)
-        except Exception as e:
+        except FileNotFoundError:
             pass
 
+        for user_id, user in self.__log.replay():
+            if user is None:
+                self._users.pop(user_id, None)
+            elif isinstance(user, dict):
+                if user_id in self._users:
+                    restore_fields(self._users[user_id], user)
+            else:
+                self._users[user_id] = user
+
+        # Users are all decoded above, so the email index is rebuilt with
+        # them instead of being persisted and kept in sync with the log
+        for user in self._users.values():
+            try:
+                self.__index_email(user)
+            except ValueError:
+                logger.warning(f"User {user.id} has duplicate email {user.email}")
+
     def get_by_id(self, user_id: str) -> IUser | None:
         """Return user by its ID if it exists else None."""
 
         return self._users.get(user_id)
 
     def get_by_email(self, email: str) -> IUser | None:
-        """Return user by email if it exists else None."""
+        """Return user by email (case insensitive) if it exists else None."""
 
-        return next((u for u in self._users.values() if u.email == email), None)
+        user_id = self.__emails.get(self.__email_key(email))
+        return self._users.get(user_id) if user_id else None
 
     def add(self, user: IUser) -> None:
         """
         Add user to repository.
 
         :param user: New user.
-        :raise ValueError: If user already exists.
+        :raise ValueError: If user or user with the same email already exists.
         """
 
         if user.id in self._users:
             raise ValueError("User already exists")
+        self.__index_email(user)
         self._users[user.id] = user
-        self.__save()
+        self.__log.put(user.id, user)
+        user.mark_clean()
 
     def update(self, user: IUser) -> None:
         """
-        Update user in repository.
+        Update user in repository. Only changed fields are logged if user
+        was read from repository.
 
         :param user: New user value.
-        :raise ValueError: If user does not exist.
+        :raise ValueError: If user does not exist or email belongs to other user.
         """
 
         if user.id not in self._users:
             raise ValueError("User not found")
+        self.__index_email(user)
         self._users[user.id] = user
-        self.__save()
+
+        fields = changed_fields(user, USER_FIELDS)
+        if fields is None:
+            self.__log.put(user.id, user)
+        elif fields:
+            self.__log.patch(user.id, field_values(user, fields), user)
+        user.mark_clean()
 
     def delete(self, user: IUser) -> None:
         """
@@ -73,12 +119,63 @@ class LocalUserRepository(IUserRepository):
         if user.id not in self._users:
             raise ValueError("User not found")
         self._users.pop(user.id)
-        self.__save()
+        self.__emails.pop(self.__user_emails.pop(user.id), None)
+        self.__log.delete(user.id)
 
     def get_all(self) -> list[IUser]:
         """Return all users in repository."""
 
         return list(self._users.values())
 
-    def __save(self):
-        self.__file_manager.save(self._users, self.__dir, self.__serializer)
+    def iter_users(
+        self,
+        batch_size: int = 100,
+        blocked: bool | None = None,
+        email_prefix: str | None = None,
+        after: str | None = None,
+    ) -> Iterator[IUser]:
+        """
+        Stream users ordered by email, filtered as requested. Email prefix
+        is matched case insensitive, as emails are.
+        """
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        prefix = self.__email_key(email_prefix) if email_prefix else None
+        for user in sorted(self._users.values(), key=lambda u: u.email):
+            if blocked is not None and user.is_blocked != blocked:
+                continue
+            if prefix and not self.__email_key(user.email).startswith(prefix):
+                continue
+            if after is not None and user.email <= after:
+                continue
+            yield user
+
+    def begin_batch(self) -> None:
+        self.__log.begin_batch()
+
+    def end_batch(self) -> None:
+        self.__log.end_batch()
+
+    def __index_email(self, user: IUser) -> None:
+        """
+        Point email index to user, dropping previous email of user.
+
+        :raise ValueError: If email belongs to other user.
+        """
+
+        key = self.__email_key(user.email)
+        owner = self.__emails.get(key)
+        if owner is not None and owner != user.id:
+            raise ValueError(f"User with email {user.email} already exists")
+
+        previous = self.__user_emails.get(user.id)
+        if previous is not None and previous != key:
+            del self.__emails[previous]
+        self.__emails[key] = user.id
+        self.__user_emails[user.id] = key
+
+    @staticmethod
+    def __email_key(email: str) -> str:
+        return email.lower()
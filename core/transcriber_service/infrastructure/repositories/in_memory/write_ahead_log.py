@@ -0,0 +1,115 @@
+import threading
+from typing import Callable
+
+from ..write_batch import WriteBatch
+from ....domain.interfaces import IFileManager, ISerializer
+
+_MISSING = object()
+
+
+class WriteAheadLog(object):
+    def __init__(
+        self,
+        path: str,
+        file_manager: IFileManager,
+        serializer: ISerializer,
+        snapshot: Callable[[], object],
+        compact_threshold: int = 1000,
+    ):
+        """
+        Append-only change log of local repository.
+
+        Every change is appended as one entry, so a write costs the size of
+        changed value only. After compact_threshold entries the repository
+        state is saved as a new snapshot and the log is cleared.
+
+        :param path: Data file name without extension.
+        :param file_manager: File manager that stores snapshot and log.
+        :param serializer: Serializer of snapshot and log values.
+        :param snapshot: Returns repository state to save on compaction.
+        :param compact_threshold: Log entries after which snapshot is rewritten.
+        :raise ValueError: If compact_threshold is not positive.
+
+        Inside a batch changes of current thread are coalesced per key and
+        appended by one write when the batch ends.
+        """
+
+        if compact_threshold < 1:
+            raise ValueError("Compact threshold must be positive")
+
+        self.__path = path
+        self.__file_manager = file_manager
+        self.__serializer = serializer
+        self.__snapshot = snapshot
+        self.__compact_threshold = compact_threshold
+        self.__size = 0
+        self.__lock = threading.RLock()
+        self.__batch = WriteBatch(self.__write)
+
+    def replay(self) -> list[tuple[str, object]]:
+        """
+        Return logged (key, value) changes to apply over loaded snapshot,
+        None value means deleted key and dict value means changed fields
+        of key value.
+        """
+
+        entries = list(self.__file_manager.load_log(self.__path, self.__serializer))
+        self.__size = len(entries)
+        return entries
+
+    def put(self, key: str, value) -> None:
+        self.__append(key, value)
+
+    def patch(self, key: str, changes: dict, value) -> None:
+        """
+        Append changed fields of value instead of the whole value. Inside
+        a batch changes are merged with pending changes of key, and
+        a pending write of whole key value is replaced by the new value.
+
+        :param changes: Changed fields of value as plain data.
+        :param value: Whole value with changes applied.
+        """
+
+        if not self.__batch.active:
+            self.__write({key: changes})
+            return
+
+        pending = self.__batch.get(key, _MISSING)
+        if pending is _MISSING:
+            self.__batch.add(key, changes)
+        elif isinstance(pending, dict):
+            self.__batch.add(key, {**pending, **changes})
+        else:
+            self.__batch.add(key, value)
+
+    def delete(self, key: str) -> None:
+        self.__append(key, None)
+
+    def begin_batch(self) -> None:
+        self.__batch.begin()
+
+    def end_batch(self) -> None:
+        self.__batch.end()
+
+    def compact(self) -> None:
+        """Save repository state as snapshot and clear the log."""
+
+        with self.__lock:
+            self.__file_manager.save(self.__snapshot(), self.__path, self.__serializer)
+            self.__file_manager.clear_log(self.__path)
+            self.__size = 0
+
+    def __append(self, key: str, value) -> None:
+        if self.__batch.active:
+            self.__batch.add(key, value)
+        else:
+            self.__write({key: value})
+
+    def __write(self, entries: dict[str, object]) -> None:
+        with self.__lock:
+            self.__file_manager.append(
+                list(entries.items()), self.__path, self.__serializer
+            )
+            self.__size += len(entries)
+            if self.__size >= self.__compact_threshold:
+                self.compact()
@@ -1,5 +1,13 @@
 from .mongo_audio_repository import *
+from .mongo_connection_provider import *
 from .mongo_storage_repository import *
+from .mongo_transcript_store import *
 from .mongo_user_repository import *
 
-__all__ = ["MongoUserRepository", "MongoAudioRepository", "MongoStorageRepository"]
+__all__ = [
+    "MongoUserRepository",
+    "MongoAudioRepository",
+    "MongoStorageRepository",
+    "MongoConnectionProvider",
+    "MongoTranscriptStore",
+]
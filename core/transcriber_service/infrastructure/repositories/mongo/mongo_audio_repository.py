@@ -1,109 +1,403 @@
+import re
+from datetime import datetime
+
 from bson.binary import Binary
-from pymongo import MongoClient
+from pymongo import UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
+from ....domain import AudioRecordSummary, TranscriptionStatus
+from .mongo_connection_provider import MongoConnectionProvider
+from ..entity_changes import AUDIO_RECORD_FIELDS, changed_fields, restore_fields
+from ..stored_text import attach_text, detach_text
+from ..write_batch import WriteBatch
 from ....domain.interfaces import (
     IAudioRepository,
+    IBatchingRepository,
     IStorageRepository,
     ISerializer,
     IAudioRecord,
+    ITranscriptStore,
 )
 
 
-class MongoAudioRepository(IAudioRepository):
+class MongoAudioRepository(IAudioRepository, IBatchingRepository):
+    _SUMMARY_FIELDS = (
+        "storage_id",
+        "tags",
+        "record_name",
+        "record_name_lower",
+        "language",
+        "status",
+        "last_updated",
+    )
+    # Fields read with serialized data, patched fields are newer than it
+    _READ_FIELDS = ("data", "patched", *_SUMMARY_FIELDS)
+
     def __init__(
         self,
         storage_repository: IStorageRepository,
         serializer: ISerializer,
-        mongo_uri: str,
-        db_name: str,
+        connection: MongoConnectionProvider,
         collection_name: str = "audio_records",
+        transcripts: ITranscriptStore | None = None,
     ) -> None:
+        """
+        Create Mongo audio repository. Indexes are created by ensure_indexes.
+
+        :param connection: Shared Mongo connection.
+        :param collection_name: Collection of audio records.
+        :param transcripts: Store of transcripts kept apart from record
+        documents, which are then rewritten without text on metadata changes
+        and read without fetching text. Text is kept in documents if None.
+        """
 
         self.__serializer = serializer
         self.__storage_repository = storage_repository
+        self.__batch = WriteBatch(self.__write_updates)
+        self.__collection: Collection = connection.collection(collection_name)
+        self.__transcripts = transcripts
 
-        self.__client = MongoClient(mongo_uri)
-        self.__db = self.__client[db_name]
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes of collection and store query fields of documents
+        written before they were kept. Does nothing if it is already done.
+        """
 
-        self.__collection: Collection = self.__db[collection_name]
         self.__collection.create_index("storage_id")
         self.__collection.create_index("tags")
+        self.__collection.create_index([("storage_id", 1), ("tags", 1)])
+        self.__collection.create_index([("storage_id", 1), ("record_name_lower", 1)])
+        self.__collection.create_index(
+            [("storage_id", 1), ("last_updated", -1), ("_id", -1)]
+        )
+        self.__backfill()
 
-    def get_by_storage(self, storage_id: str) -> tuple[IAudioRecord, ...]:
+    def get_by_storage(
+        self, storage_id: str, offset: int = 0, limit: int | None = None
+    ) -> tuple[IAudioRecord, ...]:
         if not storage_id.strip():
             raise ValueError("Storage ID cannot be empty")
 
-        documents = self.__collection.find({"storage_id": storage_id})
-        return tuple(
-            self.__serializer.deserialize(
-                doc["data"] if self.__serializer.binary else doc["data"].decode()
+        return self.__find({"storage_id": storage_id}, offset, limit)
+
+    def get_summaries_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[AudioRecordSummary, ...]:
+        """
+        Return page of storage record summaries, most recently updated first.
+        Only denormalized fields are fetched, serialized data is not read.
+        """
+
+        documents = self.__find_page(storage_id, limit, after, self._SUMMARY_FIELDS)
+        return tuple(self.__summary(doc) for doc in documents)
+
+    def get_summaries(self, record_ids: list[str]) -> tuple[AudioRecordSummary, ...]:
+        """
+        Return summaries of given records with one query of denormalized
+        fields, in the given order. Missing records are skipped.
+        """
+
+        if not record_ids:
+            return ()
+
+        self.__batch.flush()
+        documents = {
+            doc["_id"]: doc
+            for doc in self.__collection.find(
+                {"_id": {"$in": list(record_ids)}},
+                dict.fromkeys(self._SUMMARY_FIELDS, 1),
             )
-            for doc in documents
-            if "data" in doc
+        }
+        return tuple(
+            self.__summary(documents[record_id])
+            for record_id in record_ids
+            if record_id in documents
+        )
+
+    def get_page_by_storage(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Return page of storage records, most recently updated first.
+        Keyset query on the (storage_id, last_updated, _id) index, so the
+        cost does not depend on the page position.
+        """
+
+        documents = self.__find_page(storage_id, limit, after, self._READ_FIELDS)
+        return tuple(self.__deserialize(doc) for doc in documents if "data" in doc)
+
+    def search_by_tags(
+        self,
+        storage_id: str,
+        tags: list[str],
+        match_all: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        if not tags:
+            return self.get_by_storage(storage_id, offset, limit) if match_all else ()
+
+        tags = list({tag.lower() for tag in tags})
+        return self.__find(
+            {
+                "storage_id": storage_id,
+                "tags": {"$all" if match_all else "$in": tags},
+            },
+            offset,
+            limit,
+        )
+
+    def search_by_name(
+        self,
+        storage_id: str,
+        name: str,
+        prefix: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[IAudioRecord, ...]:
+        """
+        Search records by name on the server. Prefix search is an anchored
+        regex, so it is answered from the (storage_id, record_name_lower) index.
+        """
+
+        pattern = re.escape(name.lower())
+        return self.__find(
+            {
+                "storage_id": storage_id,
+                "record_name_lower": {"$regex": "^" + pattern if prefix else pattern},
+            },
+            offset,
+            limit,
         )
 
     def get_by_id(self, record_id: str) -> IAudioRecord:
         if not record_id.strip():
             raise ValueError("Record ID cannot be empty")
+        pending = self.__batch.get(record_id)
+        if pending:
+            return pending
+
         doc = self.__collection.find_one({"_id": record_id})
         if not doc:
             raise ValueError("Record ID not found")
 
-        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
-        return self.__serializer.deserialize(data)
+        return self.__deserialize(doc)
 
     def add(self, record: IAudioRecord) -> None:
-        if self.__collection.find_one({"_id": record.id}):
+        """
+        Add record. Its id is added to storage first, so a missing storage
+        is reported before the record is written.
+        """
+
+        self.__batch.flush()
+        self.__storage_repository.add_audio_record(record.storage_id, record.id)
+        try:
+            self.__collection.insert_one({"_id": record.id, **self.__document(record)})
+        except DuplicateKeyError:
             raise ValueError(f"Record with ID {record.id} already exists")
+        record.mark_clean()
 
-        storage = self.__storage_repository.get_by_id(record.storage_id)
-        if not storage:
-            raise ValueError(f"Storage with ID {record.storage_id} not found")
+    def update(self, record: IAudioRecord) -> None:
+        """
+        Update record. Inside a batch the update is deferred, updates of one
+        record are coalesced and sent with one bulk_write when batch ends.
 
-        storage.add_audio_record(record.id)
-        self.__storage_repository.update(storage)
+        Changed fields of a record read from repository are written with
+        $set of their query fields, serialized data is not rewritten.
+        """
 
-        serialized = self.__serializer.serialize(record)
-        doc = {
-            "_id": record.id,
-            "storage_id": record.storage_id,
-            "tags": record.tags,
-            "data": (
-                Binary(serialized)
-                if self.__serializer.binary
-                else Binary(serialized.encode())
-            ),
-        }
-        self.__collection.insert_one(doc)
+        if self.__batch.active:
+            self.__batch.add(record.id, record)
+            return
 
-    def update(self, record: IAudioRecord) -> None:
-        if not self.__collection.find_one({"_id": record.id}):
+        change = self.__change(record)
+        if change:
+            result = self.__collection.update_one({"_id": record.id}, change)
+            matched = result.matched_count
+        else:
+            matched = self.__collection.count_documents({"_id": record.id}, limit=1)
+        if not matched:
             raise ValueError(f"Record with ID {record.id} not found")
+        record.mark_clean()
+
+    def delete(self, record_id: str) -> None:
+        self.__batch.flush()
+        doc = self.__collection.find_one_and_delete(
+            {"_id": record_id}, projection={"storage_id": 1}
+        )
+        if not doc:
+            raise ValueError(f"Record with ID {record_id} not found")
+
+        if self.__transcripts:
+            self.__transcripts.delete(record_id)
+        try:
+            self.__storage_repository.remove_audio_record(doc["storage_id"], record_id)
+        except ValueError:
+            pass  # storage was already deleted
+
+    def begin_batch(self) -> None:
+        self.__batch.begin()
+
+    def end_batch(self) -> None:
+        self.__batch.end()
+
+    def __write_updates(self, records: dict[str, IAudioRecord]) -> None:
+        changes = {}
+        for record_id, record in records.items():
+            change = self.__change(record)
+            if change:
+                changes[record_id] = change
+
+        if changes:
+            result = self.__collection.bulk_write(
+                [
+                    UpdateOne({"_id": record_id}, change)
+                    for record_id, change in changes.items()
+                ],
+                ordered=False,
+            )
+            if result.matched_count < len(changes):
+                raise ValueError(
+                    f"{len(changes) - result.matched_count} updated records not found"
+                )
+        for record in records.values():
+            record.mark_clean()
 
+    def __change(self, record: IAudioRecord) -> dict | None:
+        """
+        Return update of record document, None if nothing changed.
+        A text change rewrites the whole document: serialized data holds
+        the text if there is no transcript store, and otherwise may still
+        hold inline text of a record written before, which must be dropped.
+        """
+
+        fields = changed_fields(record, AUDIO_RECORD_FIELDS)
+        if fields is None or "text" in fields:
+            return {"$set": self.__document(record), "$unset": {"patched": ""}}
+        if not fields:
+            return None
+
+        values = {
+            key: value
+            for key, value in self.__query_fields(record).items()
+            if key in fields or (key == "record_name_lower" and "record_name" in fields)
+        }
+        return {"$set": values, "$addToSet": {"patched": {"$each": sorted(fields)}}}
+
+    @staticmethod
+    def __summary(doc: dict) -> AudioRecordSummary:
+        return AudioRecordSummary(
+            doc["_id"],
+            doc["record_name"],
+            doc["storage_id"],
+            doc["language"],
+            doc["tags"],
+            TranscriptionStatus(doc["status"]),
+            doc["last_updated"],
+        )
+
+    def __document(self, record: IAudioRecord) -> dict:
+        if self.__transcripts:
+            record = detach_text(record, self.__transcripts)
         serialized = self.__serializer.serialize(record)
-        doc = {
-            "storage_id": record.storage_id,
-            "tags": record.tags,
+        return {
+            **self.__query_fields(record),
             "data": (
                 Binary(serialized)
                 if self.__serializer.binary
                 else Binary(serialized.encode())
             ),
         }
-        self.__collection.update_one({"_id": record.id}, {"$set": doc})
 
-    def delete(self, record_id: str) -> None:
-        doc = self.__collection.find_one({"_id": record_id})
-        if not doc:
-            raise ValueError(f"Record with ID {record_id} not found")
+    def __find(
+        self, query: dict, offset: int, limit: int | None
+    ) -> tuple[IAudioRecord, ...]:
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit cannot be negative")
+
+        self.__batch.flush()
+        cursor = self.__collection.find(query, dict.fromkeys(self._READ_FIELDS, 1))
+        if offset or limit is not None:
+            cursor = cursor.sort("_id", 1).skip(offset)
+            if limit is not None:
+                if not limit:
+                    return ()
+                cursor = cursor.limit(limit)
+
+        return tuple(self.__deserialize(doc) for doc in cursor if "data" in doc)
 
+    def __find_page(
+        self,
+        storage_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None,
+        fields: tuple[str, ...],
+    ) -> list[dict]:
+        if limit < 0:
+            raise ValueError("Limit cannot be negative")
+        if not limit:
+            return []
+
+        self.__batch.flush()
+        query = {"storage_id": storage_id}
+        if after:
+            # BSON dates keep milliseconds only, compare with the stored value
+            last_updated = after[0].replace(
+                microsecond=after[0].microsecond // 1000 * 1000
+            )
+            query["$or"] = [
+                {"last_updated": {"$lt": last_updated}},
+                {"last_updated": last_updated, "_id": {"$lt": after[1]}},
+            ]
+
+        return list(
+            self.__collection.find(query, dict.fromkeys(fields, 1))
+            .sort([("last_updated", -1), ("_id", -1)])
+            .limit(limit)
+        )
+
+    def __deserialize(self, doc: dict) -> IAudioRecord:
         record = self.__serializer.deserialize(
             doc["data"] if self.__serializer.binary else doc["data"].decode()
         )
-        storage = self.__storage_repository.get_by_id(record.storage_id)
-        if storage:
-            storage.remove_audio_record(record_id)
-            self.__storage_repository.update(storage)
+        if doc.get("patched"):
+            restore_fields(record, {field: doc[field] for field in doc["patched"]})
+        if self.__transcripts:
+            record = attach_text(record, self.__transcripts)
+        return record
+
+    def __backfill(self) -> None:
+        """Store query fields for documents written before they were kept."""
+
+        documents = self.__collection.find(
+            {"$or": [{field: {"$exists": False}} for field in self._SUMMARY_FIELDS]},
+            {"data": 1},
+        )
+        for doc in documents:
+            if "data" not in doc:
+                continue
+            self.__collection.update_one(
+                {"_id": doc["_id"]},
+                {"$set": self.__query_fields(self.__deserialize(doc))},
+            )
 
-        self.__collection.delete_one({"_id": record_id})
+    @staticmethod
+    def __query_fields(record: IAudioRecord) -> dict:
+        """Record fields stored next to serialized data for queries and summaries."""
+
+        return {
+            "storage_id": record.storage_id,
+            "tags": record.tags,
+            "record_name": record.record_name,
+            "record_name_lower": record.record_name.lower(),
+            "language": record.language,
+            "status": record.status.value,
+            "last_updated": record.last_updated,
+        }
@@ -0,0 +1,65 @@
+from pymongo import MongoClient
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+
+class MongoConnectionProvider(object):
+    def __init__(
+        self,
+        mongo_uri: str,
+        db_name: str,
+        max_pool_size: int = 100,
+        min_pool_size: int = 0,
+        connect_timeout_ms: int = 20000,
+        server_selection_timeout_ms: int = 30000,
+        socket_timeout_ms: int | None = None,
+        read_preference: str = "primary",
+        compressors: list[str] | None = None,
+    ):
+        """
+        One MongoClient and its connection pool shared by all repositories
+        of the process.
+
+        :param mongo_uri: MongoDB connection string.
+        :param db_name: Database of repositories.
+        :param max_pool_size: Max number of pooled connections per server.
+        :param min_pool_size: Number of connections kept open when idle.
+        :param connect_timeout_ms: Timeout of opening a connection.
+        :param server_selection_timeout_ms: Timeout of finding a suitable server.
+        :param socket_timeout_ms: Timeout of a single operation, None waits forever.
+        :param read_preference: Read preference mode, e.g. "primaryPreferred".
+        :param compressors: Wire compressors in order of preference,
+        e.g. ["zstd", "snappy", "zlib"], None disables compression.
+        :raise ValueError: If db_name is empty or pool sizes are invalid.
+        """
+
+        if not db_name:
+            raise ValueError("Database name cannot be empty")
+        if max_pool_size < 1 or not 0 <= min_pool_size <= max_pool_size:
+            raise ValueError("Invalid connection pool size")
+
+        options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "connectTimeoutMS": connect_timeout_ms,
+            "serverSelectionTimeoutMS": server_selection_timeout_ms,
+            "socketTimeoutMS": socket_timeout_ms,
+            "readPreference": read_preference,
+        }
+        if compressors:
+            options["compressors"] = ",".join(compressors)
+
+        self.__client = MongoClient(mongo_uri, **options)
+        self.__db = self.__client[db_name]
+
+    @property
+    def database(self) -> Database:
+        return self.__db
+
+    def collection(self, name: str) -> Collection:
+        return self.__db[name]
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        self.__client.close()
@@ -1,73 +1,214 @@
 from bson.binary import Binary
-from pymongo import MongoClient
+from pymongo import UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
+from .mongo_connection_provider import MongoConnectionProvider
+from ..write_batch import WriteBatch
 from ....domain.interfaces import (
+    IBatchingRepository,
     IStorageRepository,
     ISerializer,
     IStorage,
 )
 
 
-class MongoStorageRepository(IStorageRepository):
+class MongoStorageRepository(IStorageRepository, IBatchingRepository):
     def __init__(
         self,
         serializer: ISerializer,
-        mongo_uri: str,
-        db_name: str,
+        connection: MongoConnectionProvider,
         collection_name: str = "storages",
     ) -> None:
+        """
+        Create Mongo storage repository. Indexes are created by ensure_indexes.
+
+        :param connection: Shared Mongo connection.
+        :param collection_name: Collection of storages.
+        """
 
         self.__serializer = serializer
+        self.__batch = WriteBatch(self.__write_updates)
+        self.__collection: Collection = connection.collection(collection_name)
+
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes of collection, does nothing if they exist.
+
+        user_id index is unique, so one storage per user is enforced by the
+        database. Non-unique index of older deployments is replaced.
+        """
 
-        self.__client = MongoClient(mongo_uri)
-        self.__db = self.__client[db_name]
-        self.__collection: Collection = self.__db[collection_name]
+        try:
+            self.__collection.create_index("user_id", unique=True)
+        except OperationFailure as e:
+            if e.code not in (85, 86):  # IndexOptionsConflict, IndexKeySpecsConflict
+                raise
+            self.__collection.drop_index("user_id_1")
+            self.__collection.create_index("user_id", unique=True)
 
-        self.__collection.create_index("user_id")
+        for doc in self.__collection.find({"audio_record_ids": {"$exists": False}}):
+            self.__backfill_records(doc)
 
     def get_by_id(self, storage_id: str) -> IStorage:
+        pending = self.__batch.get(storage_id)
+        if pending:
+            return pending
+
         doc = self.__collection.find_one({"_id": storage_id})
         if not doc:
             raise ValueError("Storage not found")
 
-        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
-        return self.__serializer.deserialize(data)
+        return self.__deserialize(doc)
 
     def get_by_user(self, user_id: str) -> IStorage:
         if not user_id.strip():
             raise ValueError("user_id cannot be empty")
+        self.__batch.flush()
         doc = self.__collection.find_one({"user_id": user_id})
         if not doc:
             raise ValueError("Storage not found")
 
-        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
-        return self.__serializer.deserialize(data)
+        return self.__deserialize(doc)
 
     def add(self, storage: IStorage) -> None:
-        if self.__collection.find_one({"_id": storage.id}):
+        self.__batch.flush()
+        try:
+            self.__collection.insert_one(
+                {
+                    "_id": storage.id,
+                    "audio_record_ids": storage.audio_record_ids,
+                    **self.__document(storage),
+                }
+            )
+        except DuplicateKeyError as e:
+            if "user_id" in (e.details or {}).get("keyPattern", {}):
+                raise ValueError(
+                    f"User with ID {storage.user_id} already has a storage"
+                )
             raise ValueError(f"Storage with ID {storage.id} already exists")
-        if self.__collection.find_one({"user_id": storage.user_id}):
-            raise ValueError(f"User with ID {storage.user_id} already has a storage")
-
-        serialized = self.__serializer.serialize(storage)
-        doc = {
-            "_id": storage.id,
-            "user_id": storage.user_id,
-            "data": (
-                Binary(serialized)
-                if self.__serializer.binary
-                else Binary(serialized.encode())
-            ),
-        }
-        self.__collection.insert_one(doc)
+        storage.mark_clean()
 
     def update(self, storage: IStorage) -> None:
-        if not self.__collection.find_one({"_id": storage.id}):
+        """
+        Update storage. Inside a batch the update is deferred, updates of one
+        storage are coalesced and sent with one bulk_write when batch ends.
+        Record ids are not written, they are changed by add_audio_record and
+        remove_audio_record only, so a storage with no other changes since
+        it was read is not written.
+        """
+
+        if self.__batch.active:
+            self.__batch.add(storage.id, storage)
+            return
+
+        if storage.dirty_fields - {"audio_record_ids"}:
+            result = self.__collection.update_one(
+                {"_id": storage.id}, {"$set": self.__document(storage)}
+            )
+            matched = result.matched_count
+        else:
+            matched = self.__collection.count_documents({"_id": storage.id}, limit=1)
+        if not matched:
             raise ValueError(f"Storage with ID {storage.id} not found")
+        storage.mark_clean()
+
+    def delete(self, storage_id: str) -> None:
+        self.__batch.flush()
+        if not self.__collection.delete_one({"_id": storage_id}).deleted_count:
+            raise ValueError(f"Storage with ID {storage_id} not found")
+
+    def add_audio_record(self, storage_id: str, record_id: str) -> None:
+        """Add record id with $addToSet, in one round trip without reading storage."""
+
+        self.__change_records(
+            storage_id, {"$addToSet": {"audio_record_ids": record_id}}
+        )
+        pending = self.__batch.get(storage_id)
+        if pending:
+            pending.add_audio_record(record_id)
 
+    def remove_audio_record(self, storage_id: str, record_id: str) -> None:
+        """Remove record id with $pull, in one round trip without reading storage."""
+
+        self.__change_records(storage_id, {"$pull": {"audio_record_ids": record_id}})
+        pending = self.__batch.get(storage_id)
+        if pending and record_id in pending.audio_record_ids:
+            pending.remove_audio_record(record_id)
+
+    def begin_batch(self) -> None:
+        self.__batch.begin()
+
+    def end_batch(self) -> None:
+        self.__batch.end()
+
+    def __write_updates(self, storages: dict[str, IStorage]) -> None:
+        changed = {
+            storage_id: storage
+            for storage_id, storage in storages.items()
+            if storage.dirty_fields - {"audio_record_ids"}
+        }
+        if changed:
+            result = self.__collection.bulk_write(
+                [
+                    UpdateOne({"_id": storage_id}, {"$set": self.__document(storage)})
+                    for storage_id, storage in changed.items()
+                ],
+                ordered=False,
+            )
+            if result.matched_count < len(changed):
+                raise ValueError(
+                    f"{len(changed) - result.matched_count} updated storages not found"
+                )
+        for storage in storages.values():
+            storage.mark_clean()
+
+    def __change_records(self, storage_id: str, change: dict) -> None:
+        """
+        Apply change to record ids array. Storage written before the array
+        was kept gets it from serialized data first, else the array created
+        by the change would hide record ids kept in data only.
+        """
+
+        query = {"_id": storage_id, "audio_record_ids": {"$exists": True}}
+        if self.__collection.update_one(query, change).matched_count:
+            return
+
+        doc = self.__collection.find_one({"_id": storage_id})
+        if doc:
+            self.__backfill_records(doc)
+        if not doc or not self.__collection.update_one(query, change).matched_count:
+            raise ValueError(f"Storage with ID {storage_id} not found")
+
+    def __backfill_records(self, doc: dict) -> None:
+        """Store record ids array of storage written before it was kept."""
+
+        self.__collection.update_one(
+            {"_id": doc["_id"], "audio_record_ids": {"$exists": False}},
+            {"$set": {"audio_record_ids": self.__deserialize(doc).audio_record_ids}},
+        )
+
+    def __deserialize(self, doc: dict) -> IStorage:
+        """Decode storage, record ids are taken from the array field."""
+
+        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
+        storage = self.__serializer.deserialize(data)
+        if "audio_record_ids" not in doc:
+            return storage
+
+        stored = set(storage.audio_record_ids)
+        current = set(doc["audio_record_ids"])
+        for record_id in stored - current:
+            storage.remove_audio_record(record_id)
+        for record_id in doc["audio_record_ids"]:
+            if record_id not in stored:
+                storage.add_audio_record(record_id)
+        storage.mark_clean()
+        return storage
+
+    def __document(self, storage: IStorage) -> dict:
         serialized = self.__serializer.serialize(storage)
-        doc = {
+        return {
             "user_id": storage.user_id,
             "data": (
                 Binary(serialized)
@@ -75,11 +216,3 @@ class MongoStorageRepository(IStorageRepository):
                 else Binary(serialized.encode())
             ),
         }
-        self.__collection.update_one({"_id": storage.id}, {"$set": doc})
-
-    def delete(self, storage_id: str) -> None:
-        doc = self.__collection.find_one({"_id": storage_id})
-        if not doc:
-            raise ValueError(f"Storage with ID {storage_id} not found")
-
-        self.__collection.delete_one({"_id": storage_id})
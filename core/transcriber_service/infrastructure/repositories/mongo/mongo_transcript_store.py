@@ -0,0 +1,53 @@
+from bson.binary import Binary
+from pymongo.collection import Collection
+
+from .mongo_connection_provider import MongoConnectionProvider
+from ...serializers.text_compressor import TextCompressor
+from ....domain.interfaces import ITranscriptStore
+
+
+class MongoTranscriptStore(ITranscriptStore):
+    def __init__(
+        self,
+        connection: MongoConnectionProvider,
+        collection_name: str = "audio_transcripts",
+        compressor: TextCompressor | None = None,
+    ):
+        """
+        Transcripts stored in own collection, one document per record, so
+        documents of audio records stay small.
+
+        :param connection: Shared Mongo connection.
+        :param collection_name: Collection of transcripts.
+        :param compressor: Compressor of transcripts, raw text is written if None.
+        """
+
+        self.__collection: Collection = connection.collection(collection_name)
+        self.__compressor = compressor
+
+    def get(self, record_id: str) -> str | None:
+        doc = self.__collection.find_one({"_id": record_id})
+        if not doc:
+            return None
+
+        if "compressed" in doc:
+            if self.__compressor is None:
+                raise ValueError("Compressed transcript requires a compressor")
+            return self.__compressor.decompress(doc["compressed"])
+        return doc["text"]
+
+    def put(self, record_id: str, text: str, language: str = "") -> None:
+        if not text:
+            self.delete(record_id)
+            return
+
+        payload = (
+            self.__compressor.compress(text, language) if self.__compressor else None
+        )
+        document = (
+            {"text": text} if payload is None else {"compressed": Binary(payload)}
+        )
+        self.__collection.replace_one({"_id": record_id}, document, upsert=True)
+
+    def delete(self, record_id: str) -> None:
+        self.__collection.delete_one({"_id": record_id})
@@ -1,7 +1,12 @@
+import re
+from typing import Iterator
+
 from bson.binary import Binary
-from pymongo import MongoClient
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
+from .mongo_connection_provider import MongoConnectionProvider
+from ..entity_changes import USER_FIELDS, changed_fields, field_values, restore_fields
 from ....domain.interfaces import IUserRepository, ISerializer, IUser
 
 
@@ -9,61 +14,123 @@ class MongoUserRepository(IUserRepository):
     def __init__(
         self,
         serializer: ISerializer,
-        mongo_uri: str,
-        db_name: str,
+        connection: MongoConnectionProvider,
         collection_name: str = "users",
     ) -> None:
+        """
+        Create Mongo user repository. Indexes are created by ensure_indexes.
+
+        :param connection: Shared Mongo connection.
+        :param collection_name: Collection of users.
+        """
 
         self.__serializer = serializer
+        self.__collection: Collection = connection.collection(collection_name)
 
-        self.__client = MongoClient(mongo_uri)
-        self.__db = self.__client[db_name]
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes of collection and store blocked flag of documents
+        written before it was kept. Does nothing if it is already done.
+        """
 
-        self.__collection: Collection = self.__db[collection_name]
         self.__collection.create_index("email", unique=True)
+        self.__collection.create_index([("is_blocked", 1), ("email", 1)])
+        for doc in self.__collection.find({"is_blocked": {"$exists": False}}):
+            self.__collection.update_one(
+                {"_id": doc["_id"]},
+                {"$set": {"is_blocked": self.__deserialize(doc).is_blocked}},
+            )
 
     def get_by_id(self, user_id: str) -> IUser | None:
         doc = self.__collection.find_one({"_id": user_id})
-        if doc is None:
-            return None
-
-        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
-        return self.__serializer.deserialize(data)
+        return self.__deserialize(doc) if doc else None
 
     def get_by_email(self, user_id: str) -> IUser | None:
         doc = self.__collection.find_one({"email": user_id})
-        if doc is None:
-            return None
-
-        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
-        return self.__serializer.deserialize(data)
+        return self.__deserialize(doc) if doc else None
 
     def add(self, user: IUser) -> None:
-        if self.__collection.find_one({"_id": user.id}):
+        try:
+            self.__collection.insert_one({"_id": user.id, **self.__document(user)})
+        except DuplicateKeyError as e:
+            if "email" in (e.details or {}).get("keyPattern", {}):
+                raise ValueError(f"User with email {user.email} already exists")
             raise ValueError(f"User with ID {user.id} already exists")
-        if self.__collection.find_one({"email": user.email}):
+        user.mark_clean()
+
+    def update(self, user: IUser) -> None:
+        """
+        Update user. Changed fields of a user read from repository are
+        written with $set, serialized data is not rewritten.
+        """
+
+        fields = changed_fields(user, USER_FIELDS)
+        if fields is None:
+            change = {"$set": self.__document(user), "$unset": {"patched": ""}}
+        elif fields:
+            change = {
+                "$set": field_values(user, fields),
+                "$addToSet": {"patched": {"$each": sorted(fields)}},
+            }
+        else:
+            change = None
+
+        try:
+            if change:
+                result = self.__collection.update_one({"_id": user.id}, change)
+                matched = result.matched_count
+            else:
+                matched = self.__collection.count_documents({"_id": user.id}, limit=1)
+        except DuplicateKeyError:
             raise ValueError(f"User with email {user.email} already exists")
+        if not matched:
+            raise ValueError(f"User with ID {user.id} not found")
+        user.mark_clean()
 
-        serialized = self.__serializer.serialize(user)
-        doc = {
-            "_id": user.id,
-            "email": user.email,
-            "data": (
-                Binary(serialized)
-                if self.__serializer.binary
-                else Binary(serialized.encode())
-            ),
-        }
+    def delete(self, user: IUser) -> None:
+        if not self.__collection.delete_one({"_id": user.id}).deleted_count:
+            raise ValueError(f"User with ID {user.id} not found")
 
-        self.__collection.insert_one(doc)
+    def get_all(self) -> list[IUser]:
+        """Return all users, decoded from one cursor."""
 
-    def update(self, user: IUser) -> None:
-        if not self.__collection.find_one({"_id": user.id}):
-            raise ValueError(f"User with ID {user.id} not found")
+        return [self.__deserialize(doc) for doc in self.__collection.find()]
 
+    def iter_users(
+        self,
+        batch_size: int = 100,
+        blocked: bool | None = None,
+        email_prefix: str | None = None,
+        after: str | None = None,
+    ) -> Iterator[IUser]:
+        """
+        Stream users ordered by email. Filters are applied by the server
+        and answered from the email and (is_blocked, email) indexes.
+        """
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        query = {}
+        if blocked is not None:
+            query["is_blocked"] = blocked
+        email = {}
+        if email_prefix:
+            email["$regex"] = "^" + re.escape(email_prefix)
+        if after is not None:
+            email["$gt"] = after
+        if email:
+            query["email"] = email
+
+        cursor = self.__collection.find(query).sort("email", 1).batch_size(batch_size)
+        for doc in cursor:
+            yield self.__deserialize(doc)
+
+    def __document(self, user: IUser) -> dict:
         serialized = self.__serializer.serialize(user)
-        doc = {
+        return {
             "email": user.email,
+            "is_blocked": user.is_blocked,
             "data": (
                 Binary(serialized)
                 if self.__serializer.binary
@@ -71,16 +138,11 @@ class MongoUserRepository(IUserRepository):
             ),
         }
 
-        self.__collection.update_one({"_id": user.id}, {"$set": doc})
+    def __deserialize(self, doc: dict) -> IUser:
+        """Decode user, patched fields are taken from their document fields."""
 
-    def delete(self, user: IUser) -> None:
-        if not self.__collection.find_one({"_id": user.id}):
-            raise ValueError(f"User with ID {user.id} not found")
-
-        self.__collection.delete_one({"_id": user.id})
-
-    def get_all(self) -> list[IUser]:
-        users = self.__collection.find()
-        users = [self.get_by_id(user["_id"]) for user in users]
-
-        return users
+        data = doc["data"] if self.__serializer.binary else doc["data"].decode()
+        user = self.__serializer.deserialize(data)
+        if doc.get("patched"):
+            restore_fields(user, {field: doc[field] for field in doc["patched"]})
+        return user
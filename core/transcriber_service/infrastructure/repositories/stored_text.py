@@ -0,0 +1,66 @@
+import copy
+from typing import Iterable
+
+from ...domain.interfaces import IAudioRecord, ITranscriptStore
+
+
+class StoredText(object):
+    def __init__(self, store: ITranscriptStore, record_id: str):
+        """
+        Loader of record text from transcript store, restored as record text
+        so the transcript is fetched only when text is accessed.
+
+        :param store: Store of transcripts.
+        :param record_id: Record of transcript.
+        """
+
+        self.store = store
+        self.record_id = record_id
+
+    def __call__(self) -> str:
+        return self.store.get(self.record_id) or ""
+
+
+def attach_text(record: IAudioRecord, store: ITranscriptStore) -> IAudioRecord:
+    """
+    Return copy of record read from metadata whose text is loaded from store.
+    Records written before transcripts were stored apart keep their inline
+    text, which is moved to store when their text changes or they are
+    written whole.
+    """
+
+    if record.text:
+        return record
+
+    record = copy.copy(record)
+    record.restore_text(StoredText(store, record.id))
+    record.mark_clean()
+    return record
+
+
+def detach_text(record: IAudioRecord, store: ITranscriptStore) -> IAudioRecord:
+    """
+    Write record text to store unless it is the not yet loaded text of
+    the store, and return copy of record without text to be serialized.
+    """
+
+    loader = record.text_loader
+    if not (isinstance(loader, StoredText) and loader.store is store):
+        store.put(record.id, record.text, record.language)
+
+    metadata = copy.copy(record)
+    metadata.restore_text("")
+    metadata.mark_clean()
+    return metadata
+
+
+def sample_texts(records: Iterable[IAudioRecord], store: ITranscriptStore) -> list[str]:
+    """
+    Return non-empty texts of records read from metadata, e.g. a sample to
+    train compression dictionaries on. Texts stored apart are loaded from
+    store, inline texts of records written before are used as they are.
+    """
+
+    return [
+        text for text in (attach_text(record, store).text for record in records) if text
+    ]
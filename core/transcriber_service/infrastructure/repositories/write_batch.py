@@ -0,0 +1,65 @@
+import threading
+from typing import Callable
+
+
+class WriteBatch(object):
+    def __init__(self, flush: Callable[[dict[str, object]], None], max_size: int = 500):
+        """
+        Per-thread buffer of pending repository writes keyed by entity id.
+
+        Writes of one key are coalesced, so only the last value is flushed.
+        Pending writes are flushed when the outermost batch ends or when
+        max_size keys are pending.
+
+        :param flush: Writes pending {key: value} at once.
+        :param max_size: Max number of pending keys.
+        :raise ValueError: If max_size is not positive.
+        """
+
+        if max_size < 1:
+            raise ValueError("Max batch size must be positive")
+
+        self.__flush = flush
+        self.__max_size = max_size
+        self.__local = threading.local()
+
+    @property
+    def active(self) -> bool:
+        """True if current thread is inside a batch."""
+
+        return getattr(self.__local, "depth", 0) > 0
+
+    def begin(self) -> None:
+        self.__local.depth = getattr(self.__local, "depth", 0) + 1
+        if self.__local.depth == 1:
+            self.__local.pending = {}
+
+    def end(self) -> None:
+        """End batch, flush pending writes if it is the outermost one."""
+
+        if not self.active:
+            raise RuntimeError("No batch to end")
+
+        self.__local.depth -= 1
+        if not self.__local.depth:
+            self.flush()
+
+    def add(self, key: str, value) -> None:
+        pending = self.__local.pending
+        pending.pop(key, None)
+        pending[key] = value
+        if len(pending) >= self.__max_size:
+            self.flush()
+
+    def get(self, key: str, default=None):
+        """Return pending value of key in current thread batch."""
+
+        return getattr(self.__local, "pending", {}).get(key, default)
+
+    def flush(self) -> None:
+        """Write pending writes of current thread now."""
+
+        pending = getattr(self.__local, "pending", None)
+        if pending:
+            self.__local.pending = {}
+            self.__flush(pending)
@@ -0,0 +1,3 @@
+from .local_full_text_index import *
+
+__all__ = ["LocalFullTextIndex"]
@@ -0,0 +1,297 @@
+import json
+import logging
+import math
+import os
+import re
+import threading
+from typing import Iterable
+
+from ...domain.interfaces import IFullTextIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+_LABEL_PATTERN = re.compile(r"\[[^\]]*\]")
+_TOKEN_PATTERN = re.compile(r"\w+")
+_PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower case word tokens, speaker labels are skipped."""
+
+    text = _LABEL_PATTERN.sub(" ", text).lower().replace("ё", "е")
+    return _TOKEN_PATTERN.findall(text)
+
+
+class LocalFullTextIndex(IFullTextIndex):
+    """
+    File-backed positional inverted index with BM25 ranking.
+
+    Postings are kept in memory per storage, so search in one storage never
+    touches documents of another and BM25 statistics are per storage.
+    Every change is appended to a log file, the log is folded into a
+    snapshot file once it grows past compact_threshold entries.
+
+    The index is single-process: postings of other processes would never
+    be seen and compaction would drop their log entries. The directory is
+    locked while the index is open, so a second instance fails to open.
+    """
+
+    _SNAPSHOT = "index.json"
+    _LOG = "index.log"
+    _LOCK = "index.lock"
+
+    def __init__(
+        self,
+        index_dir: str,
+        compact_threshold: int = 1000,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        Create local full-text index.
+
+        :param index_dir: Directory for index files (created if missing).
+        :param compact_threshold: Log entries after which snapshot is rewritten.
+        :param k1: BM25 term frequency saturation.
+        :param b: BM25 document length normalization.
+        :raise ValueError: If index_dir is empty or compact_threshold is not positive.
+        :raise RuntimeError: If the index is open in another instance or process.
+        """
+
+        if not index_dir:
+            raise ValueError("Index directory cannot be empty")
+        if compact_threshold < 1:
+            raise ValueError("Compact threshold must be positive")
+
+        self.__dir = index_dir
+        self.__compact_threshold = compact_threshold
+        self.__k1 = k1
+        self.__b = b
+        self.__lock = threading.Lock()
+
+        self.__docs: dict[str, tuple[str, list[str]]] = {}
+        self.__postings: dict[str, dict[str, dict[str, list[int]]]] = {}
+        self.__lengths: dict[str, int] = {}
+        self.__counts: dict[str, int] = {}
+        self.__log_size = 0
+
+        os.makedirs(index_dir, exist_ok=True)
+        self.__dir_lock = self.__lock_dir()
+        self.__load()
+
+    def __len__(self) -> int:
+        return len(self.__docs)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.__docs
+
+    def index(self, record_id: str, storage_id: str, text: str) -> None:
+        tokens = tokenize(text)
+        with self.__lock:
+            if self.__docs.get(record_id) == (storage_id, tokens):
+                return
+            self.__apply_index(record_id, storage_id, tokens)
+            self.__append({"id": record_id, "storage": storage_id, "tokens": tokens})
+
+    def remove(self, record_id: str) -> None:
+        with self.__lock:
+            if record_id not in self.__docs:
+                return
+            self.__apply_remove(record_id)
+            self.__append({"id": record_id})
+
+    def rebuild(self, documents: Iterable[tuple[str, str, str]]) -> int:
+        """
+        Replace whole index with given documents and write it as snapshot.
+        Searches wait until it is done, so run it before the app starts.
+        """
+
+        with self.__lock:
+            self.__docs.clear()
+            self.__postings.clear()
+            self.__lengths.clear()
+            self.__counts.clear()
+            for record_id, storage_id, text in documents:
+                self.__apply_index(record_id, storage_id, tokenize(text))
+            self.__compact()
+            return len(self.__docs)
+
+    def close(self) -> None:
+        """Unlock index directory, the index must not be used afterwards."""
+
+        with self.__lock:
+            if self.__dir_lock is not None:
+                self.__dir_lock.close()
+                self.__dir_lock = None
+
+    def search(
+        self, storage_id: str, query: str, limit: int | None = None
+    ) -> list[str]:
+        phrases = [tokenize(p) for p in _PHRASE_PATTERN.findall(query)]
+        phrases = [phrase for phrase in phrases if phrase]
+        terms = set(tokenize(_PHRASE_PATTERN.sub(" ", query)))
+        for phrase in phrases:
+            terms.update(phrase)
+
+        with self.__lock:
+            postings = self.__postings.get(storage_id)
+            if not postings or not terms:
+                return []
+
+            if phrases:
+                candidates = self.__match_phrase(postings, phrases[0])
+                for phrase in phrases[1:]:
+                    candidates &= self.__match_phrase(postings, phrase)
+            else:
+                candidates = set()
+                for term in terms:
+                    candidates.update(postings.get(term, ()))
+
+            scores = self.__score(storage_id, postings, terms, candidates)
+
+        ranked = sorted(
+            candidates, key=lambda record_id: (-scores[record_id], record_id)
+        )
+        return ranked[:limit] if limit is not None else ranked
+
+    def __score(
+        self,
+        storage_id: str,
+        postings: dict[str, dict[str, list[int]]],
+        terms: set[str],
+        candidates: set[str],
+    ) -> dict[str, float]:
+        docs_count = self.__counts[storage_id]
+        avg_length = self.__lengths[storage_id] / docs_count
+
+        scores = dict.fromkeys(candidates, 0.0)
+        for term in terms:
+            posting = postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log((docs_count - len(posting) + 0.5) / (len(posting) + 0.5) + 1)
+            for record_id in candidates.intersection(posting):
+                frequency = len(posting[record_id])
+                length = len(self.__docs[record_id][1])
+                norm = self.__k1 * (1 - self.__b + self.__b * length / avg_length)
+                scores[record_id] += (
+                    idf * frequency * (self.__k1 + 1) / (frequency + norm)
+                )
+
+        return scores
+
+    @staticmethod
+    def __match_phrase(
+        postings: dict[str, dict[str, list[int]]], phrase: list[str]
+    ) -> set[str]:
+        lists = [postings.get(term) for term in phrase]
+        if not all(lists):
+            return set()
+
+        candidates = set(lists[0]).intersection(*lists[1:])
+        matched = set()
+        for record_id in candidates:
+            following = [set(posting[record_id]) for posting in lists[1:]]
+            if any(
+                all(start + i + 1 in positions for i, positions in enumerate(following))
+                for start in lists[0][record_id]
+            ):
+                matched.add(record_id)
+        return matched
+
+    def __apply_index(self, record_id: str, storage_id: str, tokens: list[str]) -> None:
+        if record_id in self.__docs:
+            self.__apply_remove(record_id)
+
+        postings = self.__postings.setdefault(storage_id, {})
+        for position, token in enumerate(tokens):
+            postings.setdefault(token, {}).setdefault(record_id, []).append(position)
+
+        self.__docs[record_id] = (storage_id, tokens)
+        self.__lengths[storage_id] = self.__lengths.get(storage_id, 0) + len(tokens)
+        self.__counts[storage_id] = self.__counts.get(storage_id, 0) + 1
+
+    def __apply_remove(self, record_id: str) -> None:
+        storage_id, tokens = self.__docs.pop(record_id)
+        postings = self.__postings[storage_id]
+        for token in set(tokens):
+            posting = postings[token]
+            del posting[record_id]
+            if not posting:
+                del postings[token]
+
+        self.__lengths[storage_id] -= len(tokens)
+        self.__counts[storage_id] -= 1
+        if not self.__counts[storage_id]:
+            del self.__postings[storage_id]
+            del self.__lengths[storage_id]
+            del self.__counts[storage_id]
+
+    def __append(self, entry: dict) -> None:
+        with open(os.path.join(self.__dir, self._LOG), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.__log_size += 1
+
+        if self.__log_size >= self.__compact_threshold:
+            self.__compact()
+
+    def __compact(self) -> None:
+        """Write all documents into snapshot and truncate the log."""
+
+        path = os.path.join(self.__dir, self._SNAPSHOT)
+        temp_path = path + ".tmp"
+        snapshot = {
+            record_id: [storage_id, tokens]
+            for record_id, (storage_id, tokens) in self.__docs.items()
+        }
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+        open(os.path.join(self.__dir, self._LOG), "w").close()
+        self.__log_size = 0
+
+    def __lock_dir(self):
+        lock_file = open(os.path.join(self.__dir, self._LOCK), "a+b")
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(f"Full-text index {self.__dir} is already open")
+        return lock_file
+
+    def __load(self) -> None:
+        snapshot_path = os.path.join(self.__dir, self._SNAPSHOT)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                for record_id, (storage_id, tokens) in json.load(f).items():
+                    self.__apply_index(record_id, storage_id, tokens)
+
+        log_path = os.path.join(self.__dir, self._LOG)
+        if not os.path.exists(log_path):
+            return
+
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping broken full-text index log entry")
+                    continue
+
+                self.__log_size += 1
+                if "tokens" in entry:
+                    self.__apply_index(entry["id"], entry["storage"], entry["tokens"])
+                elif entry["id"] in self.__docs:
+                    self.__apply_remove(entry["id"])
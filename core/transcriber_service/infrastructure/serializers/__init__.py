@@ -1,5 +1,11 @@
 from .json_serializer import *
+from .record_format_serializer import *
+from .text_compressor import *
 
 __all__ = [
     "JsonSerializer",
+    "RecordField",
+    "RecordFormatSerializer",
+    "RecordSchema",
+    "TextCompressor",
 ]
@@ -0,0 +1,347 @@
+import struct
+from functools import lru_cache, partial
+from typing import Any, Callable
+
+import msgpack
+
+from .text_compressor import TextCompressor
+from ...domain.interfaces import ISerializer
+
+RECORD_MAGIC = b"\xc1TR"
+CONTAINER_MAGIC = b"\xc1TC"
+# magic, entity code, schema version, field count, eager field count
+RECORD_HEADER = struct.Struct(">3sBHBB")
+FIELD_ENTRY = struct.Struct(">BII")  # field id, offset, length
+RECORD_EXT = 1
+COMPRESSED_EXT = 2
+
+_REQUIRED = object()
+
+
+@lru_cache(maxsize=64)
+def _directory(count: int) -> struct.Struct:
+    """Struct of a field directory with count entries."""
+
+    return struct.Struct(">" + "BII" * count)
+
+
+class RecordField(object):
+    __slots__ = ("id", "name", "default", "lazy", "compressed")
+
+    def __init__(
+        self,
+        id_: int,
+        name: str,
+        default: Any = _REQUIRED,
+        lazy: bool = False,
+        compressed: bool = False,
+    ):
+        """
+        Field of a record schema.
+
+        :param id_: Field id in the field directory, never reused for
+        another field once released.
+        :param name: Key of the field in DTO dictionary.
+        :param default: Value of records written without the field,
+        the field is required if not given.
+        :param lazy: Decode the field on first access instead of on load.
+        :param compressed: Compress text of the field by serializer compressor.
+        """
+
+        self.id = id_
+        self.name = name
+        self.default = default
+        self.lazy = lazy
+        self.compressed = compressed
+
+
+class RecordSchema(object):
+    def __init__(
+        self,
+        entity_type: str,
+        code: int,
+        version: int,
+        fields: tuple[RecordField, ...],
+        migrations: dict[int, Callable[[dict], dict]] | None = None,
+    ):
+        """
+        Binary layout of one entity type.
+
+        Records of newer schema versions are read by ignoring unknown field
+        ids, records of older versions are upgraded by migrations and
+        missing fields get defaults.
+
+        :param entity_type: Entity type of DTO dictionaries.
+        :param code: Entity code stored in record header.
+        :param version: Current schema version, written to new records.
+        :param fields: Fields of current version.
+        :param migrations: Functions upgrading fields of version n to n + 1,
+        keyed by n.
+        """
+
+        self.entity_type = entity_type
+        self.code = code
+        self.version = version
+        self.fields = fields
+        self.fields_by_id = {field.id: field for field in fields}
+        self.eager_fields = tuple(field for field in fields if not field.lazy)
+        self.lazy_fields = tuple(field for field in fields if field.lazy)
+        self.migrations = migrations or {}
+        self.__names: dict[tuple[int, ...], list[str | None]] = {}
+
+    def names(self, field_ids: tuple[int, ...]) -> list[str | None]:
+        """Return names of fields with given ids, None for unknown ids."""
+
+        names = self.__names.get(field_ids)
+        if names is None:
+            names = [
+                field.name if field else None
+                for field in map(self.fields_by_id.get, field_ids)
+            ]
+            self.__names[field_ids] = names
+        return names
+
+    def upgrade(self, fields: dict, version: int) -> dict:
+        for step in range(version, self.version):
+            migration = self.migrations.get(step)
+            if migration:
+                fields = migration(fields)
+        return fields
+
+
+def _audio_record_schema() -> RecordSchema:
+    return RecordSchema(
+        "audiorecord",
+        1,
+        1,
+        (
+            RecordField(1, "id"),
+            RecordField(2, "record_name"),
+            RecordField(3, "file_path"),
+            RecordField(4, "storage_id"),
+            RecordField(5, "language", ""),
+            RecordField(6, "tags", ()),
+            RecordField(7, "last_updated"),
+            RecordField(8, "status", "done"),
+            RecordField(9, "text", "", lazy=True, compressed=True),
+        ),
+    )
+
+
+def _user_schema(entity_type: str, code: int) -> RecordSchema:
+    return RecordSchema(
+        entity_type,
+        code,
+        1,
+        (
+            RecordField(1, "id"),
+            RecordField(2, "email"),
+            RecordField(3, "password_hash"),
+            RecordField(4, "temp_password_hash", None),
+            RecordField(5, "registration_date"),
+            RecordField(6, "last_updated"),
+            RecordField(7, "is_blocked", False),
+        ),
+    )
+
+
+def _storage_schema() -> RecordSchema:
+    return RecordSchema(
+        "storage",
+        4,
+        1,
+        (
+            RecordField(1, "id"),
+            RecordField(2, "user_id"),
+            RecordField(3, "audio_record_ids", ()),
+        ),
+    )
+
+
+def default_record_schemas() -> list[RecordSchema]:
+    return [
+        _audio_record_schema(),
+        _user_schema("authuser", 2),
+        _user_schema("admin", 3),
+        _storage_schema(),
+    ]
+
+
+class RecordFormatSerializer(ISerializer):
+    def __init__(
+        self,
+        schemas: list[RecordSchema] | None = None,
+        legacy: ISerializer | None = None,
+        compressor: TextCompressor | None = None,
+    ):
+        """
+        Binary serializer of entity DTO dictionaries with a versioned
+        layout: a header, a directory of field offsets and msgpack encoded
+        fields. Lazy fields (audio record text) are restored as loader
+        callables, so reading metadata never decodes them.
+
+        Other data is written as msgpack, records inside it keep
+        the record layout.
+
+        :param schemas: Record layouts, audio record, users and storage if None.
+        :param legacy: Serializer of data written before this format,
+        e.g. JsonSerializer. Such data raises ValueError if None.
+        :param compressor: Compressor of compressed fields (audio record
+        text), using dictionary of record language. Fields are written raw
+        if None, but compressed fields of existing records still require it.
+        """
+
+        self.__schemas = {
+            schema.entity_type: schema
+            for schema in (schemas or default_record_schemas())
+        }
+        self.__codes = {schema.code: schema for schema in self.__schemas.values()}
+        self.__legacy = legacy
+        self.__compressor = compressor
+        self.__packer = msgpack.Packer(use_bin_type=True)
+
+    def serialize(self, data) -> bytes:
+        if isinstance(data, dict) and data.get("entity_type") in self.__schemas:
+            return self.__pack_record(data)
+
+        return CONTAINER_MAGIC + msgpack.packb(self.__wrap(data), use_bin_type=True)
+
+    def deserialize(self, data: bytes):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Data must be bytes")
+        if not data:
+            raise ValueError("Data cannot be empty")
+
+        magic = bytes(data[:3])
+        if magic == RECORD_MAGIC:
+            return self.__unpack_record(data)
+        if magic == CONTAINER_MAGIC:
+            return msgpack.unpackb(
+                memoryview(data)[3:], raw=False, ext_hook=self.__ext_hook
+            )
+        if self.__legacy is None:
+            raise ValueError("Data is not in record format")
+
+        return self.__legacy.deserialize(
+            bytes(data) if self.__legacy.binary else bytes(data).decode()
+        )
+
+    @property
+    def extension(self) -> str:
+        return "records"
+
+    @property
+    def binary(self) -> bool:
+        return True
+
+    def __pack_record(self, data: dict) -> bytes:
+        """
+        Pack record as header, field directory, eager and lazy fields.
+        Eager fields follow a msgpack array header, so they are decoded
+        by one call while each of them is still addressed by directory.
+        """
+
+        schema = self.__schemas[data["entity_type"]]
+        eager = [field for field in schema.eager_fields if field.name in data]
+        lazy = [field for field in schema.lazy_fields if field.name in data]
+        fields = eager + lazy
+        values = [self.__packer.pack(self.__value(data, field)) for field in fields]
+        array = self.__packer.pack_array_header(len(eager))
+
+        offset = RECORD_HEADER.size + FIELD_ENTRY.size * len(fields) + len(array)
+        directory = []
+        for field, value in zip(fields, values):
+            directory += (field.id, offset, len(value))
+            offset += len(value)
+
+        return b"".join(
+            [
+                RECORD_HEADER.pack(
+                    RECORD_MAGIC, schema.code, schema.version, len(fields), len(eager)
+                ),
+                _directory(len(fields)).pack(*directory),
+                array,
+                *values,
+            ]
+        )
+
+    def __unpack_record(self, data: bytes) -> dict:
+        view = memoryview(data)
+        _, code, version, count, eager = RECORD_HEADER.unpack_from(data)
+        schema = self.__codes.get(code)
+        if schema is None:
+            raise ValueError(f"Unknown record code: {code}")
+
+        directory = _directory(count).unpack_from(data, RECORD_HEADER.size)
+        names = schema.names(directory[0::3])
+        fields = {}
+        if eager:
+            start = RECORD_HEADER.size + FIELD_ENTRY.size * count
+            end = directory[3 * eager - 2] + directory[3 * eager - 1]
+            values = msgpack.unpackb(
+                view[start:end], raw=False, ext_hook=self.__ext_hook
+            )
+            fields.update(zip(names[:eager], values))
+
+        for i in range(eager, count):
+            offset, length = directory[3 * i + 1], directory[3 * i + 2]
+            field = schema.fields_by_id.get(directory[3 * i])
+            if field is None:
+                continue
+            value = view[offset : offset + length]
+            if field.lazy:
+                fields[field.name] = partial(
+                    msgpack.unpackb, value, raw=False, ext_hook=self.__ext_hook
+                )
+            else:
+                fields[field.name] = msgpack.unpackb(
+                    value, raw=False, ext_hook=self.__ext_hook
+                )
+
+        fields.pop(None, None)  # fields written by a newer schema version
+        if version < schema.version:
+            fields = schema.upgrade(fields, version)
+        if version != schema.version or len(fields) < len(schema.fields):
+            self.__fill_defaults(schema, fields)
+
+        fields["entity_type"] = schema.entity_type
+        return fields
+
+    @staticmethod
+    def __fill_defaults(schema: RecordSchema, fields: dict) -> None:
+        for field in schema.fields:
+            if field.name in fields:
+                continue
+            if field.default is _REQUIRED:
+                raise ValueError(f"Record field {field.name} is missing")
+            fields[field.name] = (
+                list(field.default)
+                if isinstance(field.default, tuple)
+                else field.default
+            )
+
+    def __wrap(self, data):
+        if isinstance(data, dict):
+            if data.get("entity_type") in self.__schemas:
+                return msgpack.ExtType(RECORD_EXT, self.__pack_record(data))
+            return {key: self.__wrap(value) for key, value in data.items()}
+        if isinstance(data, (list, tuple)):
+            return [self.__wrap(item) for item in data]
+        return data
+
+    def __value(self, data: dict, field: RecordField):
+        value = data[field.name]
+        if field.compressed and self.__compressor and isinstance(value, str):
+            payload = self.__compressor.compress(value, data.get("language") or "")
+            if payload is not None:
+                return msgpack.ExtType(COMPRESSED_EXT, payload)
+        return value
+
+    def __ext_hook(self, code: int, data: bytes):
+        if code == RECORD_EXT:
+            return self.__unpack_record(data)
+        if code == COMPRESSED_EXT:
+            if self.__compressor is None:
+                raise ValueError("Compressed field requires a compressor")
+            return self.__compressor.decompress(data)
+        return msgpack.ExtType(code, data)
@@ -0,0 +1,231 @@
+import logging
+import os
+import struct
+import zlib
+from collections import Counter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ZLIB = 0
+ZSTD = 1
+PAYLOAD_HEADER = struct.Struct(">BI")  # algorithm, dictionary id (0 if none)
+
+_ALGORITHMS = {"zlib": ZLIB, "zstd": ZSTD}
+
+
+class TextCompressor(object):
+    def __init__(
+        self,
+        threshold: int | None = 1024,
+        level: int = 6,
+        dictionary_dir: str | None = None,
+        algorithm: str | None = None,
+    ):
+        """
+        Compressor of transcript texts with an optional dictionary per
+        language. Texts shorter than threshold are kept raw, as are texts
+        that do not get smaller.
+
+        Compressed payload starts with the algorithm and the dictionary id,
+        so it is decompressed without knowing the language. Dictionaries
+        of earlier trainings are kept to read records compressed by them.
+
+        :param threshold: Min size of encoded text to compress, in bytes,
+        None keeps new texts raw and only reads compressed ones.
+        :param level: Compression level of the algorithm.
+        :param dictionary_dir: Directory of trained dictionaries, dictionaries
+        are neither loaded nor saved if None.
+        :param algorithm: "zstd" or "zlib", zstd if zstandard is installed
+        and zlib otherwise if None.
+        :raise ValueError: If algorithm is unknown or not installed.
+        """
+
+        if algorithm is None:
+            algorithm = "zstd" if zstandard else "zlib"
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+        if algorithm == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires zstandard package")
+
+        self.__threshold = threshold
+        self.__level = level
+        self.__algorithm = _ALGORITHMS[algorithm]
+        self.__dictionary_dir = dictionary_dir
+        self.__dictionaries: dict[int, tuple[int, bytes]] = {}
+        self.__languages: dict[str, int] = {}
+
+        if dictionary_dir:
+            self.__load(dictionary_dir)
+
+    def compress(self, text: str, language: str = "") -> bytes | None:
+        """
+        Compress text with dictionary of its language.
+
+        :return: Compressed payload, None if text should be stored raw.
+        """
+
+        if self.__threshold is None:
+            return None
+        data = text.encode()
+        if len(data) < self.__threshold:
+            return None
+
+        dictionary_id = self.__languages.get(language.lower(), 0)
+        if dictionary_id:
+            algorithm, dictionary = self.__dictionaries[dictionary_id]
+        else:
+            algorithm, dictionary = self.__algorithm, None
+
+        if algorithm == ZSTD:
+            compressed = self.__zstd_compressor(dictionary).compress(data)
+        else:
+            compressor = zlib.compressobj(
+                self.__level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary or b""
+            )
+            compressed = compressor.compress(data) + compressor.flush()
+
+        payload = PAYLOAD_HEADER.pack(algorithm, dictionary_id) + compressed
+        return payload if len(payload) < len(data) else None
+
+    def decompress(self, payload: bytes) -> str:
+        """
+        Restore text from compressed payload.
+
+        :raise ValueError: If dictionary or algorithm of payload is not available.
+        """
+
+        algorithm, dictionary_id = PAYLOAD_HEADER.unpack_from(payload)
+        dictionary = None
+        if dictionary_id:
+            if dictionary_id not in self.__dictionaries:
+                raise ValueError(f"Unknown compression dictionary: {dictionary_id}")
+            dictionary = self.__dictionaries[dictionary_id][1]
+
+        data = memoryview(payload)[PAYLOAD_HEADER.size :]
+        if algorithm == ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd compression requires zstandard package")
+            return self.__zstd_decompressor(dictionary).decompress(data).decode()
+        if algorithm != ZLIB:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=dictionary or b"")
+        return (decompressor.decompress(data) + decompressor.flush()).decode()
+
+    def train(self, language: str, samples: list[str], size: int = 32768) -> int:
+        """
+        Train dictionary of language on sample texts and use it for new
+        texts of the language. It is saved if dictionary_dir is set.
+
+        :param language: Language of samples.
+        :param samples: Sample texts, usually a few hundred transcripts.
+        :param size: Max dictionary size in bytes.
+        :return: Dictionary id.
+        :raise ValueError: If there are no samples.
+        """
+
+        if not samples:
+            raise ValueError("Samples cannot be empty")
+
+        if self.__algorithm == ZSTD:
+            dictionary = zstandard.train_dictionary(
+                size, [sample.encode() for sample in samples]
+            ).as_bytes()
+        else:
+            dictionary = self.__zlib_dictionary(samples, size)
+
+        dictionary_id = self.__register(language, self.__algorithm, dictionary)
+        if self.__dictionary_dir:
+            os.makedirs(self.__dictionary_dir, exist_ok=True)
+            name = self.__file_name(language, self.__algorithm, dictionary_id)
+            path = os.path.join(self.__dictionary_dir, name)
+            with open(path + ".tmp", "wb") as f:
+                f.write(dictionary)
+            os.replace(path + ".tmp", path)
+
+        return dictionary_id
+
+    def __register(self, language: str, algorithm: int, dictionary: bytes) -> int:
+        dictionary_id = zlib.crc32(bytes([algorithm]) + dictionary) or 1
+        self.__dictionaries[dictionary_id] = (algorithm, dictionary)
+        self.__languages[language.lower()] = dictionary_id
+        return dictionary_id
+
+    def __load(self, dictionary_dir: str) -> None:
+        """Load dictionaries, the latest one of a language is used for new texts."""
+
+        if not os.path.isdir(dictionary_dir):
+            return
+
+        paths = [
+            os.path.join(dictionary_dir, name)
+            for name in os.listdir(dictionary_dir)
+            if name.endswith(".dict")
+        ]
+        for path in sorted(paths, key=os.path.getmtime):
+            try:
+                language, _, name, _ = os.path.basename(path).rsplit(".", 3)
+                algorithm = _ALGORITHMS[name]
+                if algorithm == ZSTD and zstandard is None:
+                    raise ValueError("zstandard package is not installed")
+                with open(path, "rb") as f:
+                    self.__register(language, algorithm, f.read())
+            except (ValueError, KeyError, OSError) as e:
+                logger.warning(f"Skip compression dictionary {path}: {e}")
+
+    @staticmethod
+    def __file_name(language: str, algorithm: int, dictionary_id: int) -> str:
+        names = {value: name for name, value in _ALGORITHMS.items()}
+        return f"{language.lower()}.{dictionary_id:08x}.{names[algorithm]}.dict"
+
+    def __zstd_compressor(self, dictionary: bytes | None):
+        if dictionary is None:
+            return zstandard.ZstdCompressor(level=self.__level)
+        return zstandard.ZstdCompressor(
+            level=self.__level, dict_data=zstandard.ZstdCompressionDict(dictionary)
+        )
+
+    @staticmethod
+    def __zstd_decompressor(dictionary: bytes | None):
+        if dictionary is None:
+            return zstandard.ZstdDecompressor()
+        return zstandard.ZstdDecompressor(
+            dict_data=zstandard.ZstdCompressionDict(dictionary)
+        )
+
+    @staticmethod
+    def __zlib_dictionary(samples: list[str], size: int) -> bytes:
+        """
+        Build zlib dictionary of phrases repeated across samples. Phrases
+        saving most bytes are put at the end, which is closest to
+        compressed data and cheapest to reference.
+        """
+
+        counts = Counter()
+        for sample in samples:
+            words = sample.split()
+            for n in (1, 2, 3):
+                counts.update(
+                    " ".join(words[i : i + n]) for i in range(len(words) - n + 1)
+                )
+
+        phrases = [
+            phrase.encode()
+            for phrase, count in sorted(
+                counts.items(), key=lambda item: item[1] * len(item[0]), reverse=True
+            )
+            if count > 1
+        ]
+        selected, total = [], 0
+        for phrase in phrases:
+            if total + len(phrase) + 1 > size:
+                break
+            selected.append(phrase)
+            total += len(phrase) + 1
+
+        return b" ".join(reversed(selected))
@@ -1,11 +1,17 @@
+from .caching_transcriber import *
 from .email_service import *
 from .password_manager import *
+from .pooled_transcriber import *
+from .segmenting_transcriber import *
 from .stopwords_remover import *
 from .transcriber import *
 
 __all__ = [
     "PasswordManager",
     "Transcriber",
+    "PooledTranscriber",
+    "CachingTranscriber",
+    "SegmentingTranscriber",
     "StopwordsRemover",
     "EmailService",
 ]
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from ...domain.interfaces import ITranscriber
+
+logger = logging.getLogger(__name__)
+
+
+class CachingTranscriber(ITranscriber):
+    """
+    Transcriber decorator that caches results on disk by content hash.
+
+    The cache key is SHA-256 of the audio bytes together with language,
+    max_speakers, main_theme and model name, so a re-uploaded file with the
+    same options is answered without running inference. Entries are evicted
+    in least recently used order when entry count or total size exceeds the
+    configured limits.
+    """
+
+    _SUFFIX = ".json"
+    _CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        transcriber: ITranscriber,
+        cache_dir: str,
+        model_name: str = "",
+        max_entries: int | None = None,
+        max_size: int | None = None,
+    ):
+        """
+        Create caching transcriber.
+
+        :param transcriber: Transcriber used on cache miss.
+        :param cache_dir: Directory for cache entries (created if missing).
+        :param model_name: Model name that is part of the cache key, so
+        switching models does not return stale results.
+        :param max_entries: Max number of cached results (defaults None, no limit).
+        :param max_size: Max total size of cached results in bytes
+        (defaults None, no limit).
+        :raise ValueError: If cache_dir is empty or a limit is not positive.
+        """
+
+        if not cache_dir:
+            raise ValueError("Cache directory cannot be empty")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Max entries must be positive")
+        if max_size is not None and max_size < 1:
+            raise ValueError("Max size must be positive")
+
+        self.__transcriber = transcriber
+        self.__cache_dir = cache_dir
+        self.__model_name = model_name
+        self.__max_entries = max_entries
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, int] = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.__load_index()
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    @property
+    def size(self) -> int:
+        """Total size of cached results in bytes."""
+
+        return self.__size
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def transcribe(
+        self,
+        content: bytes,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        content_hash = hashlib.sha256(content).hexdigest()
+        key = self.__key(content_hash, language, max_speakers, main_theme)
+
+        cached = self.__get(key)
+        if cached is not None:
+            return cached
+
+        text, detected_language = self.__transcriber.transcribe(
+            content, language, max_speakers, main_theme
+        )
+        self.__put(key, text, detected_language)
+        return text, detected_language
+
+    def transcribe_file(
+        self,
+        file_path: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(self._CHUNK_SIZE):
+                digest.update(chunk)
+        key = self.__key(digest.hexdigest(), language, max_speakers, main_theme)
+
+        cached = self.__get(key)
+        if cached is not None:
+            return cached
+
+        text, detected_language = self.__transcriber.transcribe_file(
+            file_path, language, max_speakers, main_theme
+        )
+        self.__put(key, text, detected_language)
+        return text, detected_language
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
+            self.__hits = 0
+            self.__misses = 0
+
+    def __key(
+        self,
+        content_hash: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> str:
+        options = [content_hash, language, max_speakers, main_theme, self.__model_name]
+        return hashlib.sha256(json.dumps(options).encode("utf-8")).hexdigest()
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.__cache_dir, key + self._SUFFIX)
+
+    def __get(self, key: str) -> tuple[str, str] | None:
+        with self.__lock:
+            if key not in self.__entries:
+                self.__misses += 1
+                return None
+
+            try:
+                with open(self.__path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                result = entry["text"], entry["language"]
+                os.utime(self.__path(key))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Dropping broken transcription cache entry {key}: {e}")
+                self.__remove(key)
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return result
+
+    def __put(self, key: str, text: str, language: str) -> None:
+        data = json.dumps({"text": text, "language": language}).encode("utf-8")
+        if self.__max_size is not None and len(data) > self.__max_size:
+            return
+
+        path = self.__path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self.__lock:
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except OSError as e:
+                logger.warning(f"Cannot save transcription cache entry {key}: {e}")
+                return
+
+            self.__size -= self.__entries.pop(key, 0)
+            self.__entries[key] = len(data)
+            self.__size += len(data)
+            self.__evict()
+
+    def __evict(self) -> None:
+        while self.__entries and (
+            (
+                self.__max_entries is not None
+                and len(self.__entries) > self.__max_entries
+            )
+            or (self.__max_size is not None and self.__size > self.__max_size)
+        ):
+            self.__remove(next(iter(self.__entries)))
+
+    def __remove(self, key: str) -> None:
+        self.__size -= self.__entries.pop(key, 0)
+        try:
+            os.remove(self.__path(key))
+        except FileNotFoundError:
+            pass
+
+    def __load_index(self) -> None:
+        """Restore LRU order from entry modification times."""
+
+        entries = []
+        for name in os.listdir(self.__cache_dir):
+            if not name.endswith(self._SUFFIX):
+                continue
+            stat = os.stat(os.path.join(self.__cache_dir, name))
+            entries.append((stat.st_mtime, name[: -len(self._SUFFIX)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self.__entries[key] = size
+            self.__size += size
+        self.__evict()
@@ -0,0 +1,188 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+from ...domain.interfaces import ITranscriber
+
+logger = logging.getLogger(__name__)
+
+_worker_transcriber: ITranscriber | None = None
+
+
+def _init_worker(transcriber_factory: Callable[[], ITranscriber]) -> None:
+    """Build the worker's transcriber once, so models stay loaded between jobs."""
+
+    global _worker_transcriber
+    _worker_transcriber = transcriber_factory()
+    logger.info(f"Transcription worker {os.getpid()} loaded models")
+
+
+def _transcribe(
+    content: bytes,
+    language: str | None,
+    max_speakers: int | None,
+    main_theme: str | None,
+) -> tuple[str, str]:
+    return _worker_transcriber.transcribe(content, language, max_speakers, main_theme)
+
+
+def _transcribe_file(
+    file_path: str,
+    language: str | None,
+    max_speakers: int | None,
+    main_theme: str | None,
+) -> tuple[str, str]:
+    return _worker_transcriber.transcribe_file(
+        file_path, language, max_speakers, main_theme
+    )
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class _Worker(object):
+    """Single worker process of a pool with its job counters."""
+
+    def __init__(self, transcriber_factory: Callable[[], ITranscriber]):
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(transcriber_factory,),
+        )
+        self.jobs = 0
+        self.pending = 0
+
+
+class PooledTranscriber(ITranscriber):
+    """
+    Transcriber that dispatches jobs to a pool of worker processes.
+
+    Every worker builds its own transcriber with the given factory when it
+    starts, so Whisper and diarization models are loaded once per process
+    instead of once per job, and concurrent uploads use all CPU cores instead
+    of being serialized behind the GIL.
+    """
+
+    def __init__(
+        self,
+        transcriber_factory: Callable[[], ITranscriber],
+        pool_size: int | None = None,
+        max_jobs_per_worker: int | None = None,
+        preload: bool = True,
+    ):
+        """
+        Create pooled transcriber.
+
+        :param transcriber_factory: Picklable callable that returns an
+        ITranscriber (e.g. functools.partial(Transcriber, token)).
+        :param pool_size: Number of worker processes (defaults CPU count).
+        :param max_jobs_per_worker: Jobs after which a worker is replaced by
+        a fresh one to release leaked memory (defaults None, never). Warm-up
+        is not counted, and the fresh worker loads models right away.
+        :param preload: Start all workers and load models right away.
+        :raise ValueError: If pool_size or max_jobs_per_worker is not positive.
+        """
+
+        pool_size = pool_size or os.cpu_count() or 1
+        if pool_size < 1:
+            raise ValueError("Pool size must be positive")
+        if max_jobs_per_worker is not None and max_jobs_per_worker < 1:
+            raise ValueError("Max jobs per worker must be positive")
+
+        self.__pool_size = pool_size
+        self.__transcriber_factory = transcriber_factory
+        self.__max_jobs_per_worker = max_jobs_per_worker
+        self.__lock = threading.Lock()
+        self.__workers = [_Worker(transcriber_factory) for _ in range(pool_size)]
+
+        if preload:
+            self.warm_up()
+
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    def warm_up(self) -> None:
+        """Start worker processes and wait until their models are loaded."""
+
+        with self.__lock:
+            workers = list(self.__workers)
+        wait([worker.executor.submit(_ping) for worker in workers])
+        logger.info(f"Transcription pool with {self.__pool_size} workers is ready")
+
+    def transcribe(
+        self,
+        content: bytes,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        return self.__run(_transcribe, content, language, max_speakers, main_theme)
+
+    def transcribe_file(
+        self,
+        file_path: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        """Transcribe audio file in a worker, only the path is sent over IPC."""
+
+        return self.__run(
+            _transcribe_file, file_path, language, max_speakers, main_theme
+        )
+
+    def close(self) -> None:
+        """Stop worker processes after running jobs are finished."""
+
+        with self.__lock:
+            workers = list(self.__workers)
+        for worker in workers:
+            worker.executor.shutdown(wait=True)
+
+    def __run(self, fn: Callable, *args, retry: bool = True) -> tuple[str, str]:
+        """
+        Run job on the least busy worker. A worker that reached its job
+        budget is replaced at once, its queued jobs still finish on it.
+
+        A worker whose process died (e.g. killed for memory) is replaced
+        and the job is retried once on another worker.
+
+        :raise BrokenProcessPool: If the worker of the retried job died too.
+        """
+
+        try:
+            with self.__lock:
+                worker = min(self.__workers, key=lambda w: w.pending)
+                future = worker.executor.submit(fn, *args)
+                worker.pending += 1
+                worker.jobs += 1
+                if worker.jobs == self.__max_jobs_per_worker:
+                    self.__replace(worker)
+
+            try:
+                return future.result()
+            finally:
+                with self.__lock:
+                    worker.pending -= 1
+        except BrokenProcessPool:
+            with self.__lock:
+                if worker in self.__workers:
+                    self.__replace(worker)
+            if not retry:
+                raise
+
+            logger.warning("Transcription worker died, retrying job")
+            return self.__run(fn, *args, retry=False)
+
+    def __replace(self, worker: _Worker) -> None:
+        fresh = _Worker(self.__transcriber_factory)
+        fresh.executor.submit(_ping)
+        self.__workers[self.__workers.index(worker)] = fresh
+        worker.executor.shutdown(wait=False)
@@ -0,0 +1,301 @@
+import logging
+import re
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Iterator
+
+import numpy as np
+import soundfile as sf
+
+from ...domain.interfaces import ITranscriber
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PATTERN = re.compile(r"^\[(?P<speaker>[^:\]]+): (?P<start>[\d.]+)\] ?")
+
+
+class SegmentingTranscriber(ITranscriber):
+    """
+    Transcriber decorator that splits long audio into chunks and transcribes
+    them in parallel.
+
+    Chunk boundaries are moved to the quietest frame near every
+    segment_duration mark, so cuts fall into pauses rather than words. Each
+    chunk is extended by overlap seconds on both sides, so speech at a
+    boundary is heard in full by the chunk that owns it. Results are
+    stitched back in order: segment timestamps are shifted by chunk offset
+    and segments starting outside the chunk's own part are dropped as
+    duplicates of the neighbour chunk.
+
+    Speaker labels are assigned by diarization of every chunk separately,
+    so the same label in different chunks does not have to mean the same
+    person.
+
+    Audio is never decoded as a whole: only the search window around every
+    cut mark and then every chunk are read from the file as float32. Audio
+    that is not seekable (e.g. read from a pipe) is read once from start to
+    end instead, buffering samples from the last cut only.
+    """
+
+    _FRAME_DURATION = 0.02
+
+    def __init__(
+        self,
+        transcriber: ITranscriber,
+        segment_duration: float = 300.0,
+        overlap: float = 2.0,
+        search_window: float = 15.0,
+        workers: int = 1,
+    ):
+        """
+        Create segmenting transcriber.
+
+        :param transcriber: Transcriber used for every chunk. To get speedup
+        with workers > 1 it should be able to run jobs in parallel (e.g.
+        PooledTranscriber).
+        :param segment_duration: Target chunk length in seconds.
+        :param overlap: Seconds added to both sides of every chunk.
+        :param search_window: Seconds around every cut mark to look for silence.
+        :param workers: Number of chunks transcribed at the same time.
+        :raise ValueError: If durations are invalid or workers is not positive.
+        """
+
+        if segment_duration <= 0:
+            raise ValueError("Segment duration must be positive")
+        if overlap < 0 or search_window < 0:
+            raise ValueError("Overlap and search window cannot be negative")
+        if overlap * 2 >= segment_duration or search_window * 2 >= segment_duration:
+            raise ValueError("Overlap and search window must be less than half segment")
+        if workers < 1:
+            raise ValueError("Workers must be positive")
+
+        self.__transcriber = transcriber
+        self.__segment_duration = segment_duration
+        self.__overlap = overlap
+        self.__search_window = search_window
+        self.__workers = workers
+
+    def transcribe(
+        self,
+        content: bytes,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        info = sf.info(BytesIO(content))
+        if info.duration <= self.__max_single_duration():
+            return self.__transcriber.transcribe(
+                content, language, max_speakers, main_theme
+            )
+
+        with sf.SoundFile(BytesIO(content)) as audio:
+            return self.__transcribe_audio(audio, language, max_speakers, main_theme)
+
+    def transcribe_file(
+        self,
+        file_path: str,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        info = sf.info(file_path)
+        if info.duration <= self.__max_single_duration():
+            return self.__transcriber.transcribe_file(
+                file_path, language, max_speakers, main_theme
+            )
+
+        with sf.SoundFile(file_path) as audio:
+            return self.__transcribe_audio(audio, language, max_speakers, main_theme)
+
+    def split(self, audio: sf.SoundFile) -> list[tuple[int, int]]:
+        """
+        Find chunk cut points of audio.
+
+        Only the search window around every cut mark is read from audio.
+
+        :param audio: Open audio file.
+        :return: Sample ranges (start, end) of chunks without overlap.
+        """
+
+        sample_rate = audio.samplerate
+        total = audio.frames
+        segment = int(self.__segment_duration * sample_rate)
+        window = int(self.__search_window * sample_rate)
+        frame = max(1, int(self._FRAME_DURATION * sample_rate))
+
+        cuts = [0]
+        while total - cuts[-1] > segment + window:
+            mark = cuts[-1] + segment
+            cuts.append(
+                self.__quietest_point(audio, mark - window, mark + window, frame)
+            )
+        cuts.append(total)
+
+        return list(zip(cuts[:-1], cuts[1:]))
+
+    def read_chunks(
+        self, audio: sf.SoundFile
+    ) -> Iterator[tuple[tuple[int, int], np.ndarray]]:
+        """
+        Read chunks of audio cut as by split. Audio that is not seekable is
+        read sequentially, so neither seeking nor its frame count is needed.
+
+        :param audio: Open audio file.
+        :return: Sample range (start, end) of every chunk without overlap
+        and its float32 samples with overlap.
+        """
+
+        if audio.seekable():
+            return self.__seek_chunks(audio)
+
+        logger.info("Audio is not seekable, reading it sequentially")
+        return self.__stream_chunks(audio)
+
+    def __max_single_duration(self) -> float:
+        return self.__segment_duration + self.__search_window
+
+    def __transcribe_audio(
+        self,
+        audio: sf.SoundFile,
+        language: str | None,
+        max_speakers: int | None,
+        main_theme: str | None,
+    ) -> tuple[str, str]:
+        sample_rate = audio.samplerate
+        overlap = int(self.__overlap * sample_rate)
+
+        def transcribe_chunk(samples: np.ndarray) -> tuple[str, str]:
+            stream = BytesIO()
+            sf.write(stream, samples, sample_rate, format="WAV")
+            return self.__transcriber.transcribe(
+                stream.getvalue(), language, max_speakers, main_theme
+            )
+
+        # Chunks are read ahead of transcription by at most one per worker
+        chunks, results, pending = [], [], deque()
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            for bounds, samples in self.read_chunks(audio):
+                if len(pending) == self.__workers:
+                    results.append(pending.popleft().result())
+                chunks.append(bounds)
+                pending.append(executor.submit(transcribe_chunk, samples))
+            results.extend(future.result() for future in pending)
+        logger.info(f"Transcribed audio in {len(chunks)} chunks")
+
+        texts = []
+        for (chunk_start, chunk_end), (text, _) in zip(chunks, results):
+            offset = max(0, chunk_start - overlap) / sample_rate
+            texts.extend(
+                self.__shift_segments(
+                    text, offset, chunk_start / sample_rate, chunk_end / sample_rate
+                )
+            )
+
+        languages = Counter(chunk_language for _, chunk_language in results)
+        return "\n\n".join(texts), languages.most_common(1)[0][0]
+
+    def __seek_chunks(
+        self, audio: sf.SoundFile
+    ) -> Iterator[tuple[tuple[int, int], np.ndarray]]:
+        overlap = int(self.__overlap * audio.samplerate)
+        for own_start, own_end in self.split(audio):
+            start = max(0, own_start - overlap)
+            end = min(audio.frames, own_end + overlap)
+            audio.seek(start)
+            samples = audio.read(end - start, dtype="float32", always_2d=True)
+            yield (own_start, own_end), samples
+
+    def __stream_chunks(
+        self, audio: sf.SoundFile
+    ) -> Iterator[tuple[tuple[int, int], np.ndarray]]:
+        """
+        Read chunks from start to end of audio. Cut points are found as by
+        split, in samples buffered since the overlap before the last chunk
+        that is not read yet.
+        """
+
+        sample_rate = audio.samplerate
+        segment = int(self.__segment_duration * sample_rate)
+        window = int(self.__search_window * sample_rate)
+        overlap = int(self.__overlap * sample_rate)
+        frame = max(1, int(self._FRAME_DURATION * sample_rate))
+
+        buffer = np.empty((0, audio.channels), dtype="float32")
+        offset = 0  # sample index of buffer start
+        cuts = [0]  # cuts from start of the next chunk to yield
+        while True:
+            block = audio.read(segment, dtype="float32", always_2d=True)
+            buffer = np.concatenate((buffer, block))
+            total = offset + len(buffer)
+
+            while total - cuts[-1] > segment + window:
+                mark = cuts[-1] + segment
+                region = buffer[mark - window - offset : mark + window - offset]
+                cuts.append(mark - window + self.__quietest_frame(region, frame))
+            if not len(block):
+                cuts.append(total)
+
+            while len(cuts) > 1 and (not len(block) or total >= cuts[1] + overlap):
+                start = max(0, cuts[0] - overlap)
+                end = min(total, cuts[1] + overlap)
+                yield (cuts[0], cuts[1]), buffer[start - offset : end - offset]
+                cuts.pop(0)
+                start = max(0, cuts[0] - overlap)
+                buffer = buffer[start - offset :]
+                offset = start
+
+            if not len(block):
+                return
+
+    def __quietest_point(
+        self, audio: sf.SoundFile, start: int, end: int, frame: int
+    ) -> int:
+        """Return start of the frame with the lowest RMS in [start, end)."""
+
+        audio.seek(start)
+        region = audio.read(end - start, dtype="float32", always_2d=True)
+        return start + self.__quietest_frame(region, frame)
+
+    @staticmethod
+    def __quietest_frame(region: np.ndarray, frame: int) -> int:
+        """Return offset of the frame with the lowest RMS in region samples."""
+
+        region = region.mean(axis=1)
+        frames = len(region) // frame
+        if frames == 0:
+            return 0
+
+        energy = np.sqrt(
+            np.mean(np.square(region[: frames * frame].reshape(frames, frame)), axis=1)
+        )
+        return int(np.argmin(energy)) * frame
+
+    @staticmethod
+    def __shift_segments(
+        text: str, offset: float, own_start: float, own_end: float
+    ) -> list[str]:
+        """
+        Shift segment timestamps of chunk text by offset and keep only
+        segments that start inside [own_start, own_end).
+        """
+
+        segments = []
+        for block in text.split("\n\n"):
+            block = block.strip()
+            if not block:
+                continue
+
+            match = _SEGMENT_PATTERN.match(block)
+            if not match:
+                segments.append(block)
+                continue
+
+            start = float(match.group("start")) + offset
+            if not own_start <= start < own_end:
+                continue
+
+            body = block[match.end() :]
+            segments.append(f"[{match.group('speaker')}: {round(start, 3)}] {body}")
+
+        return segments
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.views import View
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
@@ -13,8 +14,7 @@ class UsersView(LoginRequiredMixin, View):
     def get(self, request):
         if not request.user.can_block():
             return render(request, "admin_panel/access_denied.html")
-        users = container.user_service.get_all()
-        return render(request, self.template_name, {"users": users})
+        return self._render(request)
 
     def post(self, request):
         if not request.user.can_block():
@@ -30,12 +30,35 @@ class UsersView(LoginRequiredMixin, View):
             elif action == "delete":
                 container.user_service.delete(request.user, target_email)
         except (PermissionError, KeyError) as e:
-            users = container.user_service.get_all()
-            return render(
-                request, self.template_name, {"users": users, "error": str(e)}
-            )
+            return self._render(request, str(e))
 
-        return redirect(reverse_lazy("admin_users"))
+        return redirect(request.get_full_path())
+
+    def _render(self, request, error: str | None = None):
+        """Render one page of users, filtered by query parameters."""
+
+        status = request.GET.get("status", "")
+        email_prefix = request.GET.get("email", "").strip()
+        after = request.GET.get("after") or None
+        users, next_after = container.user_service.get_users_page(
+            settings.USERS_PAGE_SIZE,
+            after,
+            {"blocked": True, "active": False}.get(status),
+            email_prefix or None,
+        )
+
+        return render(
+            request,
+            self.template_name,
+            {
+                "users": users,
+                "error": error,
+                "status": status,
+                "email_prefix": email_prefix,
+                "next_after": next_after,
+                "is_first_page": not after,
+            },
+        )
 
 
 class CreateAdminView(LoginRequiredMixin, View):
@@ -1,9 +1,12 @@
 from django import forms
+from django.conf import settings
 from django.core.validators import MinValueValidator
 
 
 class AudioUploadForm(forms.Form):
-    file = forms.FileField(label="Аудиофайл (до 10 МБ, mp3)")
+    file = forms.FileField(
+        label=f"Аудиофайл (до {settings.AUDIO_MAX_UPLOAD_SIZE // (1024 * 1024)} МБ, mp3)"
+    )
     language = forms.CharField(
         required=False,
         label="Язык (на английском). Желательно.",
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from transcriber_service.infrastructure import (
+    MongoAudioRepository,
+    MongoStorageRepository,
+    MongoUserRepository,
+)
+from transcriber_web.services import create_mongo_connection, create_serializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Create MongoDB indexes and backfill query fields of audio records. "
+        "Must be run before the first start and after updates, safe to repeat."
+    )
+
+    def handle(self, *args, **options):
+        connection = create_mongo_connection()
+        serializer = create_serializer()
+        storage_repository = MongoStorageRepository(serializer, connection)
+        repositories = (
+            MongoUserRepository(serializer, connection),
+            storage_repository,
+            MongoAudioRepository(storage_repository, serializer, connection),
+        )
+
+        try:
+            for repository in repositories:
+                repository.ensure_indexes()
+                self.stdout.write(f"{type(repository).__name__}: indexes are ready")
+        finally:
+            connection.close()
+
+        self.stdout.write(self.style.SUCCESS("Mongo migration is complete"))
@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from transcriber_service.application import TextIndexService
+from transcriber_service.infrastructure import (
+    LocalFullTextIndex,
+    MongoAudioRepository,
+    MongoStorageRepository,
+    MongoUserRepository,
+)
+from transcriber_web.services import (
+    create_mongo_connection,
+    create_serializer,
+    create_text_compressor,
+    create_transcript_store,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the full-text index from transcripts of all audio records, "
+        "e.g. records transcribed before the index was added. The index is "
+        "open in one process only, so stop the web server first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        connection = create_mongo_connection()
+        compressor = create_text_compressor()
+        serializer = create_serializer(compressor)
+        user_repository = MongoUserRepository(serializer, connection)
+        storage_repository = MongoStorageRepository(serializer, connection)
+        audio_repository = MongoAudioRepository(
+            storage_repository,
+            serializer,
+            connection,
+            transcripts=create_transcript_store(connection, compressor),
+        )
+
+        def storage_ids():
+            for user in user_repository.iter_users():
+                try:
+                    yield storage_repository.get_by_user(user.id).id
+                except ValueError:
+                    continue  # user without storage
+
+        text_index = LocalFullTextIndex(settings.FULL_TEXT_INDEX_DIR)
+        try:
+            count = TextIndexService(audio_repository, text_index).rebuild(
+                storage_ids(), options["page_size"]
+            )
+        finally:
+            text_index.close()
+            connection.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Full-text index is rebuilt with {count} transcripts")
+        )
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from transcriber_service.infrastructure.repositories.stored_text import sample_texts
+from transcriber_web.services import (
+    create_mongo_connection,
+    create_serializer,
+    create_text_compressor,
+    create_transcript_store,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Train transcript compression dictionaries per language on a sample "
+        "of stored transcripts. New records are compressed with them, "
+        "records written before keep their dictionaries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=500)
+        parser.add_argument("--size", type=int, default=32768)
+        parser.add_argument("--collection", default="audio_records")
+        parser.add_argument("--transcripts", default="audio_transcripts")
+
+    def handle(self, *args, **options):
+        connection = create_mongo_connection()
+        compressor = create_text_compressor()
+        serializer = create_serializer(compressor)
+        collection = connection.collection(options["collection"])
+        store = create_transcript_store(connection, compressor, options["transcripts"])
+
+        try:
+            for language in collection.distinct("language"):
+                documents = collection.aggregate(
+                    [
+                        {"$match": {"language": language}},
+                        {"$sample": {"size": options["samples"]}},
+                        {"$project": {"data": 1}},
+                    ]
+                )
+                samples = sample_texts(
+                    (serializer.deserialize(doc["data"]) for doc in documents), store
+                )
+                if not samples:
+                    continue
+
+                dictionary_id = compressor.train(language, samples, options["size"])
+                self.stdout.write(
+                    f"{language or 'unknown'}: dictionary {dictionary_id:08x} "
+                    f"trained on {len(samples)} transcripts"
+                )
+        finally:
+            connection.close()
+
+        self.stdout.write(self.style.SUCCESS("Dictionaries are trained"))
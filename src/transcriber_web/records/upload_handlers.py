@@ -0,0 +1,33 @@
+import logging
+
+from django.conf import settings
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingAudioUploadHandler(TemporaryFileUploadHandler):
+    """
+    Upload handler that streams every chunk straight to a temporary file on
+    disk, counting its size on the way.
+
+    Uploads larger than AUDIO_MAX_UPLOAD_SIZE are stopped as soon as the limit
+    is crossed and the rest of the request body is not read, so oversize
+    files are never fully received or stored. The connection is reset then,
+    so the client may see it instead of the error page. Rejected requests
+    are marked with ``audio_upload_too_large`` attribute.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.AUDIO_MAX_UPLOAD_SIZE:
+            logger.warning(f"Upload {self.file_name} rejected: file too large")
+            self.file.close()
+            self.request.audio_upload_too_large = True
+            raise StopUpload(connection_reset=True)
+
+        return super().receive_data_chunk(raw_data, start)
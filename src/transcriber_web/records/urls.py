@@ -5,4 +5,9 @@ urlpatterns = [
     path("upload/", views.AudioUploadView.as_view(), name="upload"),
     path("", views.RecordListView.as_view(), name="record_list"),
     path("<str:record_id>/", views.RecordDetailView.as_view(), name="record_detail"),
+    path(
+        "<str:record_id>/status/",
+        views.RecordStatusView.as_view(),
+        name="record_status",
+    ),
 ]
@@ -1,9 +1,10 @@
+import logging
 import os
 
 from accounts.utils import LoginRequiredMixin
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
-from django.http import FileResponse
+from django.http import FileResponse, JsonResponse
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
 from django.views import View
@@ -11,6 +12,7 @@ from transcriber_web.services import ServiceContainer
 
 from .forms import AudioUploadForm
 
+logger = logging.getLogger(__name__)
 container = ServiceContainer()
 
 
@@ -24,23 +26,22 @@ class AudioUploadView(LoginRequiredMixin, View):
 
     def post(self, request):
         form = self.form_class(request.POST, request.FILES)
+        if getattr(request, "audio_upload_too_large", False):
+            form.add_error("file", "Файл слишком большой")
 
         if form.is_valid():
             file = request.FILES["file"]
             fs = FileSystemStorage(location=os.path.join(settings.MEDIA_ROOT, "audio"))
             filename = fs.save(file.name, file)
             file_path = fs.path(filename)
+            logger.info(f"Saved upload {filename} ({file.size} bytes)")
 
             storage = container.storage_service.get_user_storage(request.user.id)
             if not storage:
                 storage = container.storage_service.create_storage(request.user.id)
 
-            with open(file_path, "rb") as f:
-                content = f.read()
-
-            container.audio_record_service.create_audio(
+            container.audio_record_service.create_audio_from_file(
                 file_name=file.name,
-                content=content,
                 file_path=file_path,
                 storage_id=storage.id,
                 language=form.cleaned_data["language"],
@@ -60,9 +61,15 @@ class RecordListView(LoginRequiredMixin, View):
         tags = request.GET.get("tags", "").strip()
         match_all = request.GET.get("match_all") == "on"
         name = request.GET.get("name", "").strip()
+        text = request.GET.get("text", "").strip()
 
+        next_cursor = None
         if storage:
-            if tags:
+            if text:
+                records = container.audio_record_service.search_by_text(
+                    storage.id, text
+                )
+            elif tags:
                 tags = tags.split(",")
                 records = container.audio_record_service.search_by_tags(
                     storage.id, tags, match_all
@@ -72,11 +79,45 @@ class RecordListView(LoginRequiredMixin, View):
                     storage.id, name
                 )
             else:
-                records = container.audio_record_service.get_records(storage.id)
+                try:
+                    records, next_cursor = (
+                        container.audio_record_service.get_summaries_page(
+                            storage.id,
+                            settings.RECORDS_PAGE_SIZE,
+                            request.GET.get("cursor") or None,
+                        )
+                    )
+                except ValueError:
+                    return redirect("record_list")
         else:
             records = []
 
-        return render(request, self.template_name, {"records": records})
+        return render(
+            request,
+            self.template_name,
+            {
+                "records": records,
+                "search_text": text,
+                "next_cursor": next_cursor,
+                "is_first_page": not request.GET.get("cursor"),
+            },
+        )
+
+
+class RecordStatusView(LoginRequiredMixin, View):
+    def get(self, request, record_id):
+        storage = container.storage_service.get_user_storage(request.user.id)
+        try:
+            record = container.audio_record_service.get_by_id(record_id)
+        except ValueError:
+            record = None
+
+        if not record or not storage or record.storage_id != storage.id:
+            return JsonResponse(
+                {"error": "Запись не найдена или недоступна"}, status=404
+            )
+
+        return JsonResponse({"id": record.id, "status": record.status})
 
 
 class RecordDetailView(LoginRequiredMixin, View):
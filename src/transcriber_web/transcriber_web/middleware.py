@@ -0,0 +1,12 @@
+from .services import ServiceContainer
+
+
+class UnitOfWorkMiddleware(object):
+    """Flush repository writes of one request together when it is handled."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with ServiceContainer().unit_of_work:
+            return self.get_response(request)
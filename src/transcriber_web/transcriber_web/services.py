@@ -2,12 +2,22 @@ from transcriber_service.infrastructure import (
     MongoUserRepository,
     MongoStorageRepository,
     MongoAudioRepository,
+    MongoConnectionProvider,
+    MongoTranscriptStore,
     JsonSerializer,
+    RecordFormatSerializer,
+    TextCompressor,
     PasswordManager,
     EmailService,
     Transcriber,
+    PooledTranscriber,
+    CachingTranscriber,
+    SegmentingTranscriber,
     StopwordsRemover,
     TextExporter,
+    SqliteTranscriptionQueue,
+    LocalFullTextIndex,
+    TranscriptionWorkerPool,
 )
 from transcriber_service.application import (
     UserService,
@@ -16,15 +26,82 @@ from transcriber_service.application import (
     AuthService,
     AudioTagService,
     AudioTextService,
-    SerializerAdapter,
+    TranscriptionJobService,
+    UnitOfWork,
+    FastSerializerAdapter,
     EntityMapperFactory,
 )
 from . import settings
+from functools import partial
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def create_text_compressor() -> TextCompressor:
+    """Create compressor of stored transcripts configured by settings."""
+
+    return TextCompressor(
+        threshold=settings.TRANSCRIPT_COMPRESSION_THRESHOLD or None,
+        level=settings.TRANSCRIPT_COMPRESSION_LEVEL,
+        dictionary_dir=settings.TRANSCRIPT_DICTIONARY_DIR,
+        algorithm=settings.TRANSCRIPT_COMPRESSION_ALGORITHM,
+    )
+
+
+def create_serializer(
+    compressor: TextCompressor | None = None,
+) -> FastSerializerAdapter:
+    """
+    Create serializer of stored entities. Data written as JSON before
+    the record format was introduced is still read.
+
+    :param compressor: Compressor of transcripts, created by settings if None.
+    """
+
+    return FastSerializerAdapter(
+        RecordFormatSerializer(
+            legacy=JsonSerializer(),
+            compressor=compressor or create_text_compressor(),
+        ),
+        EntityMapperFactory(),
+    )
+
+
+def create_mongo_connection() -> MongoConnectionProvider:
+    """Create Mongo connection configured by settings."""
+
+    return MongoConnectionProvider(
+        settings.MONGO_URI,
+        settings.MONGO_DATABASE,
+        max_pool_size=settings.MONGO_MAX_POOL_SIZE,
+        min_pool_size=settings.MONGO_MIN_POOL_SIZE,
+        connect_timeout_ms=settings.MONGO_CONNECT_TIMEOUT_MS,
+        server_selection_timeout_ms=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        socket_timeout_ms=settings.MONGO_SOCKET_TIMEOUT_MS,
+        read_preference=settings.MONGO_READ_PREFERENCE,
+        compressors=settings.MONGO_COMPRESSORS,
+    )
+
+
+def create_transcript_store(
+    connection: MongoConnectionProvider,
+    compressor: TextCompressor | None = None,
+    collection_name: str = "audio_transcripts",
+) -> MongoTranscriptStore:
+    """
+    Create store of transcripts kept apart from audio record documents.
+
+    :param connection: Shared Mongo connection.
+    :param compressor: Compressor of transcripts, created by settings if None.
+    :param collection_name: Collection of transcripts.
+    """
+
+    return MongoTranscriptStore(
+        connection, collection_name, compressor or create_text_compressor()
+    )
+
+
 class ServiceContainer(object):
     _instance = None
 
@@ -38,27 +115,27 @@ class ServiceContainer(object):
         logger.info("Initializing service container")
         # Serializers
 
-        base_serializer = JsonSerializer()
-        entity_mapper_factory = EntityMapperFactory()
-        serializer = SerializerAdapter(base_serializer, entity_mapper_factory)
+        compressor = create_text_compressor()
+        serializer = create_serializer(compressor)
 
         logger.info("Create serializers")
 
         # Repositories
 
-        self.user_repository = MongoUserRepository(
-            serializer, settings.MONGO_URI, settings.MONGO_DATABASE
-        )
+        self.mongo_connection = create_mongo_connection()
+        self.user_repository = MongoUserRepository(serializer, self.mongo_connection)
         self.storage_repository = MongoStorageRepository(
-            serializer, settings.MONGO_URI, settings.MONGO_DATABASE
+            serializer, self.mongo_connection
         )
         self.audio_repository = MongoAudioRepository(
             self.storage_repository,
             serializer,
-            settings.MONGO_URI,
-            settings.MONGO_DATABASE,
+            self.mongo_connection,
+            transcripts=create_transcript_store(self.mongo_connection, compressor),
         )
 
+        self.unit_of_work = UnitOfWork(self.audio_repository, self.storage_repository)
+
         logger.info("Create repositories")
 
         # Infrastructure services
@@ -70,7 +147,32 @@ class ServiceContainer(object):
             settings.SENDER_EMAIL,
             settings.SENDER_PASSWORD,
         )
-        transcriber = Transcriber(settings.PYANNOTE_TOKEN)
+        if settings.TRANSCRIBER_POOL_SIZE:
+            transcriber = PooledTranscriber(
+                partial(Transcriber, settings.PYANNOTE_TOKEN, settings.WHISPER_MODEL),
+                settings.TRANSCRIBER_POOL_SIZE,
+                settings.TRANSCRIBER_MAX_JOBS_PER_WORKER,
+            )
+        else:
+            transcriber = Transcriber(settings.PYANNOTE_TOKEN, settings.WHISPER_MODEL)
+        if settings.TRANSCRIPTION_SEGMENT_DURATION:
+            transcriber = SegmentingTranscriber(
+                transcriber,
+                settings.TRANSCRIPTION_SEGMENT_DURATION,
+                settings.TRANSCRIPTION_SEGMENT_OVERLAP,
+                workers=max(1, settings.TRANSCRIBER_POOL_SIZE),
+            )
+        if settings.TRANSCRIPTION_CACHE_MAX_SIZE:
+            transcriber = CachingTranscriber(
+                transcriber,
+                settings.TRANSCRIPTION_CACHE_DIR,
+                settings.WHISPER_MODEL,
+                max_size=settings.TRANSCRIPTION_CACHE_MAX_SIZE,
+            )
+        transcription_queue = SqliteTranscriptionQueue(
+            settings.TRANSCRIPTION_QUEUE_PATH
+        )
+        text_index = LocalFullTextIndex(settings.FULL_TEXT_INDEX_DIR)
         stopwords_remover = StopwordsRemover()
         text_exporter = TextExporter()
 
@@ -84,13 +186,32 @@ class ServiceContainer(object):
             self.user_service, email_service, password_manager
         )
         self.audio_record_service = AudioRecordService(
-            self.audio_repository, transcriber
+            self.audio_repository,
+            transcriber,
+            transcription_queue,
+            settings.AUDIO_MAX_UPLOAD_SIZE,
+            text_index,
+        )
+        self.transcription_job_service = TranscriptionJobService(
+            self.audio_repository, transcriber, text_index
         )
         self.audio_tag_service = AudioTagService(self.audio_repository)
         self.audio_text_service = AudioTextService(
-            self.audio_repository, text_exporter, stopwords_remover
+            self.audio_repository, text_exporter, stopwords_remover, text_index
         )
 
         logger.info("Create application services")
 
+        # Background workers
+
+        self.transcription_worker_pool = TranscriptionWorkerPool(
+            transcription_queue,
+            self.transcription_job_service.process,
+            settings.TRANSCRIPTION_WORKERS,
+            on_expired=self.transcription_job_service.fail,
+        )
+        self.transcription_worker_pool.start()
+
+        logger.info("Start transcription workers")
+
         logger.info("Initialized service container")
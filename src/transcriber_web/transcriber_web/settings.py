@@ -55,6 +55,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "transcriber_web.middleware.UnitOfWorkMiddleware",
 ]
 
 ROOT_URLCONF = "transcriber_web.urls"
@@ -92,6 +93,27 @@ DATABASES = {
 MONGO_URI = os.getenv("MONGO_URI")
 MONGO_DATABASE = os.getenv("MONGO_DATABASE")
 
+# Mongo connection pool shared by all repositories (timeouts in milliseconds,
+# compressors are comma separated, e.g. "zstd,snappy,zlib")
+
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 0))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 20000))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 30000)
+)
+MONGO_SOCKET_TIMEOUT_MS = (
+    int(os.getenv("MONGO_SOCKET_TIMEOUT_MS"))
+    if os.getenv("MONGO_SOCKET_TIMEOUT_MS")
+    else None
+)
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+MONGO_COMPRESSORS = [
+    compressor
+    for compressor in os.getenv("MONGO_COMPRESSORS", "").split(",")
+    if compressor
+]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -114,6 +136,74 @@ AUTH_PASSWORD_VALIDATORS = [
 # Hugging face
 
 PYANNOTE_TOKEN = os.getenv("PYANNOTE_TOKEN")
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "medium")
+
+# Transcriber process pool (0 keeps models in the web process)
+
+TRANSCRIBER_POOL_SIZE = int(os.getenv("TRANSCRIBER_POOL_SIZE", 0))
+TRANSCRIBER_MAX_JOBS_PER_WORKER = (
+    int(os.getenv("TRANSCRIBER_MAX_JOBS_PER_WORKER"))
+    if os.getenv("TRANSCRIBER_MAX_JOBS_PER_WORKER")
+    else None
+)
+
+# Long audio is split at pauses into chunks of this many seconds and chunks
+# are transcribed in parallel (0 transcribes whole file at once)
+
+TRANSCRIPTION_SEGMENT_DURATION = float(os.getenv("TRANSCRIPTION_SEGMENT_DURATION", 300))
+TRANSCRIPTION_SEGMENT_OVERLAP = float(os.getenv("TRANSCRIPTION_SEGMENT_OVERLAP", 2))
+
+# Transcription cache (max size in bytes, 0 disables the cache)
+
+TRANSCRIPTION_CACHE_DIR = os.getenv(
+    "TRANSCRIPTION_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "transcription_cache"),
+)
+TRANSCRIPTION_CACHE_MAX_SIZE = int(
+    os.getenv("TRANSCRIPTION_CACHE_MAX_SIZE", 512 * 1024 * 1024)
+)
+
+# Number of records on one page of record list
+
+RECORDS_PAGE_SIZE = int(os.getenv("RECORDS_PAGE_SIZE", 20))
+
+# Number of users on one page of admin user list
+
+USERS_PAGE_SIZE = int(os.getenv("USERS_PAGE_SIZE", 50))
+
+# Compression of stored transcripts (texts shorter than threshold in bytes
+# are kept raw, 0 disables compression), with dictionaries per language
+
+TRANSCRIPT_COMPRESSION_THRESHOLD = int(
+    os.getenv("TRANSCRIPT_COMPRESSION_THRESHOLD", 1024)
+)
+TRANSCRIPT_COMPRESSION_LEVEL = int(os.getenv("TRANSCRIPT_COMPRESSION_LEVEL", 6))
+TRANSCRIPT_COMPRESSION_ALGORITHM = os.getenv("TRANSCRIPT_COMPRESSION_ALGORITHM")
+TRANSCRIPT_DICTIONARY_DIR = os.getenv(
+    "TRANSCRIPT_DICTIONARY_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "transcript_dictionaries"),
+)
+
+# Full-text search index over transcripts. It is kept in memory of one
+# process and its directory is locked, so the web server must run as a single
+# process (threads are fine). Fill it with `manage.py rebuild_text_index`.
+
+FULL_TEXT_INDEX_DIR = os.getenv(
+    "FULL_TEXT_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "full_text_index"),
+)
+
+# Transcription queue
+
+TRANSCRIPTION_QUEUE_PATH = os.getenv(
+    "TRANSCRIPTION_QUEUE_PATH",
+    os.path.join(
+        os.path.dirname(os.path.dirname(BASE_DIR)), "transcription_jobs.sqlite3"
+    ),
+)
+TRANSCRIPTION_WORKERS = int(
+    os.getenv("TRANSCRIPTION_WORKERS", max(1, TRANSCRIBER_POOL_SIZE))
+)
 
 # Email service
 
@@ -144,6 +234,16 @@ STATIC_URL = "static/"
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "media")
 
+# Audio uploads are streamed to disk and rejected once they exceed the limit
+
+AUDIO_MAX_UPLOAD_SIZE = int(
+    os.getenv(
+        "AUDIO_MAX_UPLOAD_SIZE",
+        (100 if TRANSCRIPTION_SEGMENT_DURATION else 10) * 1024 * 1024,
+    )
+)
+FILE_UPLOAD_HANDLERS = ["records.upload_handlers.StreamingAudioUploadHandler"]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 